@@ -59,6 +59,7 @@ GOOGLE_CSE_MAX_QUERIES = env_int("GOOGLE_CSE_MAX_QUERIES", 6)
 GOOGLE_CSE_QUICK_MAX_QUERIES = env_int("GOOGLE_CSE_QUICK_MAX_QUERIES", 2)
 GOOGLE_CSE_RESULTS_PER_QUERY = env_int("GOOGLE_CSE_RESULTS_PER_QUERY", 10)
 GOOGLE_CSE_REQUEST_TIMEOUT = env_int("GOOGLE_CSE_REQUEST_TIMEOUT", 20)
+GOOGLE_CSE_QUOTA_COOLDOWN_SECONDS = env_int("GOOGLE_CSE_QUOTA_COOLDOWN_SECONDS", 3600)
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
 YOUTUBE_MAX_QUERIES = env_int("YOUTUBE_MAX_QUERIES", 4)
 GDELT_ENABLED = env_bool("GDELT_ENABLED", default=True)
@@ -77,13 +78,37 @@ DISCOVERY_PROFILE_NEW_SOURCES = env_int("DISCOVERY_PROFILE_NEW_SOURCES", 5)
 DISCOVERY_MIN_INTERVAL_HOURS = env_int("DISCOVERY_MIN_INTERVAL_HOURS", 24)
 SITEMAP_MAX_CHILDREN = env_int("SITEMAP_MAX_CHILDREN", 3)
 SITEMAP_MAX_ARTICLES = env_int("SITEMAP_MAX_ARTICLES", 30)
+SITEMAP_STALE_STREAK = env_int("SITEMAP_STALE_STREAK", 50)
+SITEMAP_MAX_BYTES = env_int("SITEMAP_MAX_BYTES", 50 * 1024 * 1024)
+SIMHASH_MAX_DISTANCE = env_int("SIMHASH_MAX_DISTANCE", 3)
+HTTP_POOL_CONNECTIONS = env_int("HTTP_POOL_CONNECTIONS", 50)
+HTTP_POOL_MAXSIZE = env_int("HTTP_POOL_MAXSIZE", 20)
+HTTP_MAX_PER_HOST = env_int("HTTP_MAX_PER_HOST", 6)
+HTTP_DEFAULT_TIMEOUT = env_int("HTTP_DEFAULT_TIMEOUT", 20)
+HTTP_MAX_RESPONSE_BYTES = env_int("HTTP_MAX_RESPONSE_BYTES", 10 * 1024 * 1024)
+FETCH_ASYNC_CONCURRENCY = env_int("FETCH_ASYNC_CONCURRENCY", 32)
+FETCH_ASYNC_QUEUE_SIZE = env_int("FETCH_ASYNC_QUEUE_SIZE", 500)
+POLITENESS_HOST_REQUESTS_PER_MINUTE = env_int("POLITENESS_HOST_REQUESTS_PER_MINUTE", 120)
+POLITENESS_HOST_BURST = env_int("POLITENESS_HOST_BURST", 10)
+POLITENESS_MAX_WAIT_SECONDS = env_int("POLITENESS_MAX_WAIT_SECONDS", 30)
+GOOGLE_RSS_REQUESTS_PER_MINUTE = env_int("GOOGLE_RSS_REQUESTS_PER_MINUTE", 240)
+GOOGLE_RSS_BURST = env_int("GOOGLE_RSS_BURST", 20)
 VALIDATION_LEARNING_ENABLED = env_bool("VALIDATION_LEARNING_ENABLED", default=True)
 VALIDATION_LEARNING_MIN_ACCEPTED = env_int("VALIDATION_LEARNING_MIN_ACCEPTED", 3)
 VALIDATION_LEARNING_MIN_REJECTED = env_int("VALIDATION_LEARNING_MIN_REJECTED", 3)
 VALIDATION_LEARNING_MIN_FEATURE_OCCURRENCES = env_int("VALIDATION_LEARNING_MIN_FEATURE_OCCURRENCES", 2)
 VALIDATION_LEARNING_MAX_ADJUSTMENT = env_int("VALIDATION_LEARNING_MAX_ADJUSTMENT", 12)
-VALIDATION_LEARNING_MAX_FEEDBACK = env_int("VALIDATION_LEARNING_MAX_FEEDBACK", 500)
 VALIDATION_LEARNING_CACHE_SECONDS = env_int("VALIDATION_LEARNING_CACHE_SECONDS", 300)
+REVALIDATION_AUTO_ENQUEUE = env_bool("REVALIDATION_AUTO_ENQUEUE", default=True)
+REVALIDATION_CHUNK_SIZE = env_int("REVALIDATION_CHUNK_SIZE", 500)
+# Job "running" sem progresso ha mais que isso foi derrubado (timeout do django-q)
+# e volta para a fila ao agendar a proxima revalidacao do cliente.
+REVALIDATION_STALE_SECONDS = env_int("REVALIDATION_STALE_SECONDS", env_int("Q_CLUSTER_TIMEOUT", 1800))
+LEARNING_RESCORE_MIN_SCORE_CHANGE = env_int("LEARNING_RESCORE_MIN_SCORE_CHANGE", 1)
+SIMULATION_CONTENT_CHARS = env_int("SIMULATION_CONTENT_CHARS", 1000)
+SIMULATION_CACHE_SECONDS = env_int("SIMULATION_CACHE_SECONDS", 300)
+PROFILE_CACHE_SECONDS = env_int("PROFILE_CACHE_SECONDS", 86400)
+PROFILE_CACHE_REDIS_URL = os.getenv("PROFILE_CACHE_REDIS_URL", "")
 USE_LLM_SEARCH = env_bool("USE_LLM_SEARCH", default=False)
 GPTNEO_MODEL = os.getenv("GPTNEO_MODEL", "EleutherAI/gpt-neo-2.7B")
 
@@ -195,6 +220,25 @@ MEDIA_URL = "/media/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Perfis compilados dos clientes (matchers e pesos do aprendizado) sao
+# compartilhados entre os workers do Gunicorn e o qcluster. Sem Redis, a
+# tabela de cache no banco (python manage.py createcachetable) faz o papel.
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "profiles": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "newsclip_profile_cache",
+        "TIMEOUT": PROFILE_CACHE_SECONDS,
+    },
+}
+if PROFILE_CACHE_REDIS_URL:
+    # Requer o pacote redis instalado.
+    CACHES["profiles"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": PROFILE_CACHE_REDIS_URL,
+        "TIMEOUT": PROFILE_CACHE_SECONDS,
+    }
+
 Q_CLUSTER = {
     "name": "newsclip_cluster",
     # Um worker compartilha a instancia gratuita com o Gunicorn sem multiplicar
@@ -62,6 +62,7 @@ urlpatterns = [
     path('dashboard/<int:client_id>/news/bulk-update/', login_required(bulk_update_news), name='bulk_update_news'),
     path('noticias/todos/', views.BuscarTodasNoticiasView.as_view(), name='buscar_todas_noticias'),
     path('api/noticias/cliente/<int:pk>/', views.noticias_cliente_json, name='noticias_cliente_json'),
+    path('api/v1/clients/<int:client_id>/articles/', views.client_articles_api, name='api_client_articles'),
 
     path('dashboard/<int:client_id>/reports/', login_required(client_reports), name='client_reports'),
     path('dashboard/<int:client_id>/reports/generate/', login_required(generate_report_view), name='generate_report_view'),
@@ -7,6 +7,7 @@ from .models import (
     FetchLog,
     NewsFetchJob,
     RelevanceAuditLog,
+    RevalidationJob,
     Source,
     ValidationFeedback,
     SourceEndpoint,
@@ -84,3 +85,10 @@ class NewsFetchJobAdmin(admin.ModelAdmin):
     search_fields = ("task_id", "error_message", "result_message")
     readonly_fields = ("created_at", "updated_at")
 
+
+@admin.register(RevalidationJob)
+class RevalidationJobAdmin(admin.ModelAdmin):
+    list_display = ("created_at", "client", "status", "processed", "total", "changed", "promoted", "finished_at")
+    list_filter = ("status", "created_at", "client")
+    search_fields = ("task_id", "error_message")
+    readonly_fields = ("created_at", "updated_at")
@@ -0,0 +1,297 @@
+"""Motor de coleta assíncrono, selecionado com ``fetch_news --engine async``.
+
+Todas as buscas de uma execução (feeds globais, consultas do Google News RSS e
+APIs de cada cliente) rodam num único event loop sob um orçamento global de
+concorrência, em vez de pools de threads aninhados por cliente e por provedor.
+As chamadas de rede continuam síncronas via ``http_client``, mas executam num
+único pool do tamanho do orçamento. Candidatos já interpretados seguem por uma
+fila limitada até um escritor dedicado. Provedores que baixam e gravam por
+conta própria (APIs, descoberta, sitemaps) continuam gravando das threads do
+pool de rede; cada uma fecha suas conexões com o banco ao fim da tarefa.
+
+As consultas ao Google News rodam em modo adiável do agendador de
+``politeness``: quando o host está sem fichas ou em Retry-After, a tarefa
+devolve a vaga do orçamento e volta à fila do event loop em vez de deixar uma
+thread dormindo.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import connections
+
+from newsclip import politeness
+from newsclip.utils import save_articles
+
+
+WRITER_BATCH_SIZE = 100
+
+
+@dataclass
+class Candidate:
+    """Notícia já interpretada aguardando o escritor."""
+    client: object
+    label: str
+    article: dict
+
+
+class AsyncFetchEngine:
+    """Executa a coleta completa de vários clientes num único event loop.
+
+    ``command`` é o ``fetch_news.Command`` da execução: o motor só decide
+    quando cada etapa roda e reaproveita dele a montagem de consultas, o
+    download e a interpretação dos feeds.
+    """
+
+    def __init__(self, command, clients, since_dt, utc_now, *, quick_run=False, force_run=False, conditional=False):
+        self.command = command
+        self.clients = clients
+        self.since_dt = since_dt
+        self.utc_now = utc_now
+        self.quick_run = quick_run
+        self.force_run = force_run
+        self.conditional = conditional
+        self.concurrency = max(1, getattr(settings, "FETCH_ASYNC_CONCURRENCY", 32))
+        self.queue_size = max(1, getattr(settings, "FETCH_ASYNC_QUEUE_SIZE", 500))
+        self.saved = Counter()
+        self.sitemap_page_cache = {}
+
+    def run(self) -> int:
+        """Roda a coleta e devolve o total de notícias novas salvas."""
+        return asyncio.run(self._main())
+
+    async def _main(self) -> int:
+        self.budget = asyncio.Semaphore(self.concurrency)
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="fetch")
+        # O ORM do Django não pode ser usado dentro do event loop; leituras,
+        # logs e gravações dos candidatos enfileirados passam por esta thread.
+        self.writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fetch-writer")
+        # Provedores com várias consultas e intervalo mínimo entre elas rodam
+        # um cliente por vez, sem prender várias threads na mesma espera.
+        self.provider_locks = {"GDELT": asyncio.Lock()}
+        try:
+            return await self._collect_and_report()
+        finally:
+            await self._db(connections.close_all)
+            self.writer_executor.shutdown(wait=True)
+
+    async def _collect_and_report(self) -> int:
+        writer = asyncio.create_task(self._writer())
+        producers = asyncio.create_task(self._produce())
+        try:
+            await asyncio.wait({writer, producers}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # O escritor só sai pelo marcador final: se terminou antes dos
+            # produtores, falhou, e eles ficariam presos para sempre na fila cheia.
+            producers.cancel()
+            try:
+                await self._stop_writer(writer)
+            finally:
+                await asyncio.gather(producers, return_exceptions=True)
+                self.executor.shutdown(wait=True)
+        shared_feeds = producers.result()
+
+        overall_total = 0
+        for client in self.clients:
+            client_total = 0
+            for (client_pk, label), count in sorted(self.saved.items()):
+                if client_pk != client.pk or not count:
+                    continue
+                client_total += count
+                if label != "Descoberta Brave":
+                    await self._db(
+                        self.command.log,
+                        f"Fonte {label}: {count} notícia(s) salva(s).",
+                        level='SUCCESS',
+                        client=client,
+                    )
+            await self._db(self.command.log_client_total, client, client_total)
+            overall_total += client_total
+        if self.conditional:
+            await self._db(self.command.remember_shared_feed_validators, shared_feeds)
+        return overall_total
+
+    async def _stop_writer(self, writer):
+        """Entrega o marcador final sem travar na fila cheia se o escritor já falhou."""
+        stop = asyncio.create_task(self.queue.put(None))
+        await asyncio.wait({stop, writer}, return_when=asyncio.FIRST_COMPLETED)
+        stop.cancel()
+        await writer
+
+    async def _produce(self):
+        shared_feeds = await self._collect_shared_feeds()
+        await asyncio.gather(*(self._run_client(client, shared_feeds) for client in self.clients))
+        return shared_feeds
+
+    async def _db(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.writer_executor, lambda: func(*args, **kwargs))
+
+    async def _net(self, func, *args, **kwargs):
+        """Executa uma etapa bloqueante de rede dentro do orçamento global."""
+        loop = asyncio.get_running_loop()
+        async with self.budget:
+            return await loop.run_in_executor(self.executor, lambda: func(*args, **kwargs))
+
+    async def _net_deferrable(self, func, *args, **kwargs):
+        """Como ``_net``, mas reagenda a etapa quando o host pede para esperar."""
+        loop = asyncio.get_running_loop()
+        max_wait = getattr(settings, "POLITENESS_MAX_WAIT_SECONDS", 30)
+
+        def call():
+            with politeness.deferring():
+                return func(*args, **kwargs)
+
+        while True:
+            async with self.budget:
+                try:
+                    return await loop.run_in_executor(self.executor, call)
+                except politeness.HostDeferred as exc:
+                    if exc.retry_after > max_wait:
+                        raise
+                    delay = exc.retry_after
+            await asyncio.sleep(delay)
+
+    async def _collect_shared_feeds(self):
+        jobs = await self._db(self.command.shared_feed_jobs, rss_only=self.quick_run)
+        results = await asyncio.gather(
+            *(
+                self._net(
+                    self.command._download_shared_feed, label, source, endpoint, self.since_dt, self.conditional
+                )
+                for label, source, endpoint in jobs
+            )
+        )
+        shared_feeds = [shared_feed for shared_feed in results if shared_feed is not None]
+        if jobs:
+            await self._db(self.command.log_shared_feeds, shared_feeds, len(jobs))
+        return shared_feeds
+
+    async def _run_client(self, client, shared_feeds):
+        await self._db(self.command.log, f"--- Processando cliente: {client.name} ---", client=client)
+        plan = await self._db(self.command.client_plan, client)
+        if plan is None:
+            return
+
+        tasks = [
+            self._coarse(
+                client,
+                "Descoberta Brave",
+                lambda: self.command.run_discovery(client, plan, self.quick_run, self.force_run)["articles"],
+            )
+        ]
+        provider_jobs = await self._db(
+            self.command.provider_jobs, client, plan, self.since_dt, self.utc_now, self.quick_run, self.force_run
+        )
+        for label, func, args, kwargs in provider_jobs:
+            tasks.append(self._coarse(client, label, func, *args, **kwargs))
+
+        for label, queries, max_queries in self.command.google_rss_batches(plan, self.quick_run):
+            for keyword in self.command.select_google_rss_queries(queries, max_queries):
+                tasks.append(self._google_rss_query(client, label, keyword))
+
+        for shared_feed in shared_feeds:
+            if shared_feed.unchanged:
+                continue
+            if shared_feed.provider == "SITEMAP":
+                # Sitemaps podem abrir a página de cada matéria antes de
+                # validar; ficam como uma tarefa inteira por cliente.
+                tasks.append(
+                    self._coarse(
+                        client,
+                        shared_feed.label,
+                        self.command.save_shared_feed,
+                        client,
+                        shared_feed,
+                        plan.match_terms,
+                        self.sitemap_page_cache,
+                    )
+                )
+                continue
+            articles = self.command.feed_entry_articles(
+                shared_feed.entries,
+                plan.match_terms,
+                shared_feed.source.name,
+                shared_feed.provider,
+                shared_feed.query,
+            )
+            tasks.append(self._enqueue(client, shared_feed.label, articles))
+
+        await asyncio.gather(*tasks)
+
+    async def _enqueue(self, client, label, articles):
+        # ``put`` espera quando a fila está cheia: é o que segura a memória
+        # enquanto o escritor não acompanha o ritmo da rede.
+        for article in articles:
+            await self.queue.put(Candidate(client, label, article))
+
+    async def _coarse(self, client, label, func, *args, **kwargs):
+        """Provedor que baixa e grava por conta própria (APIs, descoberta, sitemaps)."""
+
+        def call():
+            # Grava da thread do pool de rede: a conexão aberta aqui não pode
+            # ficar pendurada numa thread que o escritor não controla.
+            try:
+                return func(*args, **kwargs)
+            finally:
+                connections.close_all()
+
+        try:
+            if label in self.provider_locks:
+                async with self.provider_locks[label]:
+                    saved = await self._net(call)
+            else:
+                saved = await self._net(call)
+        except Exception as exc:
+            await self._db(self.command.log, f"ERRO na fonte {label}: {exc}", level='ERROR', client=client)
+            return
+        self.saved[(client.pk, label)] += saved or 0
+
+    async def _google_rss_query(self, client, label, keyword):
+        try:
+            feed = await self._net_deferrable(self.command.download_google_rss, keyword)
+        except Exception as exc:
+            await self._db(
+                self.command.log,
+                f"Google RSS falhou para o termo '{keyword}': {exc}",
+                level='WARNING',
+                client=client,
+            )
+            return
+        await self._enqueue(client, label, self.command.google_rss_articles(feed, keyword, self.since_dt))
+
+    async def _writer(self):
+        finished = False
+        while not finished:
+            batch = [await self.queue.get()]
+            while len(batch) < WRITER_BATCH_SIZE and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            finished = batch[-1] is None
+            candidates = [candidate for candidate in batch if candidate is not None]
+            if candidates:
+                for key in await self._db(self._persist, candidates):
+                    self.saved[key] += 1
+
+    def _persist(self, candidates):
+        created_keys = []
+        by_client = {}
+        for candidate in candidates:
+            by_client.setdefault(candidate.client.pk, []).append(candidate)
+        for client_candidates in by_client.values():
+            client = client_candidates[0].client
+            try:
+                created = save_articles(client, [candidate.article for candidate in client_candidates])
+            except Exception as exc:
+                labels = ", ".join(sorted({candidate.label for candidate in client_candidates}))
+                self.command.log(f"ERRO ao gravar lote ({labels}): {exc}", level='ERROR', client=client)
+                continue
+            for candidate, article in zip(client_candidates, created):
+                if article is not None:
+                    created_keys.append((client.pk, candidate.label))
+        return created_keys
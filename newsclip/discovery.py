@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import ipaddress
 import json
 import re
@@ -18,15 +20,15 @@ from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
+from newsclip import http_client, politeness
 from newsclip.models import Article, DiscoveryResult, DiscoveryRun, Source, SourceEndpoint
 from newsclip.utils import (
     build_client_search_queries,
     audit_relevance_decision,
     canonicalize_source_name,
     client_positive_terms,
+    conditional_headers,
     contains_excluded_term,
-    record_endpoint_failure,
-    record_endpoint_success,
     save_article,
     validate_article_candidate,
 )
@@ -130,7 +132,7 @@ class BraveSearchProvider:
         self.freshness = freshness
 
     def search(self, query: str) -> list[SearchResult]:
-        response = requests.get(
+        response = http_client.get(
             self.endpoint,
             headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
             params={
@@ -439,11 +441,38 @@ def _endpoint_type(url: str, content_type: str = "") -> str:
     return "RSS"
 
 
+def robots_crawl_delay(robots_text: str) -> int:
+    """``Crawl-delay`` (em segundos) do grupo ``*`` ou do nosso user-agent no robots.txt."""
+    own_agent = USER_AGENT.split("/", 1)[0].casefold()
+    agents = []
+    in_rules = False
+    delay = 0
+    for raw_line in robots_text.splitlines():
+        line = raw_line.split("#", 1)[0].strip()
+        if ":" not in line:
+            continue
+        field, value = (part.strip() for part in line.split(":", 1))
+        field = field.casefold()
+        if field == "user-agent":
+            if in_rules:
+                agents = []
+                in_rules = False
+            agents.append(value.casefold())
+            continue
+        in_rules = True
+        if field == "crawl-delay" and any(agent == "*" or agent.startswith(own_agent) for agent in agents):
+            try:
+                delay = max(delay, int(float(value)))
+            except ValueError:
+                continue
+    return min(delay, 300)
+
+
 def profile_source(source: Source) -> int:
     if not is_public_http_url(source.url):
         return 0
     headers = {"User-Agent": USER_AGENT, "Accept-Language": "pt-BR,pt;q=0.9"}
-    homepage = requests.get(source.url, headers=headers, timeout=15, allow_redirects=True)
+    homepage = http_client.get(source.url, headers=headers, timeout=15, allow_redirects=True)
     homepage.raise_for_status()
     final_origin = origin_from_url(homepage.url)
     candidates = set()
@@ -455,10 +484,15 @@ def profile_source(source: Source) -> int:
             candidates.add(("RSS", urljoin(homepage.url, link.get("href"))))
 
     try:
-        robots = requests.get(urljoin(final_origin, "robots.txt"), headers=headers, timeout=10)
+        robots = http_client.get(urljoin(final_origin, "robots.txt"), headers=headers, timeout=10)
         if robots.ok:
             for match in re.findall(r"(?im)^\s*Sitemap:\s*(\S+)\s*$", robots.text):
                 candidates.add((_endpoint_type(match, "application/xml"), match.strip()))
+            crawl_delay = robots_crawl_delay(robots.text)
+            if crawl_delay != source.crawl_delay:
+                Source.objects.filter(pk=source.pk).update(crawl_delay=crawl_delay)
+                source.crawl_delay = crawl_delay
+            politeness.scheduler.set_crawl_delay(politeness.host_of(final_origin), crawl_delay)
     except requests.RequestException:
         pass
 
@@ -491,32 +525,129 @@ def _xml_local_name(tag: str) -> str:
     return tag.rsplit("}", 1)[-1].casefold()
 
 
-def parse_sitemap(xml_text: str) -> tuple[list[str], list[dict]]:
-    root = ElementTree.fromstring(xml_text)
-    child_sitemaps = []
-    articles = []
-    if _xml_local_name(root.tag) == "sitemapindex":
-        for node in root:
-            loc = next((child.text for child in node if _xml_local_name(child.tag) == "loc"), None)
-            if loc:
-                child_sitemaps.append(loc.strip())
-        return child_sitemaps, articles
-
-    for node in root:
-        values = {}
-        for descendant in node.iter():
-            name = _xml_local_name(descendant.tag)
-            if descendant.text and name in {"loc", "lastmod", "title", "publication_date"}:
-                values[name] = descendant.text.strip()
-        if values.get("loc"):
-            articles.append(values)
-    return child_sitemaps, articles
+SITEMAP_FIELDS = {"loc", "lastmod", "title", "publication_date"}
+FILENAME_DATE_RE = re.compile(r"(20\d{2})[-_/]?(0[1-9]|1[0-2])(?:[-_/]?(0[1-9]|[12]\d|3[01]))?")
+
+
+def iter_sitemap_entries(chunks):
+    """Percorre um sitemap em blocos, entregando ``(tipo, valores)`` por entrada.
+
+    ``tipo`` e ``"sitemap"`` para filhos de um indice e ``"url"`` para
+    materias. Cada ``<url>``/``<sitemap>`` e descartado da arvore assim que lido,
+    entao a memoria nao cresce com o tamanho do documento; o consumidor pode
+    parar a iteracao a qualquer momento.
+    """
+    parser = ElementTree.XMLPullParser(events=("start", "end"))
+    root = None
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "start":
+                if root is None:
+                    root = element
+                continue
+            name = _xml_local_name(element.tag)
+            if name not in {"url", "sitemap"} or element is root:
+                continue
+            values = {}
+            for descendant in element.iter():
+                field = _xml_local_name(descendant.tag)
+                if descendant.text and field in SITEMAP_FIELDS:
+                    values[field] = descendant.text.strip()
+            root.clear()
+            if values.get("loc"):
+                yield name, values
+    parser.close()
+
+
+def _parse_sitemap_date(raw_date: str | None):
+    if not raw_date:
+        return None
+    try:
+        parsed = datetime.fromisoformat(raw_date.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+
+
+def _child_sitemap_date(entry: dict):
+    """Data do sitemap filho pelo ``lastmod`` ou, na falta dele, pelo nome do arquivo."""
+    parsed = _parse_sitemap_date(entry.get("lastmod"))
+    if parsed:
+        return parsed
+    match = FILENAME_DATE_RE.search(urlsplit(entry["loc"]).path)
+    if not match:
+        return None
+    year, month, day = match.groups()
+    try:
+        return timezone.make_aware(datetime(int(year), int(month), int(day or 1)))
+    except ValueError:
+        return None
+
+
+def select_child_sitemaps(children: list[dict], since_dt, max_children: int) -> list[str]:
+    """Escolhe os filhos mais recentes de um indice.
+
+    Com datas (``lastmod`` ou data no nome), descarta os anteriores a
+    ``since_dt`` e fica com os ``max_children`` mais novos. Sem nenhuma data,
+    mantem a regra antiga: todos ate 20 filhos, senao os primeiros.
+    """
+    dated = [(_child_sitemap_date(child), position, child["loc"]) for position, child in enumerate(children)]
+    if not any(child_date for child_date, _, _ in dated):
+        locs = [child["loc"] for child in children]
+        return locs if len(locs) <= 20 else locs[:max_children]
+    # Mes no nome do arquivo vale para o mes inteiro: compara pelo inicio do mes da janela.
+    window_start = since_dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    recent = [item for item in dated if item[0] is None or item[0] >= window_start]
+    recent.sort(key=lambda item: (item[0] is not None, item[0] or since_dt, -item[1]), reverse=True)
+    return [loc for _, _, loc in recent[:max_children]]
+
+
+class _RecentSitemapItems:
+    """Mantem so os ``max_articles`` itens mais novos (heap) enquanto o sitemap e lido."""
+
+    def __init__(self, since_dt, max_articles: int):
+        self.since_dt = since_dt
+        self.max_articles = max(1, max_articles)
+        self.heap: list = []
+        self.counter = 0
+        self.seen_recent = False
+        self.stale_streak = 0
+
+    def start_document(self) -> None:
+        self.seen_recent = False
+        self.stale_streak = 0
+
+    def add(self, values: dict) -> None:
+        raw_date = values.get("publication_date") or values.get("lastmod")
+        parsed = _parse_sitemap_date(raw_date)
+        if parsed and parsed < self.since_dt:
+            self.stale_streak += 1
+            return
+        if parsed:
+            self.seen_recent = True
+        self.stale_streak = 0
+        item = {"loc": values["loc"], "title": values.get("title", ""), "raw_date": raw_date}
+        self.counter += 1
+        entry = (raw_date or "", -self.counter, item)
+        if len(self.heap) < self.max_articles:
+            heapq.heappush(self.heap, entry)
+        else:
+            heapq.heappushpop(self.heap, entry)
+
+    def exhausted(self) -> bool:
+        """Sitemap em ordem decrescente ja passou da janela: o resto e so mais antigo."""
+        streak = max(1, getattr(settings, "SITEMAP_STALE_STREAK", 50))
+        return self.seen_recent and self.stale_streak >= streak
+
+    def items(self) -> list[dict]:
+        return [item for _, _, item in sorted(self.heap, reverse=True)]
 
 
 def extract_article_page(url: str) -> dict[str, str]:
     if not is_public_http_url(url):
         return {}
-    response = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=15, allow_redirects=True)
+    response = http_client.get(url, headers={"User-Agent": USER_AGENT}, timeout=15, allow_redirects=True)
     response.raise_for_status()
     soup = BeautifulSoup(response.text, "html.parser")
     title = ""
@@ -545,72 +676,114 @@ def extract_article_page(url: str) -> dict[str, str]:
     return {"title": title.strip(), "description": description.strip(), "published_at": published_at}
 
 
-def fetch_sitemap_endpoint(command, client, endpoint: SourceEndpoint, keywords: list[str], since_dt) -> int:
-    if not is_public_http_url(endpoint.url):
-        return 0
+def collect_sitemap_feed(endpoint: SourceEndpoint, since_dt, *, conditional: bool = False):
+    """Baixa o sitemap (e filhos) uma vez e devolve os itens recentes, sem salvar.
+
+    A raiz e os filhos sao lidos em blocos (teto SITEMAP_MAX_BYTES cada), com
+    memoria constante qualquer que seja o tamanho do documento. Com
+    ``conditional`` a raiz usa GET condicional e retorna ``None`` quando nao
+    mudou desde a ultima coleta (304 ou mesmo SHA-256, calculado durante a
+    leitura); caso contrario ``(itens, resposta, hash)``. Resposta e hash so
+    vem preenchidos para urlsets: um indice pode ficar identico enquanto os
+    sitemaps filhos mudam, entao seus validadores nunca sao guardados e ele e
+    sempre baixado por inteiro.
+    """
     headers = {"User-Agent": USER_AGENT}
     max_children = getattr(settings, "SITEMAP_MAX_CHILDREN", 3)
     max_articles = getattr(settings, "SITEMAP_MAX_ARTICLES", 30)
+    max_bytes = getattr(settings, "SITEMAP_MAX_BYTES", 50 * 1024 * 1024)
+    recent = _RecentSitemapItems(since_dt, max_articles)
+    with http_client.stream(
+        endpoint.url,
+        headers=conditional_headers(endpoint, headers, conditional),
+        timeout=20,
+        max_bytes=max_bytes,
+    ) as body:
+        if conditional and body.response.status_code == 304:
+            return None
+        digest = hashlib.sha256()
+        chunks = _hashed_chunks(body, digest)
+        children = _consume_sitemap(iter_sitemap_entries(chunks), recent)
+        if conditional and not children:
+            # O hash guardado cobre o corpo inteiro: le o resto (sem guardar)
+            # mesmo quando as materias recentes acabaram antes.
+            for _chunk in chunks:
+                pass
+        response = body.response
+    # Sem GET condicional a leitura pode ter parado no meio: hash nenhum.
+    content_hash = digest.hexdigest() if conditional else ""
+    if conditional and not children and endpoint.content_hash == content_hash:
+        return None
+    for child_url in select_child_sitemaps(children, since_dt, max_children):
+        if not is_public_http_url(child_url):
+            continue
+        with http_client.stream(child_url, headers=headers, timeout=20, max_bytes=max_bytes) as child_chunks:
+            _consume_sitemap(iter_sitemap_entries(child_chunks), recent)
+    if children:
+        return recent.items(), None, ""
+    return recent.items(), response, content_hash
+
+
+def _hashed_chunks(chunks, digest):
+    for chunk in chunks:
+        digest.update(chunk)
+        yield chunk
+
+
+def _consume_sitemap(entries, recent: _RecentSitemapItems) -> list[dict]:
+    """Alimenta ``recent`` com as materias e devolve os sitemaps filhos encontrados."""
+    children = []
+    recent.start_document()
+    for kind, values in entries:
+        if kind == "sitemap":
+            children.append(values)
+            continue
+        recent.add(values)
+        if recent.exhausted():
+            break
+    return children
+
+
+def save_sitemap_items(client, endpoint: SourceEndpoint, items: list[dict], keywords: list[str], page_cache=None) -> int:
+    """Valida e salva para um cliente os itens ja coletados de um sitemap.
+
+    ``page_cache`` permite reaproveitar, entre clientes da mesma execucao, as
+    paginas de materia que precisaram ser abertas para obter titulo/resumo.
+    """
     saved_count = 0
-    try:
-        response = requests.get(endpoint.url, headers=headers, timeout=20)
-        response.raise_for_status()
-        children, articles = parse_sitemap(response.text)
-        selected_children = children if len(children) <= 20 else children[:max_children]
-        for child_url in selected_children:
-            if not is_public_http_url(child_url):
-                continue
-            child_response = requests.get(child_url, headers=headers, timeout=20)
-            child_response.raise_for_status()
-            _, child_articles = parse_sitemap(child_response.text)
-            articles.extend(child_articles)
-
-        articles.sort(
-            key=lambda item: item.get("publication_date") or item.get("lastmod") or "",
-            reverse=True,
-        )
-        for item in articles[:max_articles]:
-            raw_date = item.get("publication_date") or item.get("lastmod")
-            if raw_date:
-                try:
-                    parsed = datetime.fromisoformat(raw_date.replace("Z", "+00:00"))
-                    if timezone.is_naive(parsed):
-                        parsed = timezone.make_aware(parsed)
-                    if parsed < since_dt:
-                        continue
-                except ValueError:
-                    pass
-            title = item.get("title", "")
-            description = ""
-            if not title or not relevance_score(title, "", keywords):
+    for item in items:
+        raw_date = item.get("raw_date")
+        title = item.get("title", "")
+        description = ""
+        if not title or not relevance_score(title, "", keywords):
+            if page_cache is not None and item["loc"] in page_cache:
+                page = page_cache[item["loc"]]
+            else:
                 page = extract_article_page(item["loc"])
-                title = title or page.get("title", "")
-                description = page.get("description", "")
-                raw_date = raw_date or page.get("published_at")
-            validation = validate_article_candidate(
-                client,
-                title,
-                description,
-                canonicalize_url(item["loc"]),
-                endpoint.source.name,
-                provider="SITEMAP",
-            )
-            if validation["status"] != "ACCEPTED":
-                continue
-            saved = save_article(
-                client=client,
-                title=title,
-                url=canonicalize_url(item["loc"]),
-                raw_date=raw_date,
-                source=endpoint.source.name,
-                content_text=description,
-                provider="SITEMAP",
-                query=endpoint.url,
-            )
-            saved_count += int(saved is not None)
-
-        record_endpoint_success(endpoint)
-        return saved_count
-    except (requests.RequestException, ElementTree.ParseError) as exc:
-        record_endpoint_failure(endpoint, exc, client=client, log=command.log)
-        return 0
+                if page_cache is not None:
+                    page_cache[item["loc"]] = page
+            title = title or page.get("title", "")
+            description = page.get("description", "")
+            raw_date = raw_date or page.get("published_at")
+        validation = validate_article_candidate(
+            client,
+            title,
+            description,
+            canonicalize_url(item["loc"]),
+            endpoint.source.name,
+            provider="SITEMAP",
+        )
+        if validation["status"] != "ACCEPTED":
+            continue
+        saved = save_article(
+            client=client,
+            title=title,
+            url=canonicalize_url(item["loc"]),
+            raw_date=raw_date,
+            source=endpoint.source.name,
+            content_text=description,
+            provider="SITEMAP",
+            query=endpoint.url,
+        )
+        saved_count += int(saved is not None)
+    return saved_count
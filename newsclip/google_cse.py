@@ -8,6 +8,7 @@ import requests
 from django.conf import settings
 from django.utils import timezone
 
+from newsclip import http_client, politeness
 from newsclip.models import DiscoveryRun
 from newsclip.utils import (
     client_context_terms,
@@ -128,7 +129,7 @@ def fetch_google_cse(client, since_dt, log=None, *, quick=False) -> int:
     try:
         for term in selected_terms:
             queries_count += 1
-            response = requests.get(
+            response = http_client.get(
                 GOOGLE_CSE_URL,
                 params={
                     "key": api_key,
@@ -142,8 +143,17 @@ def fetch_google_cse(client, since_dt, log=None, *, quick=False) -> int:
                     "safe": "active",
                 },
                 timeout=timeout,
+                politeness_key=politeness.GOOGLE_CSE_KEY,
             )
             if response.status_code in {403, 429}:
+                # A cota é do projeto, não do cliente: os próximos clientes da
+                # execução nem tentam até o fim da espera.
+                politeness.scheduler.defer(
+                    politeness.GOOGLE_CSE_KEY,
+                    politeness.retry_after_seconds(
+                        response, getattr(settings, "GOOGLE_CSE_QUOTA_COOLDOWN_SECONDS", 3600)
+                    ),
+                )
                 message = "Google CSE atingiu o limite de cota ou recusou a consulta; demais fontes continuarão normalmente."
                 errors.append(message)
                 if log:
@@ -169,6 +179,11 @@ def fetch_google_cse(client, since_dt, log=None, *, quick=False) -> int:
                     query=term,
                 )
                 saved_count += int(saved is not None)
+    except politeness.HostDeferred:
+        message = "Google CSE em espera após limite de cota; demais fontes continuarão normalmente."
+        errors.append(message)
+        if log:
+            log(message, level="INFO", client=client)
     except (requests.RequestException, ValueError) as exc:
         message = sanitize_sensitive_text(str(exc))
         errors.append(message)
@@ -0,0 +1,167 @@
+"""Cliente HTTP compartilhado por todos os coletores do newsclip.
+
+Uma única ``requests.Session`` por processo mantém conexões keep-alive em
+pools por host, de modo que o leque de consultas ao Google News RSS, aos
+sitemaps e às APIs reaproveita o handshake TCP/TLS em vez de refazê-lo a cada
+requisição. Cada host também tem um limite de requisições simultâneas, passa
+pelo agendador de ``politeness`` antes de cada GET, e toda resposta é lida em
+streaming com teto de tamanho.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from newsclip import politeness
+
+
+DEFAULT_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+CHUNK_SIZE = 64 * 1024
+
+_session = None
+_session_lock = threading.Lock()
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+class ResponseTooLarge(requests.RequestException):
+    """Resposta maior que ``HTTP_MAX_RESPONSE_BYTES``; o download é interrompido."""
+
+
+def get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = max(1, getattr(settings, "HTTP_POOL_MAXSIZE", 20))
+                adapter = HTTPAdapter(
+                    pool_connections=max(1, getattr(settings, "HTTP_POOL_CONNECTIONS", 50)),
+                    pool_maxsize=pool_size,
+                    pool_block=False,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _session = session
+    return _session
+
+
+@contextmanager
+def host_slot(url: str):
+    """Reserva uma das ``HTTP_MAX_PER_HOST`` vagas de requisição do host da URL."""
+    # Mesma chave do agendador de politeness: www.host e host dividem as vagas.
+    host = politeness.host_of(url)
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = threading.BoundedSemaphore(max(1, getattr(settings, "HTTP_MAX_PER_HOST", 6)))
+            _host_slots[host] = slot
+    with slot:
+        yield
+
+
+def _read_limited(response: requests.Response, max_bytes: int, expires_at: float | None = None) -> bytes:
+    declared = response.headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise ResponseTooLarge(f"Resposta de {declared} bytes excede o limite de {max_bytes}.", response=response)
+    return b"".join(_iter_limited(response, max_bytes, expires_at))
+
+
+def get(
+    url: str,
+    *,
+    params=None,
+    headers=None,
+    timeout=None,
+    max_bytes=None,
+    allow_redirects=True,
+    politeness_key=None,
+    deadline=None,
+) -> requests.Response:
+    """GET pelo pool compartilhado; devolve a resposta com o corpo já lido.
+
+    ``timeout`` segue a convenção do requests (segundos ou tupla
+    conexão/leitura) e cai em ``HTTP_DEFAULT_TIMEOUT`` quando omitido. Corpos
+    maiores que ``max_bytes`` (padrão ``HTTP_MAX_RESPONSE_BYTES``), medidos já
+    descomprimidos, levantam ``ResponseTooLarge``. ``deadline`` limita em
+    segundos a requisição inteira: o timeout de leitura vale por pacote, e um
+    servidor que pinga bytes devagar o bastante nunca o dispara sozinho.
+    ``politeness_key`` troca o host como chave do agendador (ex.: cotas de uma
+    API específica).
+    """
+    timeout = timeout or getattr(settings, "HTTP_DEFAULT_TIMEOUT", 20)
+    max_bytes = max_bytes or getattr(settings, "HTTP_MAX_RESPONSE_BYTES", 10 * 1024 * 1024)
+    key = politeness_key or politeness.host_of(url)
+    politeness.scheduler.wait(key)
+    with host_slot(url):
+        expires_at = time.monotonic() + deadline if deadline else None
+        response = get_session().get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+            stream=True,
+        )
+        try:
+            response._content = _read_limited(response, max_bytes, expires_at)
+            response._content_consumed = True
+        finally:
+            # Devolve a conexão ao pool mesmo quando o corpo foi descartado.
+            response.close()
+    politeness.scheduler.note_response(key, response)
+    return response
+
+
+class StreamedBody:
+    """Blocos do corpo entregues por ``stream``; ``response`` traz status e cabeçalhos."""
+
+    def __init__(self, response: requests.Response, chunks):
+        self.response = response
+        self._chunks = chunks
+
+    def __iter__(self):
+        return self._chunks
+
+
+@contextmanager
+def stream(url: str, *, headers=None, timeout=None, max_bytes=None, deadline=None):
+    """Como ``get``, mas entrega o corpo em blocos sem guardá-lo na memória.
+
+    Para documentos grandes (sitemaps) lidos de forma incremental; sair do
+    bloco ``with`` antes do fim interrompe o download. O status já foi
+    conferido com ``raise_for_status`` quando os blocos começam a chegar (um
+    304 de GET condicional chega como corpo vazio, com ``response`` para
+    conferir).
+    """
+    timeout = timeout or getattr(settings, "HTTP_DEFAULT_TIMEOUT", 20)
+    max_bytes = max_bytes or getattr(settings, "HTTP_MAX_RESPONSE_BYTES", 10 * 1024 * 1024)
+    key = politeness.host_of(url)
+    politeness.scheduler.wait(key)
+    with host_slot(url):
+        expires_at = time.monotonic() + deadline if deadline else None
+        response = get_session().get(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            politeness.scheduler.note_response(key, response)
+            response.raise_for_status()
+            yield StreamedBody(response, _iter_limited(response, max_bytes, expires_at))
+        finally:
+            response.close()
+
+
+def _iter_limited(response: requests.Response, max_bytes: int, expires_at: float | None):
+    size = 0
+    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+        if expires_at is not None and time.monotonic() > expires_at:
+            raise requests.Timeout("Download excedeu o prazo total da requisição.", response=response)
+        size += len(chunk)
+        if size > max_bytes:
+            raise ResponseTooLarge(f"Resposta excede o limite de {max_bytes} bytes.", response=response)
+        yield chunk
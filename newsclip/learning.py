@@ -1,18 +1,39 @@
-"""Aprendizado explicável baseado nas decisões manuais de validação."""
+"""Aprendizado explicável baseado nas decisões manuais de validação.
+
+Cada decisão ACCEPTED/REJECTED soma 1 à contagem de cada feature do texto
+decidido em ``LearningFeatureCount``; trocar ou apagar a decisão desfaz a
+contagem anterior. O perfil do cliente é montado a partir dessas contagens,
+cobrindo todo o histórico sem retokenizar os textos.
+
+Para pontuar muitos candidatos de uma vez (revalidação, coleta), os pesos
+também ficam num ``LearningVector``: vocabulário feature -> coluna e um vetor
+NumPy, com o qual o lote inteiro é ordenado e somado de uma vez.
+"""
 
 from __future__ import annotations
 
+import logging
 import math
 import re
-import time
-from collections import Counter
+from collections import defaultdict
 
+import numpy as np
 from django.conf import settings
-
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from newsclip.profiles import (
+    bump_profile_version,
+    cached_profile_value,
+    current_profile_version,
+    forget_profile_version,
+)
 from newsclip.utils import normalize_match_text
 
 
-PROFILE_CACHE = {}
+logger = logging.getLogger("newsclip")
+
 LEARNING_STOP_WORDS = {
     "a", "ao", "aos", "as", "com", "como", "da", "das", "de", "do", "dos",
     "e", "em", "entre", "na", "nas", "no", "nos", "o", "os", "para", "por",
@@ -21,7 +42,8 @@ LEARNING_STOP_WORDS = {
 
 
 def invalidate_client_learning_profile(client_id):
-    PROFILE_CACHE.pop(int(client_id), None)
+    """Faz este processo reler a versão do perfil (a gravação do feedback já a incrementou)."""
+    forget_profile_version(client_id)
 
 
 def _words(value):
@@ -54,91 +76,305 @@ def extract_learning_features(title="", content="", source="", provider=""):
     return features
 
 
-def record_manual_feedback(articles, decision, user=None):
+FEEDBACK_FIELDS = ("decision", "title", "content", "source", "provider")
+LEARNED_DECISIONS = ("ACCEPTED", "REJECTED")
+FEATURE_QUERY_CHUNK = 500
+
+
+def feedback_feature_deltas(removed=(), added=()):
+    """Variação ``{feature: [aceitas, rejeitadas]}`` ao trocar decisões ``removed`` por ``added``.
+
+    Cada item é um dict (ou objeto) com ``decision``, ``title``, ``content``,
+    ``source`` e ``provider``; decisões REVIEW não contam.
+    """
+    from newsclip.models import LearningFeatureCount
+
+    deltas = defaultdict(lambda: [0, 0])
+    for sign, items in ((-1, removed), (1, added)):
+        for item in items:
+            values = item if isinstance(item, dict) else {field: getattr(item, field, "") for field in FEEDBACK_FIELDS}
+            if values["decision"] not in LEARNED_DECISIONS:
+                continue
+            column = 0 if values["decision"] == "ACCEPTED" else 1
+            for feature in extract_learning_features(
+                values["title"], values["content"], values["source"], values["provider"]
+            ):
+                if len(feature) <= LearningFeatureCount.FEATURE_MAX_LENGTH:
+                    deltas[feature][column] += sign
+    return {feature: delta for feature, delta in deltas.items() if delta[0] or delta[1]}
+
+
+def feedback_total_delta(removed=(), added=()):
+    """Variação ``[aceitas, rejeitadas]`` no total de decisões do cliente."""
+    totals = [0, 0]
+    for sign, items in ((-1, removed), (1, added)):
+        for item in items:
+            decision = item["decision"] if isinstance(item, dict) else getattr(item, "decision", "")
+            if decision in LEARNED_DECISIONS:
+                totals[0 if decision == "ACCEPTED" else 1] += sign
+    return totals
+
+
+def index_article_learning_features(articles):
+    """Grava o índice invertido feature -> notícia das notícias informadas."""
+    from newsclip.models import ArticleLearningFeature, LearningFeatureCount
+
+    rows = [
+        ArticleLearningFeature(client_id=article.client_id, article_id=article.pk, feature=feature)
+        for article in articles
+        if article.pk
+        for feature in extract_learning_features(
+            article.title,
+            article.content or article.summary,
+            article.source,
+            article.provider,
+        )
+        if len(feature) <= LearningFeatureCount.FEATURE_MAX_LENGTH
+    ]
+    if rows:
+        ArticleLearningFeature.objects.bulk_create(rows, batch_size=2000, ignore_conflicts=True)
+    return len(rows)
+
+
+def apply_feature_deltas(client_id, deltas):
+    """Aplica as variações às contagens persistidas do cliente."""
+    from newsclip.models import LearningFeatureCount
+
+    if not deltas:
+        return
+    features = list(deltas)
+    with transaction.atomic():
+        for offset in range(0, len(features), FEATURE_QUERY_CHUNK):
+            chunk = features[offset:offset + FEATURE_QUERY_CHUNK]
+            existing = {
+                row.feature: row
+                for row in LearningFeatureCount.objects.select_for_update().filter(
+                    client_id=client_id,
+                    feature__in=chunk,
+                )
+            }
+            changed, created, emptied = [], [], []
+            for feature in chunk:
+                accepted_delta, rejected_delta = deltas[feature]
+                row = existing.get(feature)
+                if row is None:
+                    # Só decisões novas criam linhas; remover de uma linha
+                    # inexistente (ex.: cliente sendo apagado) não faz nada.
+                    if accepted_delta > 0 or rejected_delta > 0:
+                        created.append(
+                            LearningFeatureCount(
+                                client_id=client_id,
+                                feature=feature,
+                                accepted=max(0, accepted_delta),
+                                rejected=max(0, rejected_delta),
+                            )
+                        )
+                    continue
+                row.accepted = max(0, row.accepted + accepted_delta)
+                row.rejected = max(0, row.rejected + rejected_delta)
+                # A linha fica enquanto houver decisões ou noticias pontuadas com ela.
+                if row.accepted or row.rejected or row.scored_accepted or row.scored_rejected:
+                    changed.append(row)
+                else:
+                    emptied.append(row.pk)
+            if changed:
+                LearningFeatureCount.objects.bulk_update(changed, ["accepted", "rejected"])
+            if emptied:
+                LearningFeatureCount.objects.filter(pk__in=emptied).delete()
+            if created:
+                LearningFeatureCount.objects.bulk_create(created, ignore_conflicts=True)
+
+
+def rebuild_feature_counts(client_id):
+    """Recalcula do zero as contagens do cliente a partir das decisões gravadas."""
+    from newsclip.models import LearningFeatureCount, ValidationFeedback
+
+    feedback = ValidationFeedback.objects.filter(
+        client_id=client_id,
+        decision__in=LEARNED_DECISIONS,
+    ).values(*FEEDBACK_FIELDS)
+    deltas = feedback_feature_deltas(added=feedback.iterator(chunk_size=500))
+    with transaction.atomic():
+        rows = LearningFeatureCount.objects.filter(client_id=client_id)
+        # Preserva as contagens com que as noticias foram pontuadas.
+        scored = {
+            feature: (accepted, rejected)
+            for feature, accepted, rejected in rows.values_list("feature", "scored_accepted", "scored_rejected")
+            if accepted or rejected
+        }
+        rows.delete()
+        LearningFeatureCount.objects.bulk_create(
+            [
+                LearningFeatureCount(
+                    client_id=client_id,
+                    feature=feature,
+                    accepted=deltas.get(feature, (0, 0))[0],
+                    rejected=deltas.get(feature, (0, 0))[1],
+                    scored_accepted=scored.get(feature, (0, 0))[0],
+                    scored_rejected=scored.get(feature, (0, 0))[1],
+                )
+                for feature in deltas.keys() | scored.keys()
+            ],
+            batch_size=1000,
+        )
+    return len(deltas)
+
+
+def _save_feedback_batch(articles, decision, decided_by, now):
+    """Grava as decisões de ``articles`` numa transação; devolve (gravadas, features movidas por cliente)."""
     from newsclip.models import ValidationFeedback
+    from newsclip.stats import tracking_article_stats
+
+    existing = {
+        item.article_id: item
+        for item in ValidationFeedback.objects.filter(article__in=articles)
+    }
+    previous = defaultdict(list)
+    current = defaultdict(list)
+    moved = {}
+    to_create, to_update = [], []
+    for article in articles:
+        item = existing.get(article.pk)
+        if item is not None:
+            previous[item.client_id].append({field: getattr(item, field) for field in FEEDBACK_FIELDS})
+        else:
+            item = ValidationFeedback(article=article)
+        item.client_id = article.client_id
+        item.decided_by = decided_by
+        item.decision = decision
+        item.base_status = article.validation_status
+        item.base_score = max(0, min(int(article.relevance_score or 0), 100))
+        item.base_reason = (article.validation_reason or "")[:255]
+        item.title = (article.title or "")[:500]
+        item.content = (article.content or article.summary or "")[:4000]
+        item.source = (article.source or "")[:255]
+        item.provider = (article.provider or "")[:32]
+        item.updated_at = now
+        (to_update if item.pk else to_create).append(item)
+        current[article.client_id].append(item)
+
+    with transaction.atomic():
+        if to_update:
+            ValidationFeedback.objects.bulk_update(
+                to_update,
+                [
+                    "client", "decided_by", "decision", "base_status", "base_score", "base_reason",
+                    "title", "content", "source", "provider", "updated_at",
+                ],
+            )
+        if to_create:
+            # Rejeitadas que ganham decisão manual deixam de ser descartes automáticos.
+            with tracking_article_stats((item.article_id for item in to_create), rollups=False):
+                ValidationFeedback.objects.bulk_create(to_create)
+        for client_id in current:
+            deltas = feedback_feature_deltas(previous[client_id], current[client_id])
+            apply_feature_deltas(client_id, deltas)
+            moved[client_id] = moved_learning_features(
+                client_id,
+                deltas,
+                feedback_total_delta(previous[client_id], current[client_id]),
+            )
+    return len(to_create) + len(to_update), moved
+
+
+def record_manual_feedback(articles, decision, user=None):
+    from newsclip.revalidation import schedule_learning_rescore
 
     if decision not in {"ACCEPTED", "REVIEW", "REJECTED"}:
         return 0
 
-    saved = 0
-    client_ids = set()
-    for article in articles:
-        try:
-            content = (article.content or article.summary or "")[:4000]
-            ValidationFeedback.objects.update_or_create(
-                article=article,
-                defaults={
-                    "client": article.client,
-                    "decided_by": user if getattr(user, "is_authenticated", False) else None,
-                    "decision": decision,
-                    "base_status": article.validation_status,
-                    "base_score": max(0, min(int(article.relevance_score or 0), 100)),
-                    "base_reason": (article.validation_reason or "")[:255],
-                    "title": (article.title or "")[:500],
-                    "content": content,
-                    "source": (article.source or "")[:255],
-                    "provider": (article.provider or "")[:32],
-                },
-            )
-            saved += 1
-            client_ids.add(article.client_id)
-        except Exception:
-            # O aprendizado nunca pode impedir a decisão manual do usuário.
-            continue
-
-    for client_id in client_ids:
-        invalidate_client_learning_profile(client_id)
+    articles = [article for article in articles if getattr(article, "pk", None)]
+    if not articles:
+        return 0
+    decided_by = user if getattr(user, "is_authenticated", False) else None
+    now = timezone.now()
+    try:
+        saved, moved = _save_feedback_batch(articles, decision, decided_by, now)
+    except Exception:
+        # O aprendizado nunca pode impedir a decisão manual do usuário: se o
+        # lote falha, cada notícia é gravada sozinha e só a que falhar fica de fora.
+        logger.exception("Falha ao gravar %s decisoes manuais em lote; gravando uma a uma", len(articles))
+        saved, moved = 0, {}
+        for article in articles:
+            try:
+                count, article_moved = _save_feedback_batch([article], decision, decided_by, now)
+            except Exception:
+                logger.exception("Falha ao gravar a decisao manual da noticia %s", article.pk)
+                continue
+            saved += count
+            for client_id, features in article_moved.items():
+                if features is None or moved.get(client_id, []) is None:
+                    moved[client_id] = None
+                else:
+                    moved[client_id] = sorted({*moved.get(client_id, []), *features})
+
+    # bulk_create/bulk_update não disparam os signals de ValidationFeedback:
+    # a versão do perfil sobe uma vez por cliente.
+    for client_id, features in moved.items():
+        bump_profile_version(client_id)
+        schedule_learning_rescore(client_id, features)
     return saved
 
 
-def _build_learning_profile(client_id):
+def learning_totals(client_id):
+    """Total de decisões ``{"ACCEPTED": n, "REJECTED": n}`` do cliente."""
     from newsclip.models import ValidationFeedback
 
-    max_feedback = max(10, getattr(settings, "VALIDATION_LEARNING_MAX_FEEDBACK", 500))
-    feedback_items = list(
-        ValidationFeedback.objects.filter(
-            client_id=client_id,
-            decision__in=["ACCEPTED", "REJECTED"],
-        ).order_by("-updated_at")[:max_feedback]
+    return dict(
+        ValidationFeedback.objects.filter(client_id=client_id, decision__in=LEARNED_DECISIONS)
+        .values_list("decision")
+        .annotate(total=Count("id"))
+        .order_by()
     )
-    accepted = [item for item in feedback_items if item.decision == "ACCEPTED"]
-    rejected = [item for item in feedback_items if item.decision == "REJECTED"]
+
+
+def learning_active(accepted_total, rejected_total):
     min_accepted = max(1, getattr(settings, "VALIDATION_LEARNING_MIN_ACCEPTED", 3))
     min_rejected = max(1, getattr(settings, "VALIDATION_LEARNING_MIN_REJECTED", 3))
+    return accepted_total >= min_accepted and rejected_total >= min_rejected
+
+
+def min_feature_occurrences():
+    return max(2, getattr(settings, "VALIDATION_LEARNING_MIN_FEATURE_OCCURRENCES", 2))
+
+
+def feature_weight(accepted_count, rejected_count, accepted_total, rejected_total):
+    """Log da razão entre as taxas (suavizadas) de aceite e de rejeição da feature."""
+    accepted_rate = (accepted_count + 1) / (accepted_total + 2)
+    rejected_rate = (rejected_count + 1) / (rejected_total + 2)
+    return math.log(accepted_rate / rejected_rate)
+
+
+def _build_learning_profile(client_id):
+    from newsclip.models import LearningFeatureCount, ValidationFeedback
+
+    totals = dict(
+        ValidationFeedback.objects.filter(client_id=client_id, decision__in=LEARNED_DECISIONS)
+        .values_list("decision")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    accepted_total = totals.get("ACCEPTED", 0)
+    rejected_total = totals.get("REJECTED", 0)
 
     profile = {
-        "active": len(accepted) >= min_accepted and len(rejected) >= min_rejected,
-        "accepted": len(accepted),
-        "rejected": len(rejected),
+        "active": learning_active(accepted_total, rejected_total),
+        "accepted": accepted_total,
+        "rejected": rejected_total,
         "weights": {},
     }
     if not profile["active"]:
         return profile
 
-    accepted_features = Counter()
-    rejected_features = Counter()
-    for item in accepted:
-        accepted_features.update(
-            extract_learning_features(item.title, item.content, item.source, item.provider)
-        )
-    for item in rejected:
-        rejected_features.update(
-            extract_learning_features(item.title, item.content, item.source, item.provider)
-        )
-
-    min_occurrences = max(
-        2,
-        getattr(settings, "VALIDATION_LEARNING_MIN_FEATURE_OCCURRENCES", 2),
+    counts = (
+        LearningFeatureCount.objects.filter(client_id=client_id)
+        .annotate(occurrences=F("accepted") + F("rejected"))
+        .filter(occurrences__gte=min_feature_occurrences())
+        .values_list("feature", "accepted", "rejected")
     )
     weights = {}
-    for feature in accepted_features.keys() | rejected_features.keys():
-        accepted_count = accepted_features[feature]
-        rejected_count = rejected_features[feature]
-        if accepted_count + rejected_count < min_occurrences:
-            continue
-        accepted_rate = (accepted_count + 1) / (len(accepted) + 2)
-        rejected_rate = (rejected_count + 1) / (len(rejected) + 2)
-        weights[feature] = math.log(accepted_rate / rejected_rate)
+    for feature, accepted_count, rejected_count in counts.iterator(chunk_size=2000):
+        weights[feature] = feature_weight(accepted_count, rejected_count, accepted_total, rejected_total)
     profile["weights"] = weights
     return profile
 
@@ -148,15 +384,11 @@ def get_client_learning_profile(client):
         return {"active": False, "accepted": 0, "rejected": 0, "weights": {}}
 
     client_id = int(client.pk)
-    now = time.monotonic()
-    cache_seconds = max(0, getattr(settings, "VALIDATION_LEARNING_CACHE_SECONDS", 300))
-    cached = PROFILE_CACHE.get(client_id)
-    if cached and cached[0] > now:
-        return cached[1]
-
-    profile = _build_learning_profile(client_id)
-    PROFILE_CACHE[client_id] = (now + cache_seconds, profile)
-    return profile
+    version = current_profile_version(client)
+    return cached_profile_value(
+        f"learning:{client_id}:{version}",
+        lambda: _build_learning_profile(client_id),
+    )
 
 
 def _feature_label(feature):
@@ -171,28 +403,186 @@ def _feature_label(feature):
     return f"{labels.get(category, category)} {value.replace('_', ' ')}"
 
 
-def learned_score_adjustment(client, title="", content="", source="", provider=""):
+LEARNING_TOP_FEATURES = 5
+LEARNING_REASON_FEATURES = 3
+LEARNING_ADJUSTMENT_SCALE = 6
+
+
+class LearningVector:
+    """Pesos do perfil de aprendizado como vetor esparso indexado por feature.
+
+    O vocabulário é exato (sem hashing com colisões), de modo que ajustes e
+    explicações saem idênticos aos da busca feature a feature.
+    """
+
+    def __init__(self, profile):
+        self.accepted = profile["accepted"]
+        self.rejected = profile["rejected"]
+        self.features = tuple(profile["weights"])
+        self.columns = {feature: column for column, feature in enumerate(self.features)}
+        self.weights = np.fromiter(profile["weights"].values(), dtype=np.float64, count=len(self.features))
+
+    def adjustments(self, feature_sets) -> list[tuple[int, str]]:
+        """Ajuste e explicação de cada conjunto de features, na mesma ordem."""
+        results = [(0, "")] * len(feature_sets)
+        rows, columns = [], []
+        lookup = self.columns.get
+        for row, features in enumerate(feature_sets):
+            for feature in features:
+                column = lookup(feature)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+        if not rows:
+            return results
+
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        weights = self.weights[columns]
+        # Por linha: maior |peso| primeiro, empates na ordem de iteração das
+        # features (a mesma estabilidade de sorted(..., reverse=True)).
+        order = np.lexsort((np.arange(len(rows)), -np.abs(weights), rows))
+        rows, columns, weights = rows[order], columns[order], weights[order]
+        rank = np.arange(len(rows)) - np.searchsorted(rows, rows, side="left")
+        top = rank < LEARNING_TOP_FEATURES
+        top_rows = rows[top]
+        totals = np.bincount(top_rows, weights=weights[top], minlength=len(feature_sets))
+        counts = np.bincount(top_rows, minlength=len(feature_sets))
+
+        max_adjustment = max(1, getattr(settings, "VALIDATION_LEARNING_MAX_ADJUSTMENT", 12))
+        sample_count = self.accepted + self.rejected
+        labelled = rank < LEARNING_REASON_FEATURES
+        labels = defaultdict(list)
+        for row, column in zip(rows[labelled].tolist(), columns[labelled].tolist()):
+            labels[row].append(self.features[column])
+        for row in np.flatnonzero(counts).tolist():
+            raw_adjustment = float(totals[row]) / int(counts[row]) * LEARNING_ADJUSTMENT_SCALE
+            adjustment = max(-max_adjustment, min(max_adjustment, int(round(raw_adjustment))))
+            if adjustment == 0:
+                continue
+            signals = ", ".join(_feature_label(feature) for feature in labels[row])
+            results[row] = (
+                adjustment,
+                f"aprendizado manual {adjustment:+d} ({signals}; {sample_count} exemplos)",
+            )
+        return results
+
+
+def get_client_learning_vector(client):
+    """``LearningVector`` do perfil atual do cliente, ou None sem aprendizado ativo."""
     profile = get_client_learning_profile(client)
     if not profile["active"] or not profile["weights"]:
-        return 0, ""
+        return None
+    return cached_profile_value(
+        f"learning-vector:{int(client.pk)}:{current_profile_version(client)}",
+        lambda: LearningVector(profile),
+    )
 
-    features = extract_learning_features(title, content, source, provider)
-    matched = [
-        (feature, profile["weights"][feature])
-        for feature in features
-        if feature in profile["weights"]
-    ]
-    if not matched:
-        return 0, ""
-
-    strongest = sorted(matched, key=lambda item: abs(item[1]), reverse=True)[:5]
-    raw_adjustment = sum(weight for _, weight in strongest) / len(strongest) * 6
-    max_adjustment = max(1, getattr(settings, "VALIDATION_LEARNING_MAX_ADJUSTMENT", 12))
-    adjustment = max(-max_adjustment, min(max_adjustment, int(round(raw_adjustment))))
-    if adjustment == 0:
-        return 0, ""
-
-    signals = ", ".join(_feature_label(feature) for feature, _ in strongest[:3])
-    sample_count = profile["accepted"] + profile["rejected"]
-    reason = f"aprendizado manual {adjustment:+d} ({signals}; {sample_count} exemplos)"
-    return adjustment, reason
+
+def learned_score_adjustments(client, candidates) -> list[tuple[int, str]]:
+    """Ajustes do aprendizado para vários candidatos ``(title, content, source, provider)``."""
+    candidates = list(candidates)
+    vector = get_client_learning_vector(client)
+    if vector is None:
+        return [(0, "")] * len(candidates)
+    return vector.adjustments(
+        [extract_learning_features(title, content, source, provider) for title, content, source, provider in candidates]
+    )
+
+
+def learned_score_adjustment(client, title="", content="", source="", provider=""):
+    return learned_score_adjustments(client, [(title, content, source, provider)])[0]
+
+
+@transaction.atomic
+def moved_learning_features(client_id, deltas, total_delta):
+    """Features cujo peso se afastou o bastante do usado na última repontuação.
+
+    Chamada depois de ``apply_feature_deltas``, na mesma transação. Cada
+    decisão move os pesos pouco; a comparação é com o que foi usado da última
+    vez que as notícias foram repontuadas (``scored_accepted``/``scored_rejected``
+    de cada feature e os totais de ``LearningRescoreState``), então os
+    deslocamentos se acumulam até passar do limite. Um peso que varia ``d``
+    move o ajuste em até ``d * LEARNING_ADJUSTMENT_SCALE`` pontos; só entram as
+    features acima de LEARNING_RESCORE_MIN_SCORE_CHANGE pontos (ou que
+    entram/saem do perfil), e o retrato delas avança para as contagens atuais.
+    Devolve None quando a mudança atinge todas as notícias (aprendizado
+    ligado/desligado ou totais que deslocaram todos os pesos além do limite);
+    nesse caso o retrato do cliente inteiro avança.
+    """
+    from newsclip.models import LearningFeatureCount, LearningRescoreState
+
+    if not getattr(settings, "VALIDATION_LEARNING_ENABLED", True):
+        return []
+    threshold = max(0, getattr(settings, "LEARNING_RESCORE_MIN_SCORE_CHANGE", 1)) / LEARNING_ADJUSTMENT_SCALE
+    totals = learning_totals(client_id)
+    accepted_total, rejected_total = totals.get("ACCEPTED", 0), totals.get("REJECTED", 0)
+    state, _created = LearningRescoreState.objects.select_for_update().get_or_create(
+        client_id=client_id,
+        # Sem retrato ainda: as notícias foram pontuadas com os totais anteriores a esta decisão.
+        defaults={
+            "accepted_total": max(0, accepted_total - total_delta[0]),
+            "rejected_total": max(0, rejected_total - total_delta[1]),
+        },
+    )
+    scored_accepted_total, scored_rejected_total = state.accepted_total, state.rejected_total
+    active = learning_active(accepted_total, rejected_total)
+    if active != learning_active(scored_accepted_total, scored_rejected_total):
+        mark_learning_rescored(client_id, None, totals=(accepted_total, rejected_total))
+        return None
+    if not active:
+        return []
+    # Todo peso carrega log((R + 2) / (A + 2)): mudar os totais desloca todos juntos.
+    shift = math.log((rejected_total + 2) / (scored_rejected_total + 2)) - math.log(
+        (accepted_total + 2) / (scored_accepted_total + 2)
+    )
+    if abs(shift) > threshold:
+        mark_learning_rescored(client_id, None, totals=(accepted_total, rejected_total))
+        return None
+
+    min_occurrences = min_feature_occurrences()
+    features = list(deltas)
+    counts = {}
+    for offset in range(0, len(features), FEATURE_QUERY_CHUNK):
+        counts.update(
+            (row[0], row[1:])
+            for row in LearningFeatureCount.objects.filter(
+                client_id=client_id,
+                feature__in=features[offset:offset + FEATURE_QUERY_CHUNK],
+            ).values_list("feature", "accepted", "rejected", "scored_accepted", "scored_rejected")
+        )
+
+    def weight(accepted, rejected, accepted_total, rejected_total):
+        if accepted + rejected < min_occurrences:
+            return None
+        return feature_weight(accepted, rejected, accepted_total, rejected_total)
+
+    moved = []
+    for feature in features:
+        accepted, rejected, scored_accepted, scored_rejected = counts.get(feature, (0, 0, 0, 0))
+        new = weight(accepted, rejected, accepted_total, rejected_total)
+        old = weight(scored_accepted, scored_rejected, scored_accepted_total, scored_rejected_total)
+        if (old is None) != (new is None) or (new is not None and abs(new - old) > threshold):
+            moved.append(feature)
+    mark_learning_rescored(client_id, moved)
+    return moved
+
+
+def mark_learning_rescored(client_id, features, totals=None):
+    """Avança o retrato das ``features`` (None: de todas, com os ``totals`` atuais) para as contagens atuais."""
+    from newsclip.models import LearningFeatureCount, LearningRescoreState
+
+    rows = LearningFeatureCount.objects.filter(client_id=client_id)
+    if features is None:
+        rows.update(scored_accepted=F("accepted"), scored_rejected=F("rejected"))
+        rows.filter(accepted=0, rejected=0).delete()
+        LearningRescoreState.objects.filter(client_id=client_id).update(
+            accepted_total=totals[0],
+            rejected_total=totals[1],
+            updated_at=timezone.now(),
+        )
+        return
+    for offset in range(0, len(features), FEATURE_QUERY_CHUNK):
+        chunk = rows.filter(feature__in=features[offset:offset + FEATURE_QUERY_CHUNK])
+        chunk.update(scored_accepted=F("accepted"), scored_rejected=F("rejected"))
+        chunk.filter(accepted=0, rejected=0).delete()
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from newsclip.models import Article
+from newsclip.utils import article_title_fingerprint, article_url_hash
+
+
+class Command(BaseCommand):
+    help = (
+        "Preenche title_fingerprint e url_hash de noticias antigas em lotes por id. "
+        "Pode ser interrompido e executado de novo: so processa linhas ainda sem hash."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Noticias por lote (padrao: 1000)")
+        parser.add_argument("--after-id", type=int, default=0, help="Retoma a partir deste id de noticia")
+        parser.add_argument("--limit", type=int, help="Limite opcional de noticias a processar")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        limit = options.get("limit")
+        last_id = options["after_id"]
+        processed = 0
+        updated = 0
+        pending = Article.objects.filter(Q(title_fingerprint="") | Q(url_hash="")).order_by("pk")
+
+        while limit is None or processed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - processed)
+            batch = list(pending.filter(pk__gt=last_id).only("pk", "title", "url", "source")[:size])
+            if not batch:
+                break
+            changed = []
+            for article in batch:
+                title_fingerprint = article_title_fingerprint(article.title or "", article.source or "")
+                url_hash = article_url_hash(article.url or "")
+                if (title_fingerprint, url_hash) != (article.title_fingerprint, article.url_hash):
+                    article.title_fingerprint = title_fingerprint
+                    article.url_hash = url_hash
+                    changed.append(article)
+            if changed:
+                # bulk_update nao dispara sinais: o search_vector fica intacto.
+                Article.objects.bulk_update(changed, ["title_fingerprint", "url_hash"])
+            processed += len(batch)
+            updated += len(changed)
+            last_id = batch[-1].pk
+            self.stdout.write(f"Ate id {last_id}: {processed} processadas, {updated} atualizadas.")
+
+        self.stdout.write(self.style.SUCCESS(f"Concluido: {processed} processadas, {updated} atualizadas (ultimo id {last_id})."))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from newsclip.learning import index_article_learning_features
+from newsclip.models import Article
+
+
+class Command(BaseCommand):
+    help = (
+        "Preenche o indice invertido de features do aprendizado das noticias antigas em lotes por id. "
+        "Pode ser interrompido e executado de novo: features ja indexadas sao ignoradas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Noticias por lote (padrao: 500)")
+        parser.add_argument("--after-id", type=int, default=0, help="Retoma a partir deste id de noticia")
+        parser.add_argument("--client-id", type=int, help="Somente as noticias deste cliente")
+        parser.add_argument("--limit", type=int, help="Limite opcional de noticias a processar")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        limit = options.get("limit")
+        last_id = options["after_id"]
+        processed = 0
+        indexed = 0
+        pending = Article.objects.order_by("pk")
+        if options.get("client_id"):
+            pending = pending.filter(client_id=options["client_id"])
+
+        while limit is None or processed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - processed)
+            batch = list(
+                pending.filter(pk__gt=last_id).only("pk", "client", "title", "content", "summary", "source", "provider")[:size]
+            )
+            if not batch:
+                break
+            indexed += index_article_learning_features(batch)
+            processed += len(batch)
+            last_id = batch[-1].pk
+            self.stdout.write(f"Ate id {last_id}: {processed} processadas, {indexed} features.")
+
+        self.stdout.write(self.style.SUCCESS(f"Concluido: {processed} processadas, {indexed} features (ultimo id {last_id})."))
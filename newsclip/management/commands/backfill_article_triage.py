@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from newsclip.models import Article, Client
+from newsclip.utils import TRIAGE_FIELDS, apply_triage_fields
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula os campos de prioridade de triagem (faixa de score, fonte confiavel, ordem da fonte, "
+        "identidade visivel e grupo da materia) das noticias antigas em lotes por id. "
+        "Pode ser interrompido e executado de novo: noticias ja corretas nao sao regravadas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Noticias por lote (padrao: 500)")
+        parser.add_argument("--after-id", type=int, default=0, help="Retoma a partir deste id de noticia")
+        parser.add_argument("--client-id", type=int, help="Somente as noticias deste cliente")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        last_id = options["after_id"]
+        processed = 0
+        updated = 0
+        clients = {}
+        pending = Article.objects.order_by("pk").only(
+            "pk", "client", "title", "url", "source", "relevance_score", *TRIAGE_FIELDS
+        )
+        if options.get("client_id"):
+            pending = pending.filter(client_id=options["client_id"])
+
+        while batch := list(pending.filter(pk__gt=last_id)[:batch_size]):
+            by_client = {}
+            for article in batch:
+                by_client.setdefault(article.client_id, []).append(article)
+            changed = []
+            for client_id, articles in by_client.items():
+                if client_id not in clients:
+                    clients[client_id] = Client.objects.get(pk=client_id)
+                changed.extend(apply_triage_fields(clients[client_id], articles))
+            if changed:
+                Article.objects.bulk_update(changed, TRIAGE_FIELDS)
+            processed += len(batch)
+            updated += len(changed)
+            last_id = batch[-1].pk
+            self.stdout.write(f"Ate id {last_id}: {processed} processadas, {updated} atualizadas.")
+
+        self.stdout.write(self.style.SUCCESS(f"Concluido: {processed} processadas, {updated} atualizadas (ultimo id {last_id})."))
@@ -11,6 +11,7 @@ import unicodedata
 from urllib.parse import quote_plus, urljoin, urlparse
 from pathlib import Path
 from bs4 import BeautifulSoup
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -21,7 +22,15 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone as dj_timezone
 from django.db import IntegrityError
 
-from newsclip.discovery import discover_client_sources, fetch_sitemap_endpoint
+from newsclip import http_client, politeness
+from newsclip.async_engine import AsyncFetchEngine
+from newsclip.discovery import (
+    USER_AGENT,
+    collect_sitemap_feed,
+    discover_client_sources,
+    is_public_http_url,
+    save_sitemap_items,
+)
 from newsclip.google_cse import fetch_google_cse
 from newsclip.models import Client, Article, Source, SourceEndpoint, FetchLog
 from newsclip.providers import fetch_gdelt, fetch_youtube
@@ -31,10 +40,13 @@ from newsclip.utils import (
     build_essential_source_queries,
     client_context_terms,
     client_positive_terms,
+    conditional_get,
     record_endpoint_failure,
     record_endpoint_success,
+    remember_fetch_validators,
     sanitize_sensitive_text,
     save_article,
+    save_articles,
 )
 
 from newsapi import NewsApiClient # type: ignore
@@ -54,6 +66,14 @@ GOOGLE_RSS_QUICK_MAX_QUERIES = config("GOOGLE_RSS_QUICK_MAX_QUERIES", default=8,
 GOOGLE_RSS_QUICK_ESSENTIAL_SOURCE_QUERIES = config("GOOGLE_RSS_QUICK_ESSENTIAL_SOURCE_QUERIES", default=18, cast=int)
 BRAVE_SEARCH_QUICK_MAX_QUERIES = config("BRAVE_SEARCH_QUICK_MAX_QUERIES", default=3, cast=int)
 BRAVE_SEARCH_QUICK_RESULTS_PER_QUERY = config("BRAVE_SEARCH_QUICK_RESULTS_PER_QUERY", default=10, cast=int)
+SHARED_FEED_WORKERS = config("SHARED_FEED_WORKERS", default=8, cast=int)
+# Download de feeds: prazos de conexão/leitura, prazo total e teto de bytes.
+FEED_CONNECT_TIMEOUT = config("FEED_CONNECT_TIMEOUT", default=5, cast=int)
+FEED_READ_TIMEOUT = config("FEED_READ_TIMEOUT", default=15, cast=int)
+FEED_TOTAL_TIMEOUT = config("FEED_TOTAL_TIMEOUT", default=30, cast=int)
+FEED_MAX_BYTES = config("FEED_MAX_BYTES", default=5 * 1024 * 1024, cast=int)
+GOOGLE_RSS_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; ClippingApp/1.0)"}
+SCRAPE_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)'}
 
 # Variáveis de API lidas do .env ou ambiente
 NEWSDATA_KEY = config("NEWSDATA_API_KEY", default=None)
@@ -72,6 +92,47 @@ def contains_keyword(text: str, keywords) -> bool:
     normalized_text = normalize_for_match(text)
     return any(normalize_for_match(keyword) in normalized_text for keyword in keywords)
 
+
+@dataclass(frozen=True)
+class FeedEntry:
+    """Entrada já interpretada de um feed/scrape, pronta para casar com clientes."""
+    title: str
+    url: str
+    content_text: str | None = None
+    raw_date: str | None = None
+    match_text: str = ""
+
+
+@dataclass
+class SharedFeed:
+    """Fonte global baixada uma única vez na execução e reaproveitada por cliente."""
+    label: str
+    source: Source
+    provider: str
+    query: str
+    entries: list = field(default_factory=list)
+    endpoint: SourceEndpoint | None = None
+    # Resposta cujos validadores (ETag/Last-Modified/hash) serão gravados ao
+    # fim da execução; ``unchanged`` indica 304 ou corpo idêntico ao anterior.
+    response: requests.Response | None = None
+    unchanged: bool = False
+    # Sitemaps são lidos em blocos: o SHA-256 do corpo vem calculado da leitura.
+    content_hash: str = ""
+
+    @property
+    def validator_target(self):
+        return self.endpoint or self.source
+
+
+@dataclass
+class ClientPlan:
+    """Termos de um cliente já montados para as consultas da execução."""
+    kws: list
+    search_queries: list
+    essential_source_queries: list
+    match_terms: list
+
+
 def build_advanced_query(keywords, operators=None):
     if not keywords: return ""
     if not operators:
@@ -151,6 +212,10 @@ class Command(BaseCommand):
             "--quick", action="store_true",
             help="Executa uma busca rápida para uso interativo no painel.",
         )
+        parser.add_argument(
+            "--engine", choices=["threads", "async"], default="threads",
+            help="Motor de coleta: threads por cliente (padrão) ou asyncio com orçamento global de conexões.",
+        )
 
     def log(self, message, level='INFO', client=None, source=None):
         """Helper para logar no stdout e no banco"""
@@ -187,142 +252,70 @@ class Command(BaseCommand):
         ensure_essential_news_sources()
         utc_now = dj_timezone.now()
         since_dt = utc_now - timedelta(days=LOOKBACK_DAYS)
+        # GET condicional só na coleta de todos os clientes: numa execução de
+        # um cliente só, um 304 esconderia dos demais entradas que eles ainda
+        # não viram.
+        conditional = client_id is None
+
+        if options.get("engine") == "async":
+            overall_total = AsyncFetchEngine(
+                self,
+                list(clients),
+                since_dt,
+                utc_now,
+                quick_run=quick_run,
+                force_run=force_run,
+                conditional=conditional,
+            ).run()
+        else:
+            overall_total = self._run_threaded(clients, since_dt, utc_now, quick_run, force_run, conditional)
+
+        self.log(f"Execução Finalizada. Total geral: {overall_total}", level='SUCCESS')
+
+    def _run_threaded(self, clients, since_dt, utc_now, quick_run, force_run, conditional):
         overall_total = 0
+        # No modo rápido do painel entram só os feeds RSS (cadastrados e
+        # descobertos), cujo download tem prazo total; sitemaps e scrapes,
+        # que podem abrir várias páginas, ficam para a coleta completa.
+        shared_feeds = self.collect_shared_feeds(since_dt, conditional=conditional, rss_only=quick_run)
+        sitemap_page_cache = {}
 
         for client in clients:
             self.log(f"--- Processando cliente: {client.name} ---", client=client)
-            # Termos separados por função: identidade forte fica no perfil do cliente;
-            # termos complementares/legados entram apenas como contexto.
-            kws = client_context_terms(client)
-            search_queries = build_client_search_queries(
-                client,
-                max_queries=max(MAX_GOOGLE_RSS_QUERIES, 20),
-            )
-            essential_source_queries = build_essential_source_queries(
-                client,
-                max_sources=max(1, MAX_GOOGLE_RSS_ESSENTIAL_SOURCE_QUERIES),
-            )
-
-            if not search_queries:
-                self.log(f"Cliente {client.name}: sem identidade de busca definida. Pulando.", level='WARNING', client=client)
+            plan = self.client_plan(client)
+            if plan is None:
                 continue
 
-            match_terms = client_positive_terms(client)
+            discovery_stats = self.run_discovery(client, plan, quick_run, force_run)
 
-            discovery_stats = {
-                "queries": 0,
-                "results": 0,
-                "relevant": 0,
-                "new_sources": 0,
-                "articles": 0,
-            }
-            if quick_run:
-                discovery_stats = discover_client_sources(
-                    client,
-                    kws,
-                    log=self.log,
-                    force=force_run,
-                    max_queries=BRAVE_SEARCH_QUICK_MAX_QUERIES,
-                    results_per_query=BRAVE_SEARCH_QUICK_RESULTS_PER_QUERY,
-                    profile_limit=0,
-                )
-            else:
-                discovery_stats = discover_client_sources(client, kws, log=self.log, force=force_run)
-            if discovery_stats["queries"]:
-                self.log(
-                    "Descoberta Brave: "
-                    f"{discovery_stats['queries']} consultas, "
-                    f"{discovery_stats['results']} resultados, "
-                    f"{discovery_stats['relevant']} relevantes, "
-                    f"{discovery_stats['new_sources']} novas fontes e "
-                    f"{discovery_stats['articles']} noticias novas.",
-                    level='SUCCESS',
-                    client=client,
-                )
-            
             futures_map = {}
             with ThreadPoolExecutor(max_workers=5) as executor:
-                # 1. APIs Pagas (NewsAPI, NewsData)
-                if not quick_run and (NEWSAPI_KEY or force_run):
-                    futures_map[executor.submit(self.fetch_newsapi, client, search_queries, since_dt, utc_now)] = "NewsAPI"
-                elif not quick_run:
-                    self.log(f"NewsAPI KEY não configurada. Pulando.", level='WARNING', client=client)
-
-                if not quick_run and (NEWSDATA_KEY or force_run):
-                    futures_map[executor.submit(self.fetch_newsdata, client, search_queries, since_dt, utc_now)] = "NewsData"
-                elif not quick_run:
-                    self.log(f"NewsData KEY não configurada. Pulando.", level='WARNING', client=client)
-                
+                # 1. APIs (NewsAPI, NewsData, Google CSE, GDELT, YouTube)
+                for label, func, args, kwargs in self.provider_jobs(client, plan, since_dt, utc_now, quick_run, force_run):
+                    futures_map[executor.submit(func, *args, **kwargs)] = label
+
                 # 2. Google RSS (Busca Dinâmica)
-                # Buscas comuns e fontes essenciais rodam em lotes separados.
-                # Assim, consultas site:g1/site:diario/etc. nunca são cortadas
-                # pelo limite das queries comuns e a coleta não fica presa em
-                # uma sequência longa de requests.
-                futures_map[
-                    executor.submit(
-                        self.fetch_google_rss,
-                        client,
-                        search_queries,
-                        since_dt,
-                        max_queries=GOOGLE_RSS_QUICK_MAX_QUERIES if quick_run else MAX_GOOGLE_RSS_QUERIES,
-                    )
-                ] = "GoogleRSS"
-                if essential_source_queries:
+                for label, queries, max_queries in self.google_rss_batches(plan, quick_run):
+                    futures_map[
+                        executor.submit(self.fetch_google_rss, client, queries, since_dt, max_queries=max_queries)
+                    ] = label
+
+                # 3. Fontes do Banco de Dados (RSS, Scrape e endpoints descobertos)
+                # Os feeds globais já foram baixados uma única vez antes do laço
+                # de clientes; aqui apenas casamos as entradas com os termos.
+                for shared_feed in shared_feeds:
+                    if shared_feed.unchanged:
+                        continue
                     futures_map[
                         executor.submit(
-                            self.fetch_google_rss,
+                            self.save_shared_feed,
                             client,
-                            essential_source_queries,
-                            since_dt,
-                            max_queries=(
-                                GOOGLE_RSS_QUICK_ESSENTIAL_SOURCE_QUERIES
-                                if quick_run
-                                else MAX_GOOGLE_RSS_ESSENTIAL_SOURCE_QUERIES
-                            ),
+                            shared_feed,
+                            plan.match_terms,
+                            sitemap_page_cache,
                         )
-                    ] = "GoogleRSS fontes essenciais"
-
-                if getattr(settings, "GOOGLE_CSE_ENABLED", True):
-                    if getattr(settings, "GOOGLE_API_KEY", "") and getattr(settings, "GOOGLE_CSE_ID", ""):
-                        futures_map[
-                            executor.submit(
-                                fetch_google_cse,
-                                client,
-                                since_dt,
-                                self.log,
-                                quick=quick_run,
-                            )
-                        ] = "Google CSE"
-
-                if not quick_run and getattr(settings, "GDELT_ENABLED", True):
-                    futures_map[executor.submit(fetch_gdelt, client, kws, since_dt, self.log)] = "GDELT"
-
-                if getattr(settings, "YOUTUBE_API_KEY", "") or client.youtube:
-                    futures_map[executor.submit(fetch_youtube, client, kws, since_dt, self.log)] = "YouTube"
-
-                # 3. Fontes do Banco de Dados (RSS e Scrape)
-                # No modo rápido do painel, evitamos feeds/sitemaps descobertos:
-                # feedparser.parse(url) pode ficar preso em rede e deixar o botão
-                # aguardando por vários minutos. A coleta completa continua
-                # disponível pelo comando normal/agendado.
-                if not quick_run:
-                    active_sources = Source.objects.filter(is_active=True)
-                    for source in active_sources:
-                        if source.source_type == 'RSS':
-                            futures_map[executor.submit(self.fetch_single_rss, client, source, match_terms, since_dt)] = f"RSS: {source.name}"
-                        elif source.source_type == 'SCRAPE':
-                            futures_map[executor.submit(self.fetch_single_scrape, client, source, match_terms)] = f"Scrape: {source.name}"
-
-                    active_endpoints = SourceEndpoint.objects.filter(
-                        is_active=True,
-                        source__is_active=True,
-                    ).select_related("source")
-                    for endpoint in active_endpoints:
-                        if endpoint.endpoint_type == "RSS":
-                            futures_map[executor.submit(self.fetch_endpoint_rss, client, endpoint, match_terms, since_dt)] = f"RSS descoberto: {endpoint.source.name}"
-                        elif endpoint.endpoint_type in {"SITEMAP", "NEWS_SITEMAP"}:
-                            futures_map[executor.submit(fetch_sitemap_endpoint, self, client, endpoint, match_terms, since_dt)] = f"Sitemap: {endpoint.source.name}"
-                
+                    ] = shared_feed.label
+
                 client_total_saved = discovery_stats["articles"]
                 for future in as_completed(futures_map):
                     source_name = futures_map[future]
@@ -334,13 +327,123 @@ class Command(BaseCommand):
                     except Exception as e:
                         self.log(f"ERRO na fonte {source_name}: {e}", level='ERROR', client=client)
 
-            if client_total_saved > 0:
-                self.log(f"Total de {client_total_saved} notícia(s) salva(s) para {client.name}.", level='SUCCESS', client=client)
-            else:
-                self.log(f"Nenhuma notícia nova salva para {client.name}.", level='INFO', client=client)
+            self.log_client_total(client, client_total_saved)
             overall_total += client_total_saved
 
-        self.log(f"Execução Finalizada. Total geral: {overall_total}", level='SUCCESS')
+        if conditional:
+            self.remember_shared_feed_validators(shared_feeds)
+        return overall_total
+
+    def client_plan(self, client):
+        """Monta os termos do cliente; ``None`` quando não há identidade de busca."""
+        # Termos separados por função: identidade forte fica no perfil do cliente;
+        # termos complementares/legados entram apenas como contexto.
+        search_queries = build_client_search_queries(
+            client,
+            max_queries=max(MAX_GOOGLE_RSS_QUERIES, 20),
+        )
+        if not search_queries:
+            self.log(f"Cliente {client.name}: sem identidade de busca definida. Pulando.", level='WARNING', client=client)
+            return None
+        return ClientPlan(
+            kws=client_context_terms(client),
+            search_queries=search_queries,
+            essential_source_queries=build_essential_source_queries(
+                client,
+                max_sources=max(1, MAX_GOOGLE_RSS_ESSENTIAL_SOURCE_QUERIES),
+            ),
+            match_terms=client_positive_terms(client),
+        )
+
+    def run_discovery(self, client, plan, quick_run, force_run):
+        if quick_run:
+            discovery_stats = discover_client_sources(
+                client,
+                plan.kws,
+                log=self.log,
+                force=force_run,
+                max_queries=BRAVE_SEARCH_QUICK_MAX_QUERIES,
+                results_per_query=BRAVE_SEARCH_QUICK_RESULTS_PER_QUERY,
+                profile_limit=0,
+            )
+        else:
+            discovery_stats = discover_client_sources(client, plan.kws, log=self.log, force=force_run)
+        if discovery_stats["queries"]:
+            self.log(
+                "Descoberta Brave: "
+                f"{discovery_stats['queries']} consultas, "
+                f"{discovery_stats['results']} resultados, "
+                f"{discovery_stats['relevant']} relevantes, "
+                f"{discovery_stats['new_sources']} novas fontes e "
+                f"{discovery_stats['articles']} noticias novas.",
+                level='SUCCESS',
+                client=client,
+            )
+        return discovery_stats
+
+    def provider_jobs(self, client, plan, since_dt, utc_now, quick_run, force_run):
+        """Lista ``(rótulo, função, args, kwargs)`` das APIs habilitadas para o cliente."""
+        jobs = []
+        if not quick_run and (NEWSAPI_KEY or force_run):
+            jobs.append(("NewsAPI", self.fetch_newsapi, (client, plan.search_queries, since_dt, utc_now), {}))
+        elif not quick_run:
+            self.log(f"NewsAPI KEY não configurada. Pulando.", level='WARNING', client=client)
+
+        if not quick_run and (NEWSDATA_KEY or force_run):
+            jobs.append(("NewsData", self.fetch_newsdata, (client, plan.search_queries, since_dt, utc_now), {}))
+        elif not quick_run:
+            self.log(f"NewsData KEY não configurada. Pulando.", level='WARNING', client=client)
+
+        if getattr(settings, "GOOGLE_CSE_ENABLED", True):
+            if getattr(settings, "GOOGLE_API_KEY", "") and getattr(settings, "GOOGLE_CSE_ID", ""):
+                jobs.append(("Google CSE", fetch_google_cse, (client, since_dt, self.log), {"quick": quick_run}))
+
+        if not quick_run and getattr(settings, "GDELT_ENABLED", True):
+            jobs.append(("GDELT", fetch_gdelt, (client, plan.kws, since_dt, self.log), {}))
+
+        if getattr(settings, "YOUTUBE_API_KEY", "") or client.youtube:
+            jobs.append(("YouTube", fetch_youtube, (client, plan.kws, since_dt, self.log), {}))
+        return jobs
+
+    def google_rss_batches(self, plan, quick_run):
+        """Lotes ``(rótulo, consultas, limite)`` de busca no Google News RSS.
+
+        Buscas comuns e fontes essenciais rodam em lotes separados. Assim,
+        consultas site:g1/site:diario/etc. nunca são cortadas pelo limite das
+        queries comuns e a coleta não fica presa em uma sequência longa de
+        requests.
+        """
+        batches = [
+            (
+                "GoogleRSS",
+                plan.search_queries,
+                GOOGLE_RSS_QUICK_MAX_QUERIES if quick_run else MAX_GOOGLE_RSS_QUERIES,
+            )
+        ]
+        if plan.essential_source_queries:
+            batches.append(
+                (
+                    "GoogleRSS fontes essenciais",
+                    plan.essential_source_queries,
+                    GOOGLE_RSS_QUICK_ESSENTIAL_SOURCE_QUERIES if quick_run else MAX_GOOGLE_RSS_ESSENTIAL_SOURCE_QUERIES,
+                )
+            )
+        return batches
+
+    def log_client_total(self, client, client_total_saved):
+        if client_total_saved > 0:
+            self.log(f"Total de {client_total_saved} notícia(s) salva(s) para {client.name}.", level='SUCCESS', client=client)
+        else:
+            self.log(f"Nenhuma notícia nova salva para {client.name}.", level='INFO', client=client)
+
+    def remember_shared_feed_validators(self, shared_feeds):
+        # Validadores só depois de todos os clientes processados: se a
+        # execução cair no meio, a próxima baixa e casa o conteúdo de novo.
+        for shared_feed in shared_feeds:
+            if shared_feed.response is not None:
+                remember_fetch_validators(
+                    shared_feed.validator_target, shared_feed.response, shared_feed.content_hash or None
+                )
 
     def _get_content_from_entry(self, entry):
         if hasattr(entry, 'content') and entry.content:
@@ -368,13 +471,13 @@ class Command(BaseCommand):
                     'from_date': newsdata_since.strftime('%Y-%m-%d'),
                     'to_date': until_dt.strftime('%Y-%m-%d'),
                 }
-                response = requests.get(NEWSDATA_URL, params=params, timeout=30)
+                response = http_client.get(NEWSDATA_URL, params=params, timeout=30)
                 if response.status_code == 422:
                     error_message = response.json().get('results', {}).get('message', response.text)
                     if "from_date" in error_message:
                         params.pop('from_date', None)
                         params.pop('to_date', None)
-                        response = requests.get(NEWSDATA_URL, params=params, timeout=30)
+                        response = http_client.get(NEWSDATA_URL, params=params, timeout=30)
 
                 response.raise_for_status()
                 data = response.json()
@@ -397,7 +500,7 @@ class Command(BaseCommand):
                     if not next_page:
                         break
                     params["page"] = next_page
-                    response = requests.get(NEWSDATA_URL, params=params, timeout=30)
+                    response = http_client.get(NEWSDATA_URL, params=params, timeout=30)
                     response.raise_for_status()
                     data = response.json()
         except Exception as e:
@@ -408,51 +511,18 @@ class Command(BaseCommand):
         count_saved = 0
         if not keywords_list: return 0
         try:
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; ClippingApp/1.0)"}
-            # Consultas separadas evitam que uma expressão OR longa seja truncada
-            # e aumentam a cobertura de termos com volumes muito diferentes.
-            selected_keywords = list(dict.fromkeys(keywords_list))[: max_queries or MAX_GOOGLE_RSS_QUERIES]
+            selected_keywords = self.select_google_rss_queries(keywords_list, max_queries)
 
             def fetch_one(keyword):
                 saved_for_keyword = 0
                 try:
-                    query_string = f'{keyword} when:{LOOKBACK_DAYS}d'
-                    rss_url = f"https://news.google.com/rss/search?hl=pt-BR&gl=BR&ceid=BR:pt-BR&q={quote_plus(query_string)}"
-                    response = requests.get(rss_url, headers=headers, timeout=GOOGLE_RSS_REQUEST_TIMEOUT)
-                    response.raise_for_status()
-                    feed = feedparser.parse(response.content)
+                    feed = self.download_google_rss(keyword)
                 except Exception as exc:
                     self.log(f"Google RSS falhou para o termo '{keyword}': {exc}", level='WARNING', client=client)
                     return 0
 
-                for entry in feed.entries:
-                    url = entry.get('link')
-                    title = entry.get('title')
-                    if not url or not title: continue
-
-                    pub_date_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
-                    publication_date = None
-                    if pub_date_parsed:
-                        try:
-                            dt_naive = datetime.fromtimestamp(time.mktime(pub_date_parsed))
-                            publication_date = dj_timezone.make_aware(dt_naive, timezone.utc) if dj_timezone.is_naive(dt_naive) else dt_naive
-                        except (OverflowError, OSError, ValueError):
-                            publication_date = None
-
-                    if publication_date and publication_date < since_dt:
-                        continue
-
-                    content_text = self._get_content_from_entry(entry)
-                    created = save_article(
-                        client=client, title=title, url=url,
-                        raw_date=publication_date.isoformat() if publication_date else None,
-                        source=entry.get('source', {}).get('title') or "Google News",
-                        content_text=content_text,
-                        provider="GOOGLE_RSS",
-                        query=keyword,
-                    )
-                    saved_for_keyword += int(created is not None)
-                return saved_for_keyword
+                articles = list(self.google_rss_articles(feed, keyword, since_dt))
+                return sum(created is not None for created in save_articles(client, articles))
 
             worker_count = max(1, min(GOOGLE_RSS_WORKERS, len(selected_keywords) or 1))
             with ThreadPoolExecutor(max_workers=worker_count) as executor:
@@ -463,106 +533,281 @@ class Command(BaseCommand):
             self.log(f"Erro Google RSS: {e}", level='ERROR', client=client)
         return count_saved
 
-    def fetch_single_rss(self, client, source_obj, keywords_list, since_date_aware):
-        return self._fetch_rss_url(client, source_obj, source_obj.url, keywords_list, since_date_aware)
+    def select_google_rss_queries(self, keywords_list, max_queries=None):
+        # Consultas separadas evitam que uma expressão OR longa seja truncada
+        # e aumentam a cobertura de termos com volumes muito diferentes.
+        return list(dict.fromkeys(keywords_list))[: max_queries or MAX_GOOGLE_RSS_QUERIES]
+
+    def download_google_rss(self, keyword):
+        query_string = f'{keyword} when:{LOOKBACK_DAYS}d'
+        rss_url = f"https://news.google.com/rss/search?hl=pt-BR&gl=BR&ceid=BR:pt-BR&q={quote_plus(query_string)}"
+        response = http_client.get(rss_url, headers=GOOGLE_RSS_HEADERS, timeout=GOOGLE_RSS_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return feedparser.parse(response.content)
+
+    def google_rss_articles(self, feed, keyword, since_dt):
+        """Converte as entradas do Google News nos argumentos de ``save_article``."""
+        articles = []
+        for entry in feed.entries:
+            url = entry.get('link')
+            title = entry.get('title')
+            if not url or not title: continue
+
+            pub_date_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+            publication_date = None
+            if pub_date_parsed:
+                try:
+                    dt_naive = datetime.fromtimestamp(time.mktime(pub_date_parsed))
+                    publication_date = dj_timezone.make_aware(dt_naive, timezone.utc) if dj_timezone.is_naive(dt_naive) else dt_naive
+                except (OverflowError, OSError, ValueError):
+                    publication_date = None
+
+            if publication_date and publication_date < since_dt:
+                continue
 
-    def fetch_endpoint_rss(self, client, endpoint, keywords_list, since_date_aware):
-        try:
-            count = self._fetch_rss_url(
-                client, endpoint.source, endpoint.url, keywords_list, since_date_aware
+            articles.append(
+                {
+                    "title": title,
+                    "url": url,
+                    "raw_date": publication_date.isoformat() if publication_date else None,
+                    "source": entry.get('source', {}).get('title') or "Google News",
+                    "content_text": self._get_content_from_entry(entry),
+                    "provider": "GOOGLE_RSS",
+                    "query": keyword,
+                }
             )
+        return articles
+
+    def _rss_entries(self, feed, since_date_aware):
+        """Interpreta as entradas de um feed uma vez, já filtradas pela janela de datas."""
+        entries = []
+        for entry in feed.entries:
+            url = entry.get('link')
+            title = entry.get('title')
+            if not url or not title: continue
+            content_text = self._get_content_from_entry(entry)
+
+            pub_date_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+            publication_date_aware = None
+            if pub_date_parsed:
+                try:
+                    dt_naive = datetime.fromtimestamp(time.mktime(pub_date_parsed))
+                    publication_date_aware = dj_timezone.make_aware(dt_naive, timezone.utc) if dj_timezone.is_naive(dt_naive) else dt_naive
+                except: publication_date_aware = dj_timezone.now()
+
+            if publication_date_aware and publication_date_aware < since_date_aware: continue
+
+            searchable_text = BeautifulSoup(
+                f"{title} {content_text or ''}", "html.parser"
+            ).get_text(" ", strip=True)
+            entries.append(
+                FeedEntry(
+                    title=title,
+                    url=url,
+                    content_text=content_text,
+                    raw_date=publication_date_aware.isoformat() if publication_date_aware else None,
+                    match_text=normalize_for_match(searchable_text),
+                )
+            )
+        return entries
+
+    def _save_feed_entries(self, client, entries, keywords_list, source_name, provider, query):
+        """Salva para o cliente apenas as entradas que citam algum dos seus termos."""
+        articles = list(self.feed_entry_articles(entries, keywords_list, source_name, provider, query))
+        return sum(created is not None for created in save_articles(client, articles))
+
+    def feed_entry_articles(self, entries, keywords_list, source_name, provider, query):
+        """Argumentos de ``save_article`` das entradas que citam algum dos termos."""
+        normalized_terms = [normalize_for_match(keyword) for keyword in keywords_list]
+        for entry in entries:
+            if not any(term in entry.match_text for term in normalized_terms): continue
+            yield {
+                "title": entry.title,
+                "url": entry.url,
+                "raw_date": entry.raw_date,
+                "source": source_name,
+                "content_text": entry.content_text,
+                "provider": provider,
+                "query": query,
+            }
+
+    def collect_shared_feeds(self, since_dt, conditional=False, rss_only=False):
+        """Baixa cada fonte global (RSS, scrape, RSS/sitemap descoberto) uma única vez.
+
+        O resultado é reaproveitado por todos os clientes da execução, evitando
+        repetir a mesma requisição HTTP para cada cliente processado. Com
+        ``conditional`` as fontes enviam ETag/Last-Modified da última coleta e
+        as que não mudaram voltam marcadas como ``unchanged``, sem entradas.
+        """
+        jobs = self.shared_feed_jobs(rss_only=rss_only)
+        shared_feeds = []
+        if not jobs:
+            return shared_feeds
+        worker_count = max(1, min(SHARED_FEED_WORKERS, len(jobs)))
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = {
+                executor.submit(self._download_shared_feed, label, source, endpoint, since_dt, conditional): label
+                for label, source, endpoint in jobs
+            }
+            for future in as_completed(futures):
+                shared_feed = future.result()
+                if shared_feed is not None:
+                    shared_feeds.append(shared_feed)
+        self.log_shared_feeds(shared_feeds, len(jobs))
+        return shared_feeds
+
+    def shared_feed_jobs(self, rss_only=False):
+        """Lista ``(rótulo, fonte, endpoint)`` das fontes globais ativas."""
+        jobs = []
+        for source in Source.objects.filter(is_active=True, crawl_delay__gt=0).only("url", "crawl_delay"):
+            politeness.scheduler.set_crawl_delay(politeness.host_of(source.url), source.crawl_delay)
+        for source in Source.objects.filter(is_active=True):
+            if source.source_type == 'RSS':
+                jobs.append((f"RSS: {source.name}", source, None))
+            elif source.source_type == 'SCRAPE' and source.title_selector and not rss_only:
+                jobs.append((f"Scrape: {source.name}", source, None))
+
+        active_endpoints = SourceEndpoint.objects.filter(
+            is_active=True,
+            source__is_active=True,
+            endpoint_type__in=["RSS"] if rss_only else ["RSS", "SITEMAP", "NEWS_SITEMAP"],
+        ).select_related("source")
+        for endpoint in active_endpoints:
+            if endpoint.endpoint_type == "RSS":
+                jobs.append((f"RSS descoberto: {endpoint.source.name}", endpoint.source, endpoint))
+            else:
+                jobs.append((f"Sitemap: {endpoint.source.name}", endpoint.source, endpoint))
+        return jobs
+
+    def log_shared_feeds(self, shared_feeds, job_count):
+        total_entries = sum(len(feed.entries) for feed in shared_feeds)
+        unchanged_count = sum(1 for feed in shared_feeds if feed.unchanged)
+        self.log(
+            f"Fontes globais baixadas uma vez: {len(shared_feeds)} de {job_count} "
+            f"({unchanged_count} sem alteração, {total_entries} entradas recentes).",
+        )
+
+    def _download_shared_feed(self, label, source, endpoint, since_dt, conditional=False):
+        if endpoint is None and source.source_type == 'SCRAPE':
+            try:
+                response = conditional_get(
+                    source, source.url, headers=SCRAPE_HEADERS, timeout=20, conditional=conditional
+                )
+                if response is None:
+                    return SharedFeed(label, source, "SCRAPE", source.url, unchanged=True)
+                entries = self._scrape_entries(source, response)
+            except Exception as e:
+                self.log(f"Erro Scrape {source.name}: {e}", level='ERROR', source=source)
+                return None
+            return SharedFeed(label, source, "SCRAPE", source.url, entries, response=response)
+
+        if endpoint is None:
+            try:
+                response = self._download_feed(source, source.url, conditional)
+                if response is None:
+                    return SharedFeed(label, source, "RSS", source.url, unchanged=True)
+                entries = self._rss_entries(feedparser.parse(response.content), since_dt)
+            except Exception as e:
+                self.log(f"Erro RSS {source.name}: {e}", level='ERROR', source=source)
+                return None
+            return SharedFeed(label, source, "RSS", source.url, entries, response=response)
+
+        if endpoint.endpoint_type == "RSS":
+            try:
+                response = self._download_feed(endpoint, endpoint.url, conditional)
+                entries = [] if response is None else self._rss_entries(feedparser.parse(response.content), since_dt)
+            except Exception as exc:
+                record_endpoint_failure(endpoint, exc, log=self.log)
+                return None
             record_endpoint_success(endpoint)
-            return count
-        except Exception as exc:
-            record_endpoint_failure(endpoint, exc, client=client, log=self.log)
-            raise
+            return SharedFeed(
+                label, source, "RSS", endpoint.url, entries, endpoint,
+                response=response, unchanged=response is None,
+            )
 
-    def _fetch_rss_url(self, client, source_obj, feed_url, keywords_list, since_date_aware):
-        count_saved = 0
+        if not is_public_http_url(endpoint.url):
+            return None
         try:
-            feed = feedparser.parse(feed_url)
-            for entry in feed.entries:
-                url = entry.get('link')
-                title = entry.get('title')
-                if not url or not title: continue
-                content_text = self._get_content_from_entry(entry)
-                searchable_text = BeautifulSoup(
-                    f"{title} {content_text or ''}", "html.parser"
-                ).get_text(" ", strip=True)
-                if not contains_keyword(searchable_text, keywords_list): continue
-                
-                pub_date_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
-                publication_date_aware = None
-                if pub_date_parsed:
-                    try:
-                        dt_naive = datetime.fromtimestamp(time.mktime(pub_date_parsed))
-                        publication_date_aware = dj_timezone.make_aware(dt_naive, timezone.utc) if dj_timezone.is_naive(dt_naive) else dt_naive
-                    except: publication_date_aware = dj_timezone.now() 
-                
-                if publication_date_aware and publication_date_aware < since_date_aware: continue
-                
-                source_name = source_obj.name
-                created = save_article(client=client, title=title, url=url,
-                                       raw_date=publication_date_aware.isoformat() if publication_date_aware else None,
-                                       source=source_name, content_text=content_text, provider="RSS",
-                                       query=feed_url)
-                count_saved += int(created is not None)
-        except Exception as e:
-            self.log(f"Erro RSS {source_obj.name}: {e}", level='ERROR', client=client, source=source_obj)
-        return count_saved
+            collected = collect_sitemap_feed(endpoint, since_dt, conditional=conditional)
+        except Exception as exc:
+            record_endpoint_failure(endpoint, exc, log=self.log)
+            return None
+        record_endpoint_success(endpoint)
+        if collected is None:
+            return SharedFeed(label, source, "SITEMAP", endpoint.url, endpoint=endpoint, unchanged=True)
+        items, response, content_hash = collected
+        return SharedFeed(
+            label, source, "SITEMAP", endpoint.url, items, endpoint,
+            response=response, content_hash=content_hash,
+        )
 
-    def fetch_single_scrape(self, client, source_obj, keywords_list):
-        count_saved = 0
-        headers = {'User-Agent': 'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)'}
-        try:
-            response = requests.get(source_obj.url, headers=headers, timeout=20)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Se não tiver seletores definidos, tenta pegar tudo (arriscado, mas fallback)
-            # Idealmente deve ter seletores
-            if not source_obj.title_selector:
-                return 0
-
-            article_blocks = [soup] # Simplificação: assume que a página é uma lista ou busca no corpo todo
-            # Se tiver um seletor de container/item, usaria aqui. Como o modelo simplificado não tem 'item_selector',
-            # vamos buscar os títulos diretamente e tentar achar o link parente/próximo.
-            
-            # Melhor abordagem genérica sem item_selector: buscar todos os elementos que casam com title_selector
-            titles = soup.select(source_obj.title_selector)
-            
-            for title_tag in titles:
-                title = title_tag.get_text(strip=True)
-                if not title or not contains_keyword(title, keywords_list): continue
-                
-                # Tenta achar o link: ou é o próprio tag, ou um pai, ou um filho
-                link_tag = None
-                if title_tag.name == 'a': link_tag = title_tag
-                else:
-                    link_tag = title_tag.find_parent('a') or title_tag.find('a')
-                
-                # Se tiver seletor específico de link, usa ele (assumindo que seja relativo ao container, o que complica sem container definido)
-                # Vamos manter simples: se achou título e link, salva.
-                
-                article_url = None
-                if link_tag:
-                    article_url = link_tag.get('href')
-                elif source_obj.link_selector:
-                     # Tentativa de buscar link separado (muito frágil sem container)
-                     pass
-
-                if not article_url: continue
-                
-                article_url = urljoin(source_obj.url, article_url)
-                
-                created = save_article(client=client, title=title, url=article_url, raw_date=None,
-                                       source=source_obj.name, content_text=None, provider="SCRAPE",
-                                       query=source_obj.url)
-                count_saved += int(created is not None)
+    def _download_feed(self, target, url, conditional):
+        """Baixa o XML do feed; ``None`` quando não mudou desde a última coleta.
+
+        O feedparser nunca faz a própria rede: sem prazo, um servidor lento o
+        prendia por minutos. Aqui o download tem prazo de conexão, de leitura,
+        prazo total e teto de bytes, e o parser recebe só o conteúdo.
+        """
+        return conditional_get(
+            target,
+            url,
+            headers={"User-Agent": USER_AGENT},
+            timeout=(FEED_CONNECT_TIMEOUT, FEED_READ_TIMEOUT),
+            conditional=conditional,
+            max_bytes=FEED_MAX_BYTES,
+            deadline=FEED_TOTAL_TIMEOUT,
+        )
 
-        except Exception as e:
-            self.log(f"Erro Scrape {source_obj.name}: {e}", level='ERROR', client=client, source=source_obj)
-        return count_saved
+    def save_shared_feed(self, client, shared_feed, keywords_list, page_cache=None):
+        if shared_feed.provider == "SITEMAP":
+            return save_sitemap_items(
+                client, shared_feed.endpoint, shared_feed.entries, keywords_list, page_cache=page_cache
+            )
+        return self._save_feed_entries(
+            client,
+            shared_feed.entries,
+            keywords_list,
+            shared_feed.source.name,
+            shared_feed.provider,
+            shared_feed.query,
+        )
+
+    def _scrape_entries(self, source_obj, response):
+        """Extrai pares título/link de uma página de listagem configurada com seletores."""
+        soup = BeautifulSoup(response.text, 'html.parser')
+
+        # Se não tiver seletores definidos, tenta pegar tudo (arriscado, mas fallback)
+        # Idealmente deve ter seletores
+        if not source_obj.title_selector:
+            return []
+
+        # Melhor abordagem genérica sem item_selector: buscar todos os elementos que casam com title_selector
+        titles = soup.select(source_obj.title_selector)
+
+        entries = []
+        for title_tag in titles:
+            title = title_tag.get_text(strip=True)
+            if not title: continue
+
+            # Tenta achar o link: ou é o próprio tag, ou um pai, ou um filho
+            link_tag = None
+            if title_tag.name == 'a': link_tag = title_tag
+            else:
+                link_tag = title_tag.find_parent('a') or title_tag.find('a')
+
+            # Se tiver seletor específico de link, usa ele (assumindo que seja relativo ao container, o que complica sem container definido)
+            # Vamos manter simples: se achou título e link, salva.
+            article_url = link_tag.get('href') if link_tag else None
+            if not article_url: continue
+
+            entries.append(
+                FeedEntry(
+                    title=title,
+                    url=urljoin(source_obj.url, article_url),
+                    match_text=normalize_for_match(title),
+                )
+            )
+        return entries
 
     def fetch_newsapi(self, client, keywords, since_date_aware, until_date_aware):
         count_saved = 0
@@ -14,7 +14,7 @@ from reportlab.lib.units import cm
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
 from newsclip.models import Article, Client, GeneratedReport
-from newsclip.utils import deduplicate_articles_for_display, revalidate_accepted_articles_for_client
+from newsclip.utils import deduplicate_articles_for_display
 
 
 CONTENT_TYPES = {
@@ -61,7 +61,6 @@ class Command(BaseCommand):
             raise CommandError("Informe --days ou as datas de um relatorio personalizado.")
 
         now = timezone.now()
-        revalidate_accepted_articles_for_client(client, limit=3000)
         output_format = options["format"]
         if is_quantitative_report:
             first_articles = self._articles_for_period(client, start_date, end_date)
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from newsclip.learning import rebuild_feature_counts
+from newsclip.models import Client
+from newsclip.profiles import bump_profile_version
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula as contagens de features do aprendizado a partir das decisoes manuais gravadas. "
+        "Use se as contagens incrementais divergirem (ex.: decisoes alteradas direto no banco)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--client-id", type=int, help="ID exato do cliente. Padrao: todos.")
+
+    def handle(self, *args, **options):
+        clients = Client.objects.order_by("pk")
+        if options.get("client_id"):
+            clients = clients.filter(pk=options["client_id"])
+            if not clients.exists():
+                raise CommandError(f"Cliente {options['client_id']} nao encontrado.")
+
+        for client in clients:
+            features = rebuild_feature_counts(client.pk)
+            bump_profile_version(client.pk)
+            self.stdout.write(f"{client.name} [id:{client.pk}]: {features} features")
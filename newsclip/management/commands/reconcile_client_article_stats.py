@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from newsclip.models import Client, ClientArticleStats
+from newsclip.stats import STATS_BUCKETS, rebuild_article_rollups, rebuild_client_article_stats, rollup_changes
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula os contadores de noticias por aba (ClientArticleStats) e os agregados diarios "
+        "(ArticleDailyRollup) a partir das noticias gravadas. "
+        "Use se os contadores incrementais divergirem (ex.: noticias alteradas direto no banco)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--client-id", type=int, help="ID exato do cliente. Padrao: todos.")
+
+    def handle(self, *args, **options):
+        clients = Client.objects.order_by("pk")
+        if options.get("client_id"):
+            clients = clients.filter(pk=options["client_id"])
+            if not clients.exists():
+                raise CommandError(f"Cliente {options['client_id']} nao encontrado.")
+
+        drifted = 0
+        for client in clients:
+            previous = ClientArticleStats.objects.filter(client=client).first()
+            stats = rebuild_client_article_stats(client.pk)
+            differences = [
+                f"{bucket} {getattr(previous, bucket)} -> {getattr(stats, bucket)}"
+                for bucket in STATS_BUCKETS
+                if previous is not None and getattr(previous, bucket) != getattr(stats, bucket)
+            ]
+            previous_rollups, current_rollups = rebuild_article_rollups(client.pk)
+            rollup_drift = sum(abs(delta) for delta in rollup_changes(previous_rollups, current_rollups).values())
+            if rollup_drift:
+                differences.append(f"agregados diarios {rollup_drift} noticia(s)")
+            if differences:
+                drifted += 1
+            summary = ", ".join(differences) if differences else "ok"
+            if previous is None:
+                summary = "criado"
+            self.stdout.write(f"{client.name} [id:{client.pk}]: {summary}")
+        self.stdout.write(self.style.SUCCESS(f"Concluido: {drifted} cliente(s) com divergencia corrigida."))
@@ -22,6 +22,17 @@ class Command(BaseCommand):
             help="Variação de nome/identidade forte a adicionar antes de revalidar. Pode repetir.",
         )
         parser.add_argument("--limit", type=int, help="Limite opcional de artigos a processar")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Noticias pontuadas e gravadas por bloco. Padrao: REVALIDATION_CHUNK_SIZE.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processos que pontuam em paralelo (as gravacoes ficam no processo principal). Padrao: 1.",
+        )
         parser.add_argument("--dry-run", action="store_true", help="Simula sem gravar alteracoes")
 
     def handle(self, *args, **options):
@@ -30,6 +41,11 @@ class Command(BaseCommand):
             raise CommandError(f"Cliente {options['client_id']} nao encontrado.")
 
         dry_run = options["dry_run"]
+        workers = options.get("workers") or 1
+        if workers < 1:
+            raise CommandError("--workers deve ser maior ou igual a 1.")
+        if workers > 1 and options.get("limit"):
+            raise CommandError("--limit nao pode ser combinado com --workers.")
         variations = []
         for raw in options.get("add_name_variation") or []:
             variations.extend(split_terms(raw))
@@ -49,6 +65,11 @@ class Command(BaseCommand):
             statuses=statuses,
             limit=options.get("limit"),
             persist=not dry_run,
+            # Em dry-run a variacao nova so existe em memoria; a versao do
+            # perfil nao muda e nenhuma noticia pareceria desatualizada.
+            only_stale=not dry_run,
+            chunk_size=options.get("chunk_size"),
+            workers=workers,
         )
 
         mode = "DRY-RUN" if dry_run else "APLICADO"
@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from newsclip.models import Client
+from newsclip.simulation import simulate_client_terms
+from newsclip.utils import append_unique_terms, split_terms
+
+
+class Command(BaseCommand):
+    help = (
+        "Simula o efeito de novos termos de identidade/contexto/proibidos sobre o historico "
+        "de noticias de um cliente, sem gravar nada."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--client-id", type=int, required=True, help="ID exato do cliente")
+        parser.add_argument(
+            "--add-name-variation",
+            action="append",
+            default=[],
+            help="Variacao de nome a somar as atuais. Pode repetir.",
+        )
+        parser.add_argument("--name-variations", help="Substitui todas as variacoes de nome na simulacao")
+        parser.add_argument("--context-terms", help="Substitui os termos de contexto na simulacao")
+        parser.add_argument("--excluded-keywords", help="Substitui os termos proibidos na simulacao")
+        parser.add_argument("--samples", type=int, default=10, help="Exemplos promovidos/rebaixados (padrao: 10)")
+
+    def handle(self, *args, **options):
+        client = Client.objects.filter(pk=options["client_id"]).first()
+        if not client:
+            raise CommandError(f"Cliente {options['client_id']} nao encontrado.")
+
+        name_variations = options.get("name_variations")
+        additions = []
+        for raw in options.get("add_name_variation") or []:
+            additions.extend(split_terms(raw))
+        if additions:
+            name_variations, _added = append_unique_terms(
+                client.name_variations if name_variations is None else name_variations,
+                additions,
+            )
+
+        result = simulate_client_terms(
+            client,
+            sample_size=max(0, options["samples"]),
+            name_variations=name_variations,
+            context_terms=options.get("context_terms"),
+            excluded_keywords=options.get("excluded_keywords"),
+        )
+
+        self.stdout.write(f"SIMULACAO: {client.name} [id:{client.pk}]")
+        self.stdout.write(f"Processados: {result['processed']} em {result['elapsed_ms']} ms")
+        self.stdout.write(f"Mudariam de status: {result['changed']}")
+        for total in result["totals"]:
+            self.stdout.write(f"{total['status']}: {total['before']} -> {total['after']}")
+        for (previous, status), count in result["transitions"]:
+            self.stdout.write(f"  {previous} -> {status}: {count}")
+        for label, samples in (("Promovidas", result["promoted"]), ("Rebaixadas", result["demoted"])):
+            if samples:
+                self.stdout.write(f"{label}:")
+                for sample in samples:
+                    self.stdout.write(f"  [{sample['id']}] {sample['title']} ({sample['score']}: {sample['reason']})")
@@ -0,0 +1,105 @@
+"""Termos de identidade/contexto do cliente pré-compilados para a validação.
+
+``validate_article_candidate`` roda para cada candidato de cada provedor e em
+toda revalidação. Em vez de remontar as listas de termos a partir dos campos
+de texto do ``Client`` e normalizar o texto do candidato uma vez por termo, a
+validação usa um ``ClientMatcher`` compilado uma única vez por perfil: termos
+já normalizados, hosts confiáveis e handles oficiais, e o texto do candidato
+é normalizado uma só vez.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from types import SimpleNamespace
+
+from newsclip.models import Client
+from newsclip.profiles import cached_profile_value
+from newsclip.utils import (
+    client_context_terms,
+    client_excluded_terms,
+    client_identity_terms,
+    normalize_match_text,
+    social_handle_terms,
+    strong_client_identity_terms,
+    trusted_source_references,
+    url_host_and_path,
+)
+
+
+PROFILE_FIELDS = Client.PROFILE_FIELDS
+
+
+def _normalized_terms(terms):
+    """Pares ``(termo original, termo normalizado)``, sem termos vazios."""
+    return tuple(
+        (term, normalized)
+        for term in terms
+        if (normalized := normalize_match_text(term))
+    )
+
+
+class ClientMatcher:
+    """Perfil de casamento de um cliente, montado uma vez e reaproveitado."""
+
+    def __init__(self, client):
+        self.name_norm = normalize_match_text(getattr(client, "name", ""))
+        self.identity_terms = _normalized_terms(client_identity_terms(client))
+        self.strong_identity_terms = _normalized_terms(strong_client_identity_terms(client))
+        self.context_terms = _normalized_terms(client_context_terms(client))
+        self.excluded_terms = tuple(
+            normalized for _term, normalized in _normalized_terms(client_excluded_terms(client))
+        )
+        self.handle_terms = tuple(
+            normalized for _term, normalized in _normalized_terms(social_handle_terms(client))
+        )
+        self.trusted_references = tuple(
+            (host, path, normalize_match_text(host)) for host, path in trusted_source_references(client)
+        )
+
+    @staticmethod
+    def matched(searchable_norm: str, terms) -> list[str]:
+        """Termos originais cujo texto normalizado aparece em ``searchable_norm``."""
+        return [term for term, normalized in terms if normalized in searchable_norm]
+
+    def contains_excluded(self, searchable_norm: str) -> bool:
+        return any(term in searchable_norm for term in self.excluded_terms)
+
+    def is_official_source(self, url: str, source: str = "") -> bool:
+        return self.has_official_handle(normalize_match_text(f"{url} {source}"))
+
+    def has_official_handle(self, url_source_norm: str) -> bool:
+        return any(handle in url_source_norm for handle in self.handle_terms)
+
+    def is_trusted_source(self, url: str, source: str = "") -> bool:
+        if not self.trusted_references:
+            return False
+        url_host, url_path = url_host_and_path(url)
+        return self.is_trusted_reference(url_host, url_path, normalize_match_text(source))
+
+    def is_trusted_reference(self, url_host: str, url_path: str, source_norm: str) -> bool:
+        for host, path, host_norm in self.trusted_references:
+            if host and (url_host == host or source_norm == host_norm):
+                if not path or url_path.startswith(path):
+                    return True
+        return False
+
+
+def client_profile(client) -> tuple:
+    """Valores dos campos do cliente que definem o casamento de termos."""
+    return tuple(getattr(client, field, "") or "" for field in PROFILE_FIELDS)
+
+
+def client_matcher(client) -> ClientMatcher:
+    """Matcher compilado do cliente, compartilhado entre processos pelo cache de perfis.
+
+    A chave é o fingerprint dos campos em memória (o mesmo de
+    ``Client.profile_fingerprint`` depois de salvo), então um cadastro
+    alterado, mesmo ainda não salvo, nunca reaproveita o matcher antigo.
+    """
+    profile = client_profile(client)
+    fingerprint = hashlib.sha256("\x1f".join(profile).encode("utf-8")).hexdigest()
+    return cached_profile_value(
+        f"matcher:{fingerprint}",
+        lambda: ClientMatcher(SimpleNamespace(**dict(zip(PROFILE_FIELDS, profile)))),
+    )
@@ -0,0 +1,38 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("newsclip", "0024_transcriptextraction")]
+
+    operations = [
+        migrations.AddField(
+            model_name="source",
+            name="etag",
+            field=models.CharField(blank=True, max_length=255, verbose_name="ETag da ultima coleta"),
+        ),
+        migrations.AddField(
+            model_name="source",
+            name="last_modified",
+            field=models.CharField(blank=True, max_length=64, verbose_name="Last-Modified da ultima coleta"),
+        ),
+        migrations.AddField(
+            model_name="source",
+            name="content_hash",
+            field=models.CharField(blank=True, max_length=64, verbose_name="Hash do conteudo da ultima coleta"),
+        ),
+        migrations.AddField(
+            model_name="sourceendpoint",
+            name="etag",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="sourceendpoint",
+            name="last_modified",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="sourceendpoint",
+            name="content_hash",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
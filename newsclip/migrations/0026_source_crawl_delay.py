@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0025_conditional_fetch_validators'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='crawl_delay',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Crawl-delay do robots.txt (s)'),
+        ),
+    ]
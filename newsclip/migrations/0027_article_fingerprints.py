@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0026_source_crawl_delay'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='title_fingerprint',
+            field=models.CharField(blank=True, default='', max_length=64, verbose_name='Fingerprint do titulo'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='url_hash',
+            field=models.CharField(blank=True, default='', max_length=64, verbose_name='Hash da URL canonica'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['client', 'url_hash'], name='article_client_url_hash_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['client', 'title_fingerprint'], name='article_client_title_fp_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0027_article_fingerprints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='canonical_article',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='republications', to='newsclip.article', verbose_name='Materia canonica'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='simhash',
+            field=models.BigIntegerField(blank=True, null=True, verbose_name='SimHash'),
+        ),
+        migrations.CreateModel(
+            name='ArticleStoryBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.BigIntegerField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='story_buckets', to='newsclip.article')),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='story_buckets', to='newsclip.client')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['client', 'bucket'], name='story_bucket_lookup_idx')],
+                'constraints': [models.UniqueConstraint(fields=('article', 'bucket'), name='unique_story_bucket_per_article')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0028_article_near_duplicates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='profile_fingerprint',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='profile_version',
+            field=models.PositiveIntegerField(default=1, editable=False, verbose_name='Versao do perfil'),
+        ),
+    ]
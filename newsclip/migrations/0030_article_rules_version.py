@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0029_client_profile_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='rules_version',
+            field=models.CharField(blank=True, default='', max_length=32, verbose_name='Versao das regras'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['client', 'validation_status', 'rules_version'], name='article_client_rules_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0030_article_rules_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevalidationJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.CharField(blank=True, db_index=True, max_length=64)),
+                ('status', models.CharField(choices=[('queued', 'Na fila'), ('running', 'Em execucao'), ('completed', 'Concluida'), ('failed', 'Falhou'), ('cancelled', 'Cancelada')], db_index=True, default='queued', max_length=16)),
+                ('rules_version', models.CharField(blank=True, max_length=32)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('processed', models.PositiveIntegerField(default=0)),
+                ('changed', models.PositiveIntegerField(default=0)),
+                ('promoted', models.PositiveIntegerField(default=0)),
+                ('last_article_id', models.PositiveBigIntegerField(default=0)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('error_message', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revalidation_jobs', to='newsclip.client')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['client', 'status', '-created_at'], name='newsclip_re_client__51f53b_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:29
+
+import re
+import unicodedata
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Cópia congelada da extração de features de newsclip.learning: a migração
+# precisa gerar as mesmas contagens mesmo que o código vivo mude depois.
+FEEDBACK_FIELDS = ("decision", "title", "content", "source", "provider")
+LEARNED_DECISIONS = ("ACCEPTED", "REJECTED")
+FEATURE_MAX_LENGTH = 300
+LEARNING_STOP_WORDS = {
+    "a", "ao", "aos", "as", "com", "como", "da", "das", "de", "do", "dos",
+    "e", "em", "entre", "na", "nas", "no", "nos", "o", "os", "para", "por",
+    "que", "se", "sem", "um", "uma",
+}
+
+
+def normalize_match_text(value):
+    normalized = unicodedata.normalize("NFKD", value or "")
+    normalized = "".join(char for char in normalized if not unicodedata.combining(char))
+    return " ".join(normalized.casefold().split())
+
+
+def _words(value):
+    return [
+        word
+        for word in re.findall(r"[a-z0-9]{3,}", normalize_match_text(value))
+        if word not in LEARNING_STOP_WORDS
+    ]
+
+
+def extract_learning_features(title, content, source, provider):
+    title_words = _words(title)[:40]
+    features = {f"title:{word}" for word in title_words}
+    features.update(f"text:{word}" for word in _words(content)[:120])
+    features.update(f"title_pair:{first}_{second}" for first, second in zip(title_words, title_words[1:]))
+    if normalize_match_text(source):
+        features.add(f"source:{normalize_match_text(source)}")
+    if normalize_match_text(provider):
+        features.add(f"provider:{normalize_match_text(provider)}")
+    return features
+
+
+def backfill_feature_counts(apps, schema_editor):
+    ValidationFeedback = apps.get_model("newsclip", "ValidationFeedback")
+    LearningFeatureCount = apps.get_model("newsclip", "LearningFeatureCount")
+    client_ids = (
+        ValidationFeedback.objects.filter(decision__in=LEARNED_DECISIONS)
+        .values_list("client_id", flat=True)
+        .distinct()
+    )
+    for client_id in list(client_ids):
+        feedback = ValidationFeedback.objects.filter(
+            client_id=client_id,
+            decision__in=LEARNED_DECISIONS,
+        ).values(*FEEDBACK_FIELDS)
+        counts = defaultdict(lambda: [0, 0])
+        for item in feedback.iterator(chunk_size=500):
+            column = 0 if item["decision"] == "ACCEPTED" else 1
+            for feature in extract_learning_features(
+                item["title"], item["content"], item["source"], item["provider"]
+            ):
+                if len(feature) <= FEATURE_MAX_LENGTH:
+                    counts[feature][column] += 1
+        LearningFeatureCount.objects.bulk_create(
+            [
+                LearningFeatureCount(client_id=client_id, feature=feature, accepted=accepted, rejected=rejected)
+                for feature, (accepted, rejected) in counts.items()
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0031_revalidation_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LearningFeatureCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('feature', models.CharField(max_length=300)),
+                ('accepted', models.PositiveIntegerField(default=0)),
+                ('rejected', models.PositiveIntegerField(default=0)),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='learning_feature_counts', to='newsclip.client')),
+            ],
+            options={
+                'verbose_name': 'Contagem de feature do aprendizado',
+                'verbose_name_plural': 'Contagens de features do aprendizado',
+                'constraints': [models.UniqueConstraint(fields=('client', 'feature'), name='unique_learning_feature_per_client')],
+            },
+        ),
+        migrations.RunPython(backfill_feature_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0032_learning_feature_counts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleLearningFeature',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('feature', models.CharField(max_length=300)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='learning_features', to='newsclip.article')),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='learning_features', to='newsclip.client')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['client', 'feature'], name='learning_feature_lookup_idx')],
+                'constraints': [models.UniqueConstraint(fields=('article', 'feature'), name='unique_learning_feature_per_article')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0033_article_learning_features'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClientArticleStats',
+            fields=[
+                ('client', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='article_stats', serialize=False, to='newsclip.client')),
+                ('accepted', models.IntegerField(default=0)),
+                ('review', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0, verbose_name='Rejeitadas manualmente')),
+                ('discarded', models.IntegerField(default=0, verbose_name='Descartadas automaticamente')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Contadores de noticias do cliente',
+                'verbose_name_plural': 'Contadores de noticias dos clientes',
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Coalesce, TruncDate
+
+
+def backfill_daily_rollups(apps, schema_editor):
+    Article = apps.get_model("newsclip", "Article")
+    ArticleDailyRollup = apps.get_model("newsclip", "ArticleDailyRollup")
+    rows = (
+        Article.objects.filter(excluded=False, canonical_article__isnull=True)
+        .annotate(day=TruncDate(Coalesce("published_at", "created_at")))
+        .values_list("client_id", "day", "source", "provider", "validation_status")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    ArticleDailyRollup.objects.bulk_create(
+        (
+            ArticleDailyRollup(
+                client_id=client_id,
+                day=day,
+                source=source,
+                provider=provider,
+                validation_status=validation_status,
+                count=total,
+            )
+            for client_id, day, source, provider, validation_status, total in rows.iterator(chunk_size=2000)
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0034_client_article_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('source', models.CharField(blank=True, max_length=255)),
+                ('provider', models.CharField(blank=True, max_length=32)),
+                ('validation_status', models.CharField(max_length=16)),
+                ('count', models.IntegerField(default=0)),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='newsclip.client')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['client', 'validation_status', 'day'], name='rollup_client_status_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('client', 'day', 'source', 'provider', 'validation_status'), name='unique_daily_rollup_key')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_rollups, migrations.RunPython.noop),
+    ]
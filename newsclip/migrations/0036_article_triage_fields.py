@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0035_article_daily_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='triage_band',
+            field=models.PositiveSmallIntegerField(default=3, verbose_name='Faixa de triagem'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='triage_identity_visible',
+            field=models.BooleanField(default=False, verbose_name='Identidade visivel'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='triage_source_rank',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Ordem da fonte na triagem'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='triage_story_group',
+            field=models.CharField(blank=True, default='', max_length=255, verbose_name='Grupo da materia'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='triage_trusted',
+            field=models.BooleanField(default=False, verbose_name='Fonte confiavel do cliente'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('excluded', False), models.Q(('validation_status', 'ACCEPTED'), _negated=True)), fields=['client', 'triage_band', '-triage_trusted', 'triage_source_rank', '-triage_identity_visible', '-relevance_score', 'triage_story_group', '-published_at', '-id'], name='article_triage_queue_idx'),
+        ),
+    ]
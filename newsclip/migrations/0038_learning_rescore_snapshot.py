@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F, Q
+
+
+def snapshot_current_scores(apps, schema_editor):
+    """As notícias existentes contam como pontuadas com as contagens e totais atuais."""
+    LearningFeatureCount = apps.get_model("newsclip", "LearningFeatureCount")
+    LearningRescoreState = apps.get_model("newsclip", "LearningRescoreState")
+    ValidationFeedback = apps.get_model("newsclip", "ValidationFeedback")
+    LearningFeatureCount.objects.update(scored_accepted=F("accepted"), scored_rejected=F("rejected"))
+    totals = (
+        ValidationFeedback.objects.values("client_id")
+        .annotate(
+            accepted=Count("id", filter=Q(decision="ACCEPTED")),
+            rejected=Count("id", filter=Q(decision="REJECTED")),
+        )
+        .order_by()
+    )
+    LearningRescoreState.objects.bulk_create(
+        [
+            LearningRescoreState(
+                client_id=row["client_id"],
+                accepted_total=row["accepted"],
+                rejected_total=row["rejected"],
+            )
+            for row in totals
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0037_article_client_updated_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LearningRescoreState',
+            fields=[
+                ('client', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='learning_rescore_state', serialize=False, to='newsclip.client')),
+                ('accepted_total', models.PositiveIntegerField(default=0)),
+                ('rejected_total', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Estado da repontuacao do aprendizado',
+                'verbose_name_plural': 'Estados da repontuacao do aprendizado',
+            },
+        ),
+        migrations.AddField(
+            model_name='learningfeaturecount',
+            name='scored_accepted',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='learningfeaturecount',
+            name='scored_rejected',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(snapshot_current_scores, migrations.RunPython.noop),
+    ]
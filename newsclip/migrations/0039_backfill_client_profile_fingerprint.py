@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:10
+
+import hashlib
+
+from django.db import migrations
+
+
+# Cópia congelada de Client.PROFILE_FIELDS/compute_profile_fingerprint: a
+# migração precisa continuar gerando o mesmo valor mesmo que o modelo mude.
+PROFILE_FIELDS = (
+    "name",
+    "name_variations",
+    "keywords",
+    "context_terms",
+    "excluded_keywords",
+    "instagram",
+    "x",
+    "youtube",
+    "domains",
+)
+
+
+def backfill_profile_fingerprint(apps, schema_editor):
+    """Clientes antigos ficaram com fingerprint vazio; sem ele, o primeiro save
+    de qualquer campo parecia mudança de perfil e disparava uma revalidação."""
+    Client = apps.get_model("newsclip", "Client")
+    pending = []
+    for client in Client.objects.filter(profile_fingerprint="").only("pk", *PROFILE_FIELDS).iterator():
+        payload = "\x1f".join(getattr(client, field, "") or "" for field in PROFILE_FIELDS)
+        client.profile_fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        pending.append(client)
+    Client.objects.bulk_update(pending, ["profile_fingerprint"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0038_learning_rescore_snapshot'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_profile_fingerprint, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:40
+
+from django.db import migrations
+from django.db.models import Count
+from django.utils import timezone
+
+
+def link_same_url_articles(apps, schema_editor):
+    """Notícias antigas com a mesma URL canônica passam a ser da mesma matéria.
+
+    A listagem deixou de deduplicar por ``url_hash`` e agora usa só a matéria;
+    cópias gravadas antes disso entram na matéria da primeira do cliente.
+    """
+    Article = apps.get_model("newsclip", "Article")
+    groups = (
+        Article.objects.exclude(url_hash="")
+        .values("client_id", "url_hash")
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+        .order_by()
+    )
+    for group in groups.iterator():
+        rows = list(
+            Article.objects.filter(client_id=group["client_id"], url_hash=group["url_hash"])
+            .order_by("pk")
+            .values_list("pk", "canonical_article_id")
+        )
+        first_pk, first_canonical = rows[0]
+        Article.objects.filter(
+            pk__in=[pk for pk, canonical in rows[1:] if canonical is None],
+        ).update(canonical_article_id=first_canonical or first_pk, updated_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsclip', '0039_backfill_client_profile_fingerprint'),
+    ]
+
+    operations = [
+        migrations.RunPython(link_same_url_articles, migrations.RunPython.noop),
+    ]
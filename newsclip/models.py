@@ -1,5 +1,7 @@
+import hashlib
+
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.contrib.postgres.search import SearchVectorField
 from django.contrib.postgres.indexes import GinIndex
@@ -38,6 +40,10 @@ class Source(models.Model):
     title_selector = models.CharField("Seletor de Titulo (CSS)", max_length=200, blank=True, null=True)
     link_selector = models.CharField("Seletor de Link (CSS)", max_length=200, blank=True, null=True)
     date_selector = models.CharField("Seletor de Data (CSS)", max_length=200, blank=True, null=True)
+    etag = models.CharField("ETag da ultima coleta", max_length=255, blank=True)
+    last_modified = models.CharField("Last-Modified da ultima coleta", max_length=64, blank=True)
+    content_hash = models.CharField("Hash do conteudo da ultima coleta", max_length=64, blank=True)
+    crawl_delay = models.PositiveSmallIntegerField("Crawl-delay do robots.txt (s)", default=0)
 
     def __str__(self):
         return f"{self.name} ({self.get_source_type_display()})"
@@ -59,6 +65,9 @@ class SourceEndpoint(models.Model):
     last_success_at = models.DateTimeField(null=True, blank=True)
     last_error_at = models.DateTimeField(null=True, blank=True)
     consecutive_errors = models.PositiveIntegerField(default=0)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -172,10 +181,75 @@ class Client(models.Model):
         related_name="clients",
         help_text="Quem pode ver/editar este cliente",
     )
+    # Sobe quando muda algum campo de PROFILE_FIELDS ou chega decisao manual
+    # nova; chaves do cache de perfis compilados embutem este numero.
+    profile_version = models.PositiveIntegerField("Versao do perfil", default=1, editable=False)
+    profile_fingerprint = models.CharField(max_length=64, blank=True, default="", editable=False)
+
+    PROFILE_FIELDS = (
+        "name",
+        "name_variations",
+        "keywords",
+        "context_terms",
+        "excluded_keywords",
+        "instagram",
+        "x",
+        "youtube",
+        "domains",
+    )
 
     def __str__(self):
         return self.name
 
+    def compute_profile_fingerprint(self) -> str:
+        payload = "\x1f".join(getattr(self, field, "") or "" for field in self.PROFILE_FIELDS)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        profile_saved = update_fields is None or bool(set(update_fields) & set(self.PROFILE_FIELDS))
+        fingerprint = self.compute_profile_fingerprint()
+        profile_changed = profile_saved and fingerprint != self.profile_fingerprint
+        if profile_changed:
+            self.profile_fingerprint = fingerprint
+        # Instancia nova, forcada a inserir ou regravada depois de apagada (pk
+        # zerado pelo delete): vira INSERT e nao pode receber update_fields.
+        updating = not self._state.adding and self.pk is not None and not kwargs.get("force_insert")
+        # Lido pelo post_save (signals.py) para agendar a revalidacao.
+        self._profile_changed = profile_changed and updating
+        if updating:
+            # profile_version so muda por UPDATE atomico; regravar o valor em
+            # memoria desfaria incrementos feitos por outros processos.
+            if update_fields is None:
+                update_fields = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key and field.name != "profile_version"
+                ]
+            else:
+                update_fields = set(update_fields) - {"profile_version"}
+                if profile_changed:
+                    update_fields.add("profile_fingerprint")
+            kwargs["update_fields"] = update_fields
+        super().save(*args, **kwargs)
+        if profile_changed and updating:
+            from newsclip.profiles import bump_profile_version
+
+            bump_profile_version(self.pk)
+            self.refresh_from_db(fields=["profile_version"])
+
+
+class ArticleQuerySet(models.QuerySet):
+    def delete(self):
+        """Apaga em lote mantendo contadores e agregados diarios com uma contagem antes e outra depois."""
+        from newsclip.stats import tracking_article_stats
+
+        with transaction.atomic(using=self.db), tracking_article_stats(self.values_list("pk", flat=True)):
+            return super().delete()
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
 
 class Article(models.Model):
     VALIDATION_CHOICES = [
@@ -196,6 +270,21 @@ class Article(models.Model):
     updated_at = models.DateTimeField("Atualizado em", auto_now=True, null=True, blank=True)
     search_vector = SearchVectorField(null=True, blank=True)
     dedup_key = models.CharField(max_length=96, blank=True, db_index=True)
+    # Hashes calculados na ingestão (e por backfill_article_fingerprints) para
+    # que a checagem de duplicatas seja uma busca indexada.
+    title_fingerprint = models.CharField("Fingerprint do titulo", max_length=64, blank=True, default="")
+    url_hash = models.CharField("Hash da URL canonica", max_length=64, blank=True, default="")
+    # SimHash do titulo+conteudo; republicacoes da mesma materia apontam para
+    # a primeira copia coletada (ver ArticleStoryBucket).
+    simhash = models.BigIntegerField("SimHash", null=True, blank=True)
+    canonical_article = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="republications",
+        verbose_name="Materia canonica",
+    )
     provider = models.CharField(max_length=32, default="OTHER", db_index=True)
     relevance_score = models.PositiveSmallIntegerField(default=0, db_index=True)
     validation_status = models.CharField(
@@ -205,11 +294,42 @@ class Article(models.Model):
         db_index=True,
     )
     validation_reason = models.CharField(max_length=255, blank=True)
+    # Regras + perfil do cliente usados na ultima pontuacao (ver
+    # utils.current_rules_version); revalidacoes pulam noticias ja atualizadas.
+    rules_version = models.CharField("Versao das regras", max_length=32, blank=True, default="")
+    # Componentes da ordenacao "prioridade" da fila de revisao (ver
+    # utils.article_triage_fields), gravados na coleta e na revalidacao para
+    # que a fila seja um ORDER BY sobre o indice article_triage_queue_idx.
+    triage_band = models.PositiveSmallIntegerField("Faixa de triagem", default=3)
+    triage_trusted = models.BooleanField("Fonte confiavel do cliente", default=False)
+    triage_source_rank = models.PositiveSmallIntegerField("Ordem da fonte na triagem", default=0)
+    triage_identity_visible = models.BooleanField("Identidade visivel", default=False)
+    triage_story_group = models.CharField("Grupo da materia", max_length=255, blank=True, default="")
 
     class Meta:
         ordering = ['-published_at']
         indexes = [
             GinIndex(fields=['search_vector']),
+            models.Index(fields=['client', 'url_hash'], name='article_client_url_hash_idx'),
+            models.Index(fields=['client', 'title_fingerprint'], name='article_client_title_fp_idx'),
+            models.Index(fields=['client', 'validation_status', 'rules_version'], name='article_client_rules_idx'),
+            models.Index(fields=['client', 'updated_at'], name='article_client_updated_idx'),
+            models.Index(fields=['client', '-published_at', '-id'], name='article_client_published_idx'),
+            models.Index(
+                fields=[
+                    'client',
+                    'triage_band',
+                    '-triage_trusted',
+                    'triage_source_rank',
+                    '-triage_identity_visible',
+                    '-relevance_score',
+                    'triage_story_group',
+                    '-published_at',
+                    '-id',
+                ],
+                name='article_triage_queue_idx',
+                condition=models.Q(excluded=False) & ~models.Q(validation_status='ACCEPTED'),
+            ),
         ]
         constraints = [
             models.UniqueConstraint(fields=['client', 'url'], name='unique_article_url_per_client'),
@@ -223,11 +343,108 @@ class Article(models.Model):
         title_short = (self.title[:47] + "...") if self.title and len(self.title) > 50 else self.title
         return f"{client_name}: {title_short}"
 
+    objects = ArticleQuerySet.as_manager()
+
+    def delete(self, *args, **kwargs):
+        # Apagar o cliente remove contadores e agregados junto, sem passar por aqui.
+        from newsclip.stats import tracking_article_stats
+
+        with transaction.atomic(), tracking_article_stats([self.pk]):
+            return super().delete(*args, **kwargs)
+
     @property
     def title_truncado(self):
         return (self.title[:47] + "...") if self.title and len(self.title) > 50 else self.title
 
 
+class ArticleStoryBucket(models.Model):
+    """Faixa (banda LSH) do SimHash de uma noticia, para achar quase-duplicatas do cliente."""
+
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="story_buckets")
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name="story_buckets")
+    bucket = models.BigIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["client", "bucket"], name="story_bucket_lookup_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["article", "bucket"], name="unique_story_bucket_per_article"),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id}: {self.bucket}"
+
+
+class ClientArticleStats(models.Model):
+    """Contadores de noticias por aba do cliente, mantidos a cada gravacao (ver stats.py)."""
+
+    client = models.OneToOneField(Client, on_delete=models.CASCADE, primary_key=True, related_name="article_stats")
+    accepted = models.IntegerField(default=0)
+    review = models.IntegerField(default=0)
+    rejected = models.IntegerField("Rejeitadas manualmente", default=0)
+    discarded = models.IntegerField("Descartadas automaticamente", default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Contadores de noticias do cliente"
+        verbose_name_plural = "Contadores de noticias dos clientes"
+
+    def __str__(self):
+        return f"{self.client_id}: {self.accepted} validadas, {self.pending} para validacao"
+
+    @property
+    def pending(self):
+        return self.review + self.rejected + self.discarded
+
+
+class ArticleDailyRollup(models.Model):
+    """Noticias por dia/fonte/provedor/status do cliente, mantidas a cada gravacao (ver stats.py).
+
+    Conta so materias (sem as republicacoes ligadas a uma canonica) nao
+    excluidas; o dia e o da publicacao, ou o da coleta quando nao ha data.
+    """
+
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="daily_rollups")
+    day = models.DateField()
+    source = models.CharField(max_length=255, blank=True)
+    provider = models.CharField(max_length=32, blank=True)
+    validation_status = models.CharField(max_length=16)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["client", "validation_status", "day"], name="rollup_client_status_day_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["client", "day", "source", "provider", "validation_status"],
+                name="unique_daily_rollup_key",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.client_id} {self.day} {self.source}/{self.provider} {self.validation_status}: {self.count}"
+
+
+class ArticleLearningFeature(models.Model):
+    """Indice invertido feature do aprendizado -> noticia, para repontuar so o que os pesos afetam."""
+
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="learning_features")
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name="learning_features")
+    feature = models.CharField(max_length=300)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["client", "feature"], name="learning_feature_lookup_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["article", "feature"], name="unique_learning_feature_per_article"),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id}: {self.feature}"
+
 
 
 class ValidationFeedback(models.Model):
@@ -271,6 +488,61 @@ class ValidationFeedback(models.Model):
 
     def __str__(self):
         return f"{self.client}: {self.decision} - {self.title[:60]}"
+
+    def delete(self, *args, **kwargs):
+        # Sem a decisao manual a rejeitada volta a contar como descarte automatico.
+        from newsclip.stats import tracking_article_stats
+
+        with transaction.atomic(), tracking_article_stats([self.article_id] if self.article_id else [], rollups=False):
+            return super().delete(*args, **kwargs)
+
+
+class LearningFeatureCount(models.Model):
+    """Contagem de decisoes manuais por feature do aprendizado de um cliente.
+
+    Mantida incrementalmente a cada decisao (ver learning.apply_feature_deltas)
+    para que o perfil de aprendizado seja uma leitura simples sobre todo o
+    historico, sem reprocessar os textos das decisoes.
+    """
+
+    FEATURE_MAX_LENGTH = 300
+
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="learning_feature_counts")
+    feature = models.CharField(max_length=FEATURE_MAX_LENGTH)
+    accepted = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    # Contagens com que as noticias da feature foram repontuadas pela ultima
+    # vez (ver learning.moved_learning_features).
+    scored_accepted = models.PositiveIntegerField(default=0)
+    scored_rejected = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["client", "feature"], name="unique_learning_feature_per_client"),
+        ]
+        verbose_name = "Contagem de feature do aprendizado"
+        verbose_name_plural = "Contagens de features do aprendizado"
+
+    def __str__(self):
+        return f"{self.client}: {self.feature} (+{self.accepted}/-{self.rejected})"
+
+
+class LearningRescoreState(models.Model):
+    """Totais de decisoes com que as noticias do cliente foram repontuadas por inteiro pela ultima vez."""
+
+    client = models.OneToOneField(Client, on_delete=models.CASCADE, primary_key=True, related_name="learning_rescore_state")
+    accepted_total = models.PositiveIntegerField(default=0)
+    rejected_total = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Estado da repontuacao do aprendizado"
+        verbose_name_plural = "Estados da repontuacao do aprendizado"
+
+    def __str__(self):
+        return f"{self.client}: +{self.accepted_total}/-{self.rejected_total}"
+
+
 class RelevanceAuditLog(models.Model):
     DECISION_CHOICES = [
         ("APPROVED", "Aprovado"),
@@ -328,6 +600,43 @@ class NewsFetchJob(models.Model):
         return f"{self.client}: {self.status}"
 
 
+class RevalidationJob(models.Model):
+    """Revalidacao em segundo plano das noticias de um cliente, em blocos por id."""
+
+    STATUS_CHOICES = NewsFetchJob.STATUS_CHOICES
+
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="revalidation_jobs")
+    task_id = models.CharField(max_length=64, blank=True, db_index=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="queued", db_index=True)
+    rules_version = models.CharField(max_length=32, blank=True)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    changed = models.PositiveIntegerField(default=0)
+    promoted = models.PositiveIntegerField(default=0)
+    # Cursor da paginacao por id: uma tarefa reiniciada continua daqui.
+    last_article_id = models.PositiveBigIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    error_message = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["client", "status", "-created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.client}: {self.status} ({self.processed}/{self.total})"
+
+    @property
+    def progress_percent(self) -> int:
+        if not self.total:
+            return 100 if self.status == "completed" else 0
+        return min(100, int(self.processed * 100 / self.total))
+
+
 class TranscriptExtraction(models.Model):
     STATUS_CHOICES = [
         ("queued", "Na fila"),
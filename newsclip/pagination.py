@@ -0,0 +1,140 @@
+"""Paginação por cursor (keyset) das listas de notícias.
+
+``Paginator`` conta todas as linhas e pula ``OFFSET`` linhas a cada página, o
+que obriga o banco a percorrer o histórico inteiro do cliente. Aqui a página
+seguinte é pedida a partir dos valores de ordenação da última notícia vista
+(``after``) e a anterior a partir da primeira (``before``): cada página custa
+uma consulta limitada a ``page_size + 1`` linhas, que o índice de ordenação
+resolve sem olhar o resto do histórico.
+
+Os cursores são os próprios valores de ordenação serializados em base64; a
+ordenação sempre termina num campo único (``id``) para que não haja empates.
+Nulos ficam por último nos dois sentidos, igual no PostgreSQL e no SQLite.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.db.models import F, Q
+
+
+class KeysetPage:
+    """Uma página de resultados e os cursores para as páginas vizinhas."""
+
+    def __init__(self, object_list, *, has_next=False, has_previous=False, next_cursor="", previous_cursor=""):
+        self.object_list = list(object_list)
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.next_cursor = next_cursor if has_next else ""
+        self.previous_cursor = previous_cursor if has_previous else ""
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+
+def encode_cursor(values) -> str:
+    payload = [{"dt": value.isoformat()} if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> list | None:
+    """Valores de um cursor, ou None quando o cursor é inválido."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    if not isinstance(payload, list):
+        return None
+    try:
+        return [
+            datetime.fromisoformat(value["dt"]) if isinstance(value, dict) else value
+            for value in payload
+        ]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _fields(ordering):
+    return [(field.lstrip("-"), field.startswith("-")) for field in ordering]
+
+
+def keyset_order_by(ordering, reverse: bool = False):
+    """Expressões de ORDER BY de ``ordering`` (ex.: ``("-published_at", "-id")``)."""
+    nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+    return [
+        F(name).desc(**nulls) if descending != reverse else F(name).asc(**nulls)
+        for name, descending in _fields(ordering)
+    ]
+
+
+def keyset_filter(ordering, values, reverse: bool = False) -> Q:
+    """Linhas depois (ou, com ``reverse``, antes) de ``values`` na ordem de ``ordering``."""
+    condition = Q(pk__in=[])
+    equal = Q()
+    for (name, descending), value in zip(_fields(ordering), values):
+        if value is None:
+            # Nulos vêm por último: depois de um nulo só há nulos; antes, qualquer valor.
+            beyond = Q(pk__in=[]) if not reverse else Q(**{f"{name}__isnull": False})
+            same = Q(**{f"{name}__isnull": True})
+        else:
+            lookup = "lt" if descending != reverse else "gt"
+            beyond = Q(**{f"{name}__{lookup}": value})
+            if not reverse:
+                beyond |= Q(**{f"{name}__isnull": True})
+            same = Q(**{name: value})
+        condition |= equal & beyond
+        equal &= same
+    return condition
+
+
+def cursor_values(obj, ordering) -> list:
+    return [getattr(obj, name) for name, _descending in _fields(ordering)]
+
+
+def paginate_keyset(queryset, ordering, page_size: int, *, after: str = "", before: str = "") -> KeysetPage:
+    """Página de ``queryset`` em ``ordering`` depois do cursor ``after`` ou antes de ``before``."""
+    page_size = max(1, page_size)
+    before_values = decode_cursor(before)
+    after_values = None if before_values is not None else decode_cursor(after)
+    fields = len(ordering)
+
+    if before_values is not None and len(before_values) == fields:
+        rows = list(
+            queryset.filter(keyset_filter(ordering, before_values, reverse=True))
+            .order_by(*keyset_order_by(ordering, reverse=True))[: page_size + 1]
+        )
+        has_previous = len(rows) > page_size
+        rows = rows[:page_size][::-1]
+        has_next = True
+    else:
+        if after_values is not None and len(after_values) == fields:
+            queryset = queryset.filter(keyset_filter(ordering, after_values))
+        else:
+            after_values = None
+        rows = list(queryset.order_by(*keyset_order_by(ordering))[: page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        has_previous = after_values is not None
+
+    return KeysetPage(
+        rows,
+        has_next=has_next,
+        has_previous=has_previous,
+        next_cursor=encode_cursor(cursor_values(rows[-1], ordering)) if rows else "",
+        previous_cursor=encode_cursor(cursor_values(rows[0], ordering)) if rows else "",
+    )
+
@@ -0,0 +1,166 @@
+"""Agendador de cortesia por host: token bucket, Retry-After e Crawl-delay.
+
+Todo GET do ``http_client`` pede a vez ao ``scheduler`` antes de sair. Cada
+host tem um balde de fichas com ritmo e rajada configuráveis (GDELT, Google
+News e hosts com ``Crawl-delay`` no robots.txt têm ritmos próprios), e um 429/
+503 com ``Retry-After`` coloca o host em espera para todos os coletores do
+processo. Quando a vez demora, threads comuns aguardam até
+``POLITENESS_MAX_WAIT_SECONDS``; código que roda em modo adiável (motor
+assíncrono) recebe ``HostDeferred`` na hora e reagenda a tarefa.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+
+
+GDELT_HOST = "api.gdeltproject.org"
+GOOGLE_NEWS_HOST = "news.google.com"
+# Chave própria: a cota da Custom Search não deve pausar YouTube/googleapis.
+GOOGLE_CSE_KEY = "google-cse"
+THROTTLE_STATUS_CODES = {429, 503}
+
+_deferring = threading.local()
+
+
+class HostDeferred(requests.RequestException):
+    """O host ainda não pode receber requisições; tente de novo em ``retry_after`` segundos."""
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"{host} em espera por {retry_after:.0f}s.")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    def __init__(self, per_minute: float, burst: int):
+        self.rate = max(per_minute, 0.001) / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """Consome uma ficha; devolve quantos segundos faltam para ela existir."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+def host_of(url: str) -> str:
+    return (urlparse(url).hostname or "").casefold().removeprefix("www.") or url
+
+
+def retry_after_seconds(response, default: float = 0) -> float:
+    """Interpreta ``Retry-After`` em segundos ou como data HTTP."""
+    value = (response.headers.get("Retry-After") or "").strip()
+    if value.isdigit():
+        return float(value)
+    if value:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    return default
+
+
+class PolitenessScheduler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, TokenBucket] = {}
+        self._cooldowns: dict[str, float] = {}
+        self._crawl_delays: dict[str, float] = {}
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+            self._cooldowns.clear()
+            self._crawl_delays.clear()
+
+    def _new_bucket(self, host: str) -> TokenBucket:
+        if host == GDELT_HOST:
+            return TokenBucket(60 / max(1, getattr(settings, "GDELT_MIN_INTERVAL_SECONDS", 20)), 1)
+        crawl_delay = self._crawl_delays.get(host)
+        if crawl_delay:
+            return TokenBucket(60 / crawl_delay, 1)
+        if host == GOOGLE_NEWS_HOST:
+            return TokenBucket(
+                getattr(settings, "GOOGLE_RSS_REQUESTS_PER_MINUTE", 240),
+                getattr(settings, "GOOGLE_RSS_BURST", 20),
+            )
+        return TokenBucket(
+            getattr(settings, "POLITENESS_HOST_REQUESTS_PER_MINUTE", 120),
+            getattr(settings, "POLITENESS_HOST_BURST", 10),
+        )
+
+    def set_crawl_delay(self, host: str, seconds: float):
+        """Aplica o ``Crawl-delay`` do robots.txt quando é mais restritivo que o ritmo atual."""
+        if not seconds or seconds <= 0:
+            return
+        with self._lock:
+            if self._crawl_delays.get(host, 0) >= seconds:
+                return
+            self._crawl_delays[host] = seconds
+            self._buckets.pop(host, None)
+
+    def defer(self, host: str, seconds: float):
+        """Suspende o host por ``seconds`` (Retry-After, cota esgotada etc.)."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._cooldowns[host] = max(until, self._cooldowns.get(host, 0))
+
+    def note_response(self, host: str, response):
+        if response.status_code in THROTTLE_STATUS_CODES:
+            self.defer(host, retry_after_seconds(response))
+
+    def reserve(self, host: str) -> float:
+        """Tenta pegar a vez do host; devolve 0 (pode seguir) ou a espera em segundos."""
+        with self._lock:
+            now = time.monotonic()
+            cooldown = self._cooldowns.get(host, 0) - now
+            if cooldown > 0:
+                return cooldown
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = self._new_bucket(host)
+            return bucket.reserve(now)
+
+    def wait(self, host: str):
+        """Bloqueia até a vez do host, ou levanta ``HostDeferred``.
+
+        Em modo adiável qualquer espera vira ``HostDeferred``; fora dele a
+        thread só dorme esperas de até ``POLITENESS_MAX_WAIT_SECONDS``.
+        """
+        max_wait = getattr(settings, "POLITENESS_MAX_WAIT_SECONDS", 30)
+        while True:
+            delay = self.reserve(host)
+            if not delay:
+                return
+            if getattr(_deferring, "active", False) or delay > max_wait:
+                raise HostDeferred(host, delay)
+            time.sleep(delay)
+
+
+scheduler = PolitenessScheduler()
+
+
+@contextmanager
+def deferring():
+    """Faz a thread atual receber ``HostDeferred`` em vez de dormir esperando a vez."""
+    previous = getattr(_deferring, "active", False)
+    _deferring.active = True
+    try:
+        yield
+    finally:
+        _deferring.active = previous
@@ -0,0 +1,98 @@
+"""Cache compartilhado dos perfis compilados de cada cliente.
+
+Matchers de termos e pesos do aprendizado manual são caros de remontar e
+iguais em todos os processos (workers do Gunicorn e do qcluster). Eles ficam
+no cache ``profiles`` (tabela do banco por padrão) sob chaves que embutem a
+versão do perfil: quando o cadastro do cliente muda ou chega uma nova decisão
+manual, ``Client.profile_version`` sobe e as chaves antigas simplesmente
+deixam de ser lidas, sem invalidação explícita entre processos. Cada processo
+ainda guarda uma cópia local do que já leu para não ir ao cache a cada
+candidato validado.
+"""
+
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F
+
+
+PROFILE_CACHE_ALIAS = "profiles"
+LOCAL_CACHE_MAX_ENTRIES = 1024
+
+_local_values = {}
+_local_versions = {}
+
+
+def profile_cache():
+    alias = PROFILE_CACHE_ALIAS if PROFILE_CACHE_ALIAS in settings.CACHES else "default"
+    return caches[alias]
+
+
+def cached_profile_value(key: str, build):
+    """Devolve o valor de ``key``: cópia local, cache compartilhado ou ``build()``."""
+    if key in _local_values:
+        return _local_values[key]
+    try:
+        value = profile_cache().get(key)
+    except Exception:
+        # Cache indisponível (tabela ainda não criada etc.) não pode parar a validação.
+        value = None
+    if value is None:
+        value = build()
+        try:
+            profile_cache().set(key, value, getattr(settings, "PROFILE_CACHE_SECONDS", 86400))
+        except Exception:
+            pass
+    if len(_local_values) >= LOCAL_CACHE_MAX_ENTRIES:
+        _local_values.clear()
+    _local_values[key] = value
+    return value
+
+
+def current_profile_version(client) -> int:
+    """Versão atual do perfil, relida do banco no máximo a cada VALIDATION_LEARNING_CACHE_SECONDS.
+
+    O objeto ``client`` em memória pode ter sido carregado antes de uma
+    decisão manual feita em outro processo; a releitura periódica garante que
+    os pesos novos passem a valer sem reiniciar a coleta. Um ``client`` com
+    versão diferente da cópia local força a releitura, e o objeto recebe a
+    versão lida. Uma referência só com ``pk`` (sem ``profile_version``) usa a
+    cópia local enquanto ela valer.
+    """
+    from newsclip.models import Client
+
+    client_id = int(client.pk)
+    now = time.monotonic()
+    loaded_version = getattr(client, "profile_version", 0) or 0
+    cached = _local_versions.get(client_id)
+    if cached and cached[0] > now and loaded_version in (0, cached[1]):
+        return cached[1]
+    version = (
+        Client.objects.filter(pk=client_id).values_list("profile_version", flat=True).first()
+        or loaded_version
+    )
+    if hasattr(client, "profile_version"):
+        client.profile_version = version
+    ttl = max(0, getattr(settings, "VALIDATION_LEARNING_CACHE_SECONDS", 300))
+    _local_versions[client_id] = (now + ttl, version)
+    return version
+
+
+def forget_profile_version(client_id):
+    _local_versions.pop(int(client_id), None)
+
+
+def bump_profile_version(client_id):
+    """Marca o perfil do cliente como alterado para todos os processos."""
+    from newsclip.models import Client
+
+    Client.objects.filter(pk=client_id).update(profile_version=F("profile_version") + 1)
+    forget_profile_version(client_id)
+
+
+def reset_local_cache():
+    _local_values.clear()
+    _local_versions.clear()
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import re
-import time
 from datetime import datetime, timezone as dt_timezone
 from urllib.parse import urlparse
 
@@ -12,6 +11,7 @@ import requests
 from django.conf import settings
 from django.utils import timezone
 
+from newsclip import http_client, politeness
 from newsclip.models import DiscoveryRun
 from newsclip.utils import build_client_search_queries, save_article
 
@@ -53,7 +53,7 @@ def _resolve_youtube_channel(api_key: str, reference: str) -> str:
     channel_id, handle = _youtube_reference(reference)
     if channel_id or not handle or not api_key:
         return channel_id
-    response = requests.get(
+    response = http_client.get(
         YOUTUBE_CHANNELS_URL,
         params={"part": "id", "forHandle": handle, "key": api_key},
         timeout=20,
@@ -76,7 +76,7 @@ def fetch_youtube(client, keywords: list[str], since_dt, log=None) -> int:
         # Feeds de canal não consomem cota e são preferidos quando há channel_id.
         if channel_id:
             queries_count += 1
-            response = requests.get(
+            response = http_client.get(
                 YOUTUBE_FEED_URL,
                 params={"channel_id": channel_id},
                 timeout=20,
@@ -102,7 +102,7 @@ def fetch_youtube(client, keywords: list[str], since_dt, log=None) -> int:
             published_after = since_dt.astimezone(dt_timezone.utc).isoformat().replace("+00:00", "Z")
             for term in list(dict.fromkeys(item.strip() for item in terms if item.strip()))[:max_queries]:
                 queries_count += 1
-                response = requests.get(
+                response = http_client.get(
                     YOUTUBE_SEARCH_URL,
                     params={
                         "part": "snippet", "type": "video", "order": "date",
@@ -174,9 +174,9 @@ def fetch_gdelt(client, keywords: list[str], since_dt, log=None) -> int:
 
     try:
         selected_terms = list(dict.fromkeys(item.strip() for item in terms if item.strip()))[:max_queries]
-        for index, term in enumerate(selected_terms):
-            if index:
-                time.sleep(getattr(settings, "GDELT_MIN_INTERVAL_SECONDS", 6))
+        # O intervalo mínimo entre consultas (GDELT_MIN_INTERVAL_SECONDS) é
+        # aplicado pelo agendador de politeness para todos os clientes.
+        for term in selected_terms:
             queries_count += 1
             params = {
                 "query": f'{term} sourcelang:portuguese',
@@ -186,7 +186,7 @@ def fetch_gdelt(client, keywords: list[str], since_dt, log=None) -> int:
                 "sort": "DateDesc",
                 "startdatetime": since_dt.astimezone(dt_timezone.utc).strftime("%Y%m%d%H%M%S"),
             }
-            response = requests.get(
+            response = http_client.get(
                 GDELT_DOC_URL,
                 params=params,
                 headers={"User-Agent": "ClippingApp/1.0"},
@@ -195,8 +195,8 @@ def fetch_gdelt(client, keywords: list[str], since_dt, log=None) -> int:
             if response.status_code == 429:
                 delay = _gdelt_rate_limit_delay(response)
                 if delay:
-                    time.sleep(delay)
-                    response = requests.get(
+                    politeness.scheduler.defer(politeness.GDELT_HOST, delay)
+                    response = http_client.get(
                         GDELT_DOC_URL,
                         params=params,
                         headers={"User-Agent": "ClippingApp/1.0"},
@@ -0,0 +1,353 @@
+"""Revalidação das notícias de um cliente em segundo plano (django-q).
+
+Quando os termos do cliente mudam, a versão das regras muda junto e as
+notícias pontuadas com a versão antiga ficam desatualizadas.
+Em vez de repontuá-las durante o carregamento das páginas, um
+``RevalidationJob`` percorre essas notícias em blocos por id (keyset), grava
+cada bloco com um ``bulk_update`` e registra o progresso no próprio job.
+
+Para clientes muito grandes, ``revalidate_in_parallel`` divide a faixa de ids
+entre processos que apenas pontuam; as gravações ficam no processo pai.
+
+Decisões manuais não desatualizam tudo: ``rescore_learning_changes`` usa o
+índice invertido ``ArticleLearningFeature`` para repontuar só as notícias com
+features cujo peso mudou.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+
+import django
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Max, Min, Q
+from django.utils import timezone
+from django_q.tasks import async_task
+
+from newsclip.models import Article, ArticleLearningFeature, Client, RevalidationJob
+from newsclip.stats import tracking_article_stats
+from newsclip.utils import (
+    REVALIDATION_FIELDS,
+    current_rules_version,
+    empty_revalidation_stats,
+    iter_article_chunks,
+    merge_revalidation_stats,
+    pending_revalidation_queryset,
+    revalidate_articles_batch,
+    revalidate_pending_articles_for_client,
+    score_articles_batch,
+)
+
+
+logger = logging.getLogger("newsclip")
+
+REVALIDATED_STATUSES = ("ACCEPTED", "REVIEW", "REJECTED")
+# Valores das tuplas de score_article_range depois do pk (rules_version é o do job).
+UPDATE_VALUE_FIELDS = [name for name in REVALIDATION_FIELDS if name != "rules_version"]
+
+
+def stale_articles(client, rules_version: str, statuses=REVALIDATED_STATUSES):
+    """Notícias automáticas do cliente pontuadas com regras/perfil diferentes de ``rules_version``."""
+    return (
+        Article.objects.filter(client=client, excluded=False, validation_status__in=statuses)
+        .exclude(
+            Q(validation_reason__icontains="usuario")
+            | Q(manual_feedback__isnull=False)
+            | Q(rules_version=rules_version)
+        )
+        .order_by("pk")
+    )
+
+
+def requeue_stalled_revalidation(client) -> RevalidationJob | None:
+    """Devolve à fila o job do cliente parado em "running" há mais de REVALIDATION_STALE_SECONDS.
+
+    Um worker derrubado pelo timeout do django-q (ou reiniciado no meio) deixa
+    o job como "running" para sempre. O mais recente volta a "queued" e
+    continua de ``last_article_id``; os mais antigos ficam como falhos.
+    """
+    stale_seconds = max(1, getattr(settings, "REVALIDATION_STALE_SECONDS", 1800))
+    now = timezone.now()
+    stalled = RevalidationJob.objects.filter(
+        client=client,
+        status="running",
+        updated_at__lt=now - timedelta(seconds=stale_seconds),
+    )
+    job = stalled.order_by("-created_at").first()
+    # UPDATE condicional: dois agendamentos simultâneos não retomam o mesmo job.
+    if job is None or not stalled.filter(pk=job.pk).update(status="queued", updated_at=now):
+        return None
+    stalled.update(
+        status="failed",
+        error_message="Interrompida sem progresso; substituida por uma execucao mais recente.",
+        finished_at=now,
+        updated_at=now,
+    )
+    logger.warning("Revalidacao %s do cliente %s parada; retomando do id %s", job.pk, client.pk, job.last_article_id)
+    job.status = "queued"
+    return job
+
+
+def enqueue_revalidation(client) -> RevalidationJob:
+    """Cria (ou reaproveita, se já há um na fila ou parado) o job de revalidação do cliente.
+
+    A busca pelo job na fila e a criação rodam com a linha do cliente travada
+    (``select_for_update``): dois agendamentos simultâneos não criam dois jobs.
+    A tarefa só é enviada ao django-q depois de liberar a trava.
+    """
+    with transaction.atomic():
+        Client.objects.select_for_update().filter(pk=client.pk).exists()
+        queued = RevalidationJob.objects.filter(client=client, status="queued").first()
+        if queued is not None:
+            return queued
+        job = requeue_stalled_revalidation(client) or RevalidationJob.objects.create(client=client, status="queued")
+    try:
+        task_id = async_task(
+            "newsclip.tasks.revalidate_client_task",
+            job.pk,
+            task_name=f"revalidate-client-{client.pk}",
+        )
+    except Exception as exc:
+        logger.exception("Nao foi possivel agendar a revalidacao do cliente %s", client.pk)
+        job.status = "failed"
+        job.error_message = str(exc)
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "error_message", "finished_at", "updated_at"])
+        return job
+    job.task_id = str(task_id)
+    job.save(update_fields=["task_id", "updated_at"])
+    return job
+
+
+def schedule_revalidation(client_id):
+    """Agenda a revalidação depois do commit da transação que mudou o perfil."""
+    if not getattr(settings, "REVALIDATION_AUTO_ENQUEUE", True):
+        return
+
+    def enqueue():
+        client = Client.objects.filter(pk=client_id).first()
+        if client is not None:
+            enqueue_revalidation(client)
+
+    transaction.on_commit(enqueue)
+
+
+def schedule_learning_rescore(client_id, features):
+    """Agenda, depois do commit, a repontuação das notícias com ``features``.
+
+    ``features`` vem de ``learning.moved_learning_features``: lista vazia não
+    agenda nada e None repontua todas as notícias automáticas do cliente.
+    """
+    if features == [] or not getattr(settings, "REVALIDATION_AUTO_ENQUEUE", True):
+        return
+
+    def enqueue():
+        try:
+            async_task(
+                "newsclip.tasks.rescore_learning_task",
+                client_id,
+                features,
+                task_name=f"rescore-learning-{client_id}",
+            )
+        except Exception:
+            logger.exception("Nao foi possivel agendar a repontuacao do aprendizado do cliente %s", client_id)
+
+    transaction.on_commit(enqueue)
+
+
+def rescore_learning_changes(client, features) -> dict:
+    """Repontua as notícias automáticas do cliente que contêm alguma de ``features``.
+
+    Com ``features=None`` repontua todas. As versões das regras não mudam com
+    o aprendizado, então a seleção não filtra por ``rules_version``.
+    """
+    rules_version = current_rules_version(client)
+    if features is None:
+        return revalidate_pending_articles_for_client(
+            client,
+            list(REVALIDATED_STATUSES),
+            only_stale=False,
+        )
+
+    stats = empty_revalidation_stats()
+    chunk_size = max(1, getattr(settings, "REVALIDATION_CHUNK_SIZE", 500))
+    article_ids = set()
+    for offset in range(0, len(features), chunk_size):
+        article_ids.update(
+            ArticleLearningFeature.objects.filter(
+                client=client,
+                feature__in=features[offset:offset + chunk_size],
+            ).values_list("article_id", flat=True)
+        )
+    article_ids = sorted(article_ids)
+    for offset in range(0, len(article_ids), chunk_size):
+        chunk = list(
+            pending_revalidation_queryset(client, REVALIDATED_STATUSES, rules_version, only_stale=False)
+            .filter(pk__in=article_ids[offset:offset + chunk_size])
+            .order_by("pk")
+        )
+        if chunk:
+            merge_revalidation_stats(stats, revalidate_articles_batch(client, chunk, rules_version))
+    return stats
+
+
+def run_revalidation_job(job: RevalidationJob) -> RevalidationJob:
+    """Processa as notícias desatualizadas do cliente a partir de ``job.last_article_id``."""
+    client = job.client
+    rules_version = current_rules_version(client)
+    chunk_size = max(1, getattr(settings, "REVALIDATION_CHUNK_SIZE", 500))
+    pending = stale_articles(client, rules_version)
+
+    if job.rules_version and job.rules_version != rules_version:
+        # Retomada depois de outra mudança de termos: as notícias antes do
+        # cursor também ficaram desatualizadas.
+        job.last_article_id = job.processed = job.changed = job.promoted = 0
+    job.status = "running"
+    job.started_at = job.started_at or timezone.now()
+    job.rules_version = rules_version
+    job.total = job.processed + pending.filter(pk__gt=job.last_article_id).count()
+    job.error_message = ""
+    job.save(
+        update_fields=[
+            "status", "started_at", "rules_version", "total", "error_message",
+            "last_article_id", "processed", "changed", "promoted", "updated_at",
+        ]
+    )
+
+    last_id = job.last_article_id
+    while True:
+        chunk = list(pending.filter(pk__gt=last_id)[:chunk_size])
+        if not chunk:
+            break
+        stats = revalidate_articles_batch(client, chunk, rules_version)
+        last_id = chunk[-1].pk
+        RevalidationJob.objects.filter(pk=job.pk).update(
+            processed=F("processed") + stats["processed"],
+            changed=F("changed") + stats["changed"],
+            promoted=F("promoted") + stats["promoted"],
+            last_article_id=last_id,
+            updated_at=timezone.now(),
+        )
+
+    job.refresh_from_db()
+    job.status = "completed"
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "finished_at", "updated_at"])
+    return job
+
+
+PARTITIONS_PER_WORKER = 4
+
+
+def split_id_range(low: int, high: int, parts: int) -> list[tuple[int, int]]:
+    """Divide ``[low, high)`` em até ``parts`` faixas contíguas de tamanho parecido."""
+    span = high - low
+    if span <= 0:
+        return []
+    parts = max(1, min(parts, span))
+    step, extra = divmod(span, parts)
+    ranges = []
+    start = low
+    for index in range(parts):
+        end = start + step + (1 if index < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def score_article_range(client, statuses, rules_version, only_stale, start_id, end_id, chunk_size=None):
+    """Pontua (sem gravar) as notícias do cliente com ``start_id <= pk < end_id``.
+
+    Roda nos processos do pool; devolve as estatísticas da faixa e as tuplas
+    ``(pk, *UPDATE_VALUE_FIELDS)`` das notícias que precisam ser gravadas.
+    """
+    articles = pending_revalidation_queryset(client, statuses, rules_version, only_stale).filter(
+        pk__gte=start_id,
+        pk__lt=end_id,
+    ).order_by("pk")
+    stats = empty_revalidation_stats()
+    updates = []
+    for chunk in iter_article_chunks(articles, chunk_size):
+        chunk_stats, changed = score_articles_batch(client, chunk, rules_version)
+        merge_revalidation_stats(stats, chunk_stats)
+        updates.extend(
+            (article.pk, *(getattr(article, name) for name in UPDATE_VALUE_FIELDS))
+            for article in changed
+        )
+    return stats, updates
+
+
+def write_revalidation_updates(updates, rules_version: str, chunk_size: int | None = None):
+    batch_size = max(1, chunk_size or getattr(settings, "REVALIDATION_CHUNK_SIZE", 500))
+    for offset in range(0, len(updates), batch_size):
+        batch = updates[offset:offset + batch_size]
+        now = timezone.now()
+        with transaction.atomic(), tracking_article_stats(pk for pk, *_values in batch):
+            Article.objects.bulk_update(
+                [
+                    Article(
+                        pk=pk,
+                        rules_version=rules_version,
+                        updated_at=now,
+                        **dict(zip(UPDATE_VALUE_FIELDS, values)),
+                    )
+                    for pk, *values in batch
+                ],
+                [*REVALIDATION_FIELDS, "updated_at"],
+            )
+
+
+def revalidate_in_parallel(
+    client,
+    statuses,
+    rules_version: str,
+    *,
+    workers: int,
+    persist: bool = True,
+    only_stale: bool = True,
+    chunk_size: int | None = None,
+) -> dict:
+    """Revalida as notícias do cliente em ``workers`` processos, gravando no processo pai.
+
+    Os processos são criados com ``spawn`` (sem herdar as conexões abertas do
+    pai), carregam o Django no ``initializer`` e recebem o próprio ``client``,
+    de modo que alterações ainda só em memória (dry-run) valem também nos
+    workers.
+    """
+    stats = empty_revalidation_stats()
+    bounds = pending_revalidation_queryset(client, statuses, rules_version, only_stale).aggregate(
+        low=Min("pk"),
+        high=Max("pk"),
+    )
+    if bounds["low"] is None:
+        return stats
+
+    ranges = split_id_range(bounds["low"], bounds["high"] + 1, workers * PARTITIONS_PER_WORKER)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=django.setup,
+    ) as executor:
+        futures = [
+            executor.submit(
+                score_article_range,
+                client,
+                list(statuses),
+                rules_version,
+                only_stale,
+                start_id,
+                end_id,
+                chunk_size,
+            )
+            for start_id, end_id in ranges
+        ]
+        for future in as_completed(futures):
+            range_stats, updates = future.result()
+            merge_revalidation_stats(stats, range_stats)
+            if persist and updates:
+                write_revalidation_updates(updates, rules_version, chunk_size)
+    return stats
@@ -1,9 +1,114 @@
 from django.contrib.postgres.search import SearchVector
 from django.db import connection
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .models import Article
+from .learning import (
+    FEEDBACK_FIELDS,
+    apply_feature_deltas,
+    feedback_feature_deltas,
+    feedback_total_delta,
+    moved_learning_features,
+)
+from .models import Article, Client, ValidationFeedback
+from .profiles import bump_profile_version
+from .revalidation import schedule_learning_rescore, schedule_revalidation
+from .stats import (
+    ARTICLE_STATE_FIELDS,
+    ARTICLE_STATE_UPDATE_FIELDS,
+    apply_article_state_change,
+    apply_stats_changes,
+    article_state,
+    stats_by_client,
+)
+from .utils import (
+    TRIAGE_INPUT_FIELDS,
+    apply_triage_fields,
+    article_title_fingerprint,
+    article_url_hash,
+    triage_profile,
+)
+
+
+@receiver(pre_save, sender=Article)
+def fill_article_fingerprints(sender, instance, **kwargs):
+    """
+    Mantém title_fingerprint e url_hash coerentes com o título/URL salvos.
+    """
+    instance.title_fingerprint = article_title_fingerprint(instance.title or "", instance.source or "")
+    instance.url_hash = article_url_hash(instance.url or "")
+
+
+@receiver(pre_save, sender=Article)
+def link_same_url_story(sender, instance, **kwargs):
+    """
+    Notícia nova com a URL canônica de outra do cliente entra na matéria
+    dela, e a listagem deduplica com uma única partição por matéria.
+    (save_articles já descarta essas URLs antes de inserir.)
+    """
+    if not instance._state.adding or instance.canonical_article_id or not instance.url_hash or not instance.client_id:
+        return
+    first = (
+        Article.objects.filter(client_id=instance.client_id, url_hash=instance.url_hash)
+        .order_by("pk")
+        .values_list("pk", "canonical_article_id")
+        .first()
+    )
+    if first is not None:
+        instance.canonical_article_id = first[1] or first[0]
+
+
+@receiver(pre_save, sender=Article)
+def fill_article_triage(sender, instance, **kwargs):
+    """
+    Recalcula a prioridade de triagem em gravações uma a uma; os caminhos em
+    lote (coleta, revalidação) chamam apply_triage_fields por conta própria.
+    O perfil de triagem vem do cache por versão, sem carregar instance.client.
+    """
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not set(update_fields) & TRIAGE_INPUT_FIELDS:
+        return
+    if instance.client_id:
+        client = instance.client if Article.client.is_cached(instance) else None
+        apply_triage_fields(client, [instance], triage_profile(instance.client_id, client))
+
+
+@receiver(pre_save, sender=Article)
+def remember_article_stats(sender, instance, **kwargs):
+    """
+    Lê o estado gravado só na hora do save (uma consulta ``values_list``),
+    em vez de guardar uma cópia em cada notícia carregada: listagens e
+    relatórios não pagam nada, e saves que não tocam os campos do contador
+    nem consultam.
+    """
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not set(update_fields) & ARTICLE_STATE_UPDATE_FIELDS:
+        return
+    if instance.pk and not instance._state.adding:
+        instance._stats_state = (
+            Article.objects.filter(pk=instance.pk).values_list(*ARTICLE_STATE_FIELDS).first()
+        )
+
+
+@receiver(post_save, sender=Article)
+def update_client_article_stats(sender, instance, created=False, **kwargs):
+    """
+    Mantém ClientArticleStats e os agregados diários em dia para gravações
+    feitas uma a uma (admin, testes, scripts), comparando o estado lido com o
+    gravado. Apagar passa por Article.delete/ArticleQuerySet.delete e os
+    caminhos em lote aplicam as variações por conta própria (ver
+    stats.tracking_article_stats).
+    """
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not set(update_fields) & ARTICLE_STATE_UPDATE_FIELDS:
+        return
+    after = article_state(instance)
+    before = instance.__dict__.pop("_stats_state", None)
+    if created:
+        apply_article_state_change(instance.pk, None, after, has_feedback=False)
+    elif before is not None and after is not None:
+        apply_article_state_change(instance.pk, before, after)
+
 
 @receiver(post_save, sender=Article)
 def update_search_vector(sender, instance, created, **kwargs):
@@ -31,3 +136,66 @@ def update_search_vector(sender, instance, created, **kwargs):
     # SQLite e outros bancos usados localmente não possuem o tipo tsvector.
     combined_text_for_fts = f"{title_val} {summary_val} {content_val}"
     Article.objects.filter(pk=instance.pk).update(search_vector=combined_text_for_fts)
+
+
+@receiver(pre_save, sender=ValidationFeedback)
+def remember_previous_feedback(sender, instance, **kwargs):
+    """Guarda a decisão anterior para desfazer suas contagens de features."""
+    instance._previous_feedback = None
+    if instance.pk:
+        instance._previous_feedback = (
+            ValidationFeedback.objects.filter(pk=instance.pk).values(*FEEDBACK_FIELDS).first()
+        )
+
+
+@receiver(pre_save, sender=ValidationFeedback)
+def remember_feedback_article_stats(sender, instance, **kwargs):
+    """Uma decisão manual move a notícia rejeitada de descartada para rejeitada manualmente."""
+    article_ids = {instance.article_id}
+    if instance.pk:
+        article_ids.add(ValidationFeedback.objects.filter(pk=instance.pk).values_list("article_id", flat=True).first())
+    instance._stats_articles = [article_id for article_id in article_ids if article_id]
+    instance._stats_before = stats_by_client(instance._stats_articles)
+
+
+@receiver(post_save, sender=ValidationFeedback)
+def update_feedback_article_stats(sender, instance, **kwargs):
+    article_ids = getattr(instance, "_stats_articles", None)
+    if article_ids:
+        apply_stats_changes(instance._stats_before, stats_by_client(article_ids))
+
+
+@receiver(post_save, sender=ValidationFeedback)
+@receiver(post_delete, sender=ValidationFeedback)
+def bump_client_profile_on_feedback(sender, instance, **kwargs):
+    """
+    Decisões manuais mudam os pesos do aprendizado: as contagens de features
+    são atualizadas, o perfil do cliente ganha versão nova em todos os
+    processos e só as notícias com features cujo peso mudou são repontuadas.
+    (record_manual_feedback grava em lote e faz o mesmo por conta própria.)
+    """
+    if not instance.client_id:
+        return
+    if isinstance(kwargs.get("origin"), Client):
+        # O cliente está sendo apagado: contagens e perfil vão junto.
+        return
+    if kwargs.get("signal") is post_delete:
+        removed, added = [instance], []
+    else:
+        previous = getattr(instance, "_previous_feedback", None)
+        removed, added = ([previous] if previous else []), [instance]
+    deltas = feedback_feature_deltas(removed, added)
+    apply_feature_deltas(instance.client_id, deltas)
+    moved = moved_learning_features(instance.client_id, deltas, feedback_total_delta(removed, added))
+    bump_profile_version(instance.client_id)
+    schedule_learning_rescore(instance.client_id, moved)
+
+
+@receiver(post_save, sender=Client)
+def revalidate_client_on_profile_change(sender, instance, created, **kwargs):
+    """
+    Termos do cliente mudaram: as noticias ja pontuadas sao revalidadas em
+    segundo plano.
+    """
+    if not created and getattr(instance, "_profile_changed", False):
+        schedule_revalidation(instance.pk)
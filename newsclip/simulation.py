@@ -0,0 +1,142 @@
+"""Simulação ("e se") de mudanças nos termos de um cliente sobre o histórico.
+
+Ajustar variações de nome, contexto ou termos proibidos e depois persistir e
+revalidar tudo é lento demais para calibrar termos. Aqui o cliente é alterado
+apenas em memória e repontuado contra uma projeção compacta das notícias
+(título, link, fonte, provedor e o começo do conteúdo), carregada com uma
+única consulta e reaproveitada por alguns minutos enquanto o analista testa
+variações. Nada é gravado.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+from collections import Counter, namedtuple
+
+from django.conf import settings
+from django.db.models import Q, TextField, Value
+from django.db.models.functions import Coalesce, NullIf, Substr
+
+from newsclip.models import Article
+from newsclip.utils import learned_adjustments_for, prepare_article_candidate, score_article_candidate
+
+
+SIMULATED_FIELDS = ("name_variations", "context_terms", "excluded_keywords")
+SIMULATED_STATUSES = ("ACCEPTED", "REVIEW", "REJECTED")
+LOCAL_CACHE_MAX_ENTRIES = 8
+
+ArticleProjection = namedtuple("ArticleProjection", "id validation_status candidate")
+
+_projections = {}
+
+
+def load_article_projection(client, statuses=SIMULATED_STATUSES) -> list[ArticleProjection]:
+    """Notícias automáticas do cliente, já preparadas para a validação.
+
+    Texto normalizado, host e sinais de fonte de cada notícia não dependem dos
+    termos do cliente; são calculados aqui uma única vez. O resultado fica em
+    memória por SIMULATION_CACHE_SECONDS para que simulações seguidas do mesmo
+    cliente não repitam a consulta nem a preparação.
+    """
+    key = (client.pk, tuple(sorted(statuses)))
+    now = time.monotonic()
+    cached = _projections.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    prefix = max(0, getattr(settings, "SIMULATION_CONTENT_CHARS", 1000))
+    text = Coalesce(NullIf("content", Value("")), "summary", Value(""), output_field=TextField())
+    rows = (
+        Article.objects.filter(client=client, excluded=False, validation_status__in=statuses)
+        .exclude(Q(validation_reason__icontains="usuario") | Q(manual_feedback__isnull=False))
+        .annotate(content_prefix=Substr(text, 1, prefix) if prefix else text)
+        .order_by("-published_at", "-id")
+        .values_list("id", "title", "url", "source", "provider", "validation_status", "content_prefix")
+    )
+    projection = [
+        ArticleProjection(
+            article_id,
+            validation_status,
+            prepare_article_candidate(title, content, url, source, provider),
+        )
+        for article_id, title, url, source, provider, validation_status, content in rows.iterator(chunk_size=2000)
+    ]
+
+    if len(_projections) >= LOCAL_CACHE_MAX_ENTRIES:
+        _projections.clear()
+    _projections[key] = (now + max(0, getattr(settings, "SIMULATION_CACHE_SECONDS", 300)), projection)
+    return projection
+
+
+def forget_article_projection(client_id=None):
+    if client_id is None:
+        _projections.clear()
+        return
+    for key in [key for key in _projections if key[0] == int(client_id)]:
+        _projections.pop(key, None)
+
+
+def proposed_client(client, **terms):
+    """Cópia em memória do cliente com os termos propostos (``None`` mantém o atual)."""
+    proposal = copy.copy(client)
+    for field in SIMULATED_FIELDS:
+        value = terms.get(field)
+        if value is not None:
+            setattr(proposal, field, value)
+    return proposal
+
+
+def simulate_client_terms(client, *, statuses=SIMULATED_STATUSES, sample_size: int = 10, **terms) -> dict:
+    """Repontua o histórico do cliente com os termos propostos, sem gravar nada.
+
+    Devolve as contagens de transição ``(status atual, status simulado)``, os
+    totais por status antes/depois e amostras de notícias promovidas para
+    ACCEPTED e rebaixadas de ACCEPTED.
+    """
+    started = time.monotonic()
+    proposal = proposed_client(client, **terms)
+    projection = load_article_projection(client, statuses)
+
+    transitions = Counter()
+    before = Counter()
+    after = Counter()
+    promoted = []
+    demoted = []
+    learned = learned_adjustments_for(proposal, [article.candidate for article in projection])
+    for article, learned_adjustment in zip(projection, learned):
+        validation = score_article_candidate(proposal, article.candidate, learned_adjustment)
+        previous = article.validation_status
+        status = validation["status"]
+        before[previous] += 1
+        after[status] += 1
+        if status == previous:
+            continue
+        transitions[(previous, status)] += 1
+        sample = {
+            "id": article.id,
+            "title": article.candidate.title,
+            "url": article.candidate.url,
+            "source": article.candidate.source,
+            "from": previous,
+            "to": status,
+            "score": validation["score"],
+            "reason": validation["reason"],
+        }
+        if status == "ACCEPTED" and len(promoted) < sample_size:
+            promoted.append(sample)
+        elif previous == "ACCEPTED" and len(demoted) < sample_size:
+            demoted.append(sample)
+
+    return {
+        "processed": len(projection),
+        "changed": sum(transitions.values()),
+        "transitions": sorted(transitions.items(), key=lambda item: (-item[1], item[0])),
+        "totals": [
+            {"status": status, "before": before[status], "after": after[status]}
+            for status in SIMULATED_STATUSES
+        ],
+        "promoted": promoted,
+        "demoted": demoted,
+        "elapsed_ms": int((time.monotonic() - started) * 1000),
+    }
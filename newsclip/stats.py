@@ -0,0 +1,317 @@
+"""Contadores e agregados de notícias mantidos a cada gravação.
+
+O cabeçalho de ``client_news`` mostra quantas notícias estão validadas, em
+revisão, rejeitadas manualmente e descartadas automaticamente
+(``ClientArticleStats``); os gráficos e o painel usam as notícias por dia,
+fonte, provedor e status (``ArticleDailyRollup``). Em vez de contar o
+histórico a cada página, cada caminho que grava notícias (coleta,
+revalidação, ações em lote e decisões manuais) aplica a variação na mesma
+transação, e a leitura é uma busca pela chave primária ou uma consulta
+agrupada pequena.
+
+A linha de ``ClientArticleStats`` do cliente é criada na primeira leitura a
+partir de uma contagem completa; enquanto ela não existe as variações são
+ignoradas, pois a contagem completa já as inclui. Os agregados diários
+nascem na migração e depois só recebem variações.
+``reconcile_client_article_stats`` recalcula os dois para corrigir desvios.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from newsclip.models import Article, ArticleDailyRollup, ClientArticleStats, ValidationFeedback
+
+
+STATS_BUCKETS = ("accepted", "review", "rejected", "discarded")
+
+
+def manual_rejection_filter():
+    return Q(validation_status="REJECTED") & (
+        Q(validation_reason__icontains="usuario")
+        | Q(manual_feedback__isnull=False)
+    )
+
+
+def automatic_rejection_filter():
+    return Q(validation_status="REJECTED") & ~(
+        Q(validation_reason__icontains="usuario")
+        | Q(manual_feedback__isnull=False)
+    )
+
+
+def article_stats_bucket(excluded, validation_status, validation_reason="", has_feedback=False):
+    """Contador em que a notícia entra (None para excluídas)."""
+    if excluded:
+        return None
+    if validation_status == "ACCEPTED":
+        return "accepted"
+    if validation_status == "REVIEW":
+        return "review"
+    if validation_status == "REJECTED":
+        manual = has_feedback or "usuario" in (validation_reason or "").casefold()
+        return "rejected" if manual else "discarded"
+    return None
+
+
+def apply_stats_deltas(client_id, deltas):
+    changes = {bucket: F(bucket) + delta for bucket, delta in deltas.items() if delta}
+    if changes:
+        ClientArticleStats.objects.filter(client_id=client_id).update(**changes, updated_at=timezone.now())
+
+
+def _bucket_aggregates():
+    return {
+        "accepted": Count("id", filter=Q(validation_status="ACCEPTED")),
+        "review": Count("id", filter=Q(validation_status="REVIEW")),
+        "rejected": Count("id", filter=manual_rejection_filter()),
+        "discarded": Count("id", filter=automatic_rejection_filter()),
+    }
+
+
+def stats_by_client(article_ids) -> dict:
+    """Contadores ``{client_id: Counter}`` das notícias ``article_ids``, numa consulta agrupada."""
+    article_ids = list(article_ids)
+    if not article_ids:
+        return {}
+    rows = (
+        Article.objects.filter(pk__in=article_ids, excluded=False)
+        .values("client_id")
+        .annotate(**_bucket_aggregates())
+        .order_by()
+    )
+    return {row.pop("client_id"): Counter(row) for row in rows}
+
+
+def add_article_stats(article_ids):
+    """Soma notícias recém-criadas aos contadores e agregados diários."""
+    article_ids = list(article_ids)
+    for client_id, counts in stats_by_client(article_ids).items():
+        apply_stats_deltas(client_id, counts)
+    if article_ids:
+        apply_rollup_deltas(rollup_counts(Article.objects.filter(pk__in=article_ids)))
+
+
+def apply_stats_changes(before, after):
+    """Aplica a diferença entre duas leituras de ``stats_by_client``."""
+    for client_id in before.keys() | after.keys():
+        old, new = before.get(client_id, Counter()), after.get(client_id, Counter())
+        apply_stats_deltas(client_id, {bucket: new[bucket] - old[bucket] for bucket in STATS_BUCKETS})
+
+
+ROLLUP_KEY_FIELDS = ("client_id", "day", "source", "provider", "validation_status")
+# Campos da notícia que decidem seu contador e seu agregado diário.
+ARTICLE_STATE_FIELDS = (
+    "client_id",
+    "excluded",
+    "validation_status",
+    "validation_reason",
+    "published_at",
+    "created_at",
+    "source",
+    "provider",
+    "canonical_article_id",
+)
+ARTICLE_STATE_UPDATE_FIELDS = {field.removesuffix("_id") for field in ARTICLE_STATE_FIELDS} | set(ARTICLE_STATE_FIELDS)
+
+
+def rollup_counts(articles) -> Counter:
+    """Contagens ``{(client_id, dia, fonte, provedor, status): n}`` das notícias do queryset."""
+    rows = (
+        articles.filter(excluded=False, canonical_article__isnull=True)
+        .annotate(day=TruncDate(Coalesce("published_at", "created_at")))
+        .values_list(*ROLLUP_KEY_FIELDS)
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    return Counter({tuple(row[:-1]): row[-1] for row in rows})
+
+
+def article_state(article):
+    """Valores de ``ARTICLE_STATE_FIELDS`` da notícia em memória, ou None se algum foi adiado."""
+    if article.get_deferred_fields() & set(ARTICLE_STATE_FIELDS):
+        return None
+    return tuple(getattr(article, field) for field in ARTICLE_STATE_FIELDS)
+
+
+def _rollup_key(state):
+    values = dict(zip(ARTICLE_STATE_FIELDS, state))
+    if values["excluded"] or values["canonical_article_id"]:
+        return None
+    moment = values["published_at"] or values["created_at"]
+    return (
+        values["client_id"],
+        timezone.localtime(moment).date() if timezone.is_aware(moment) else moment.date(),
+        values["source"] or "",
+        values["provider"] or "",
+        values["validation_status"],
+    )
+
+
+def apply_article_state_change(article_id, before, after, has_feedback=None):
+    """
+    Aplica aos contadores e agregados a troca de ``before`` para ``after``
+    (tuplas de ``article_state``; None quando a notícia não existia), sem
+    reler a notícia. A decisão manual só é consultada para rejeitadas.
+    """
+    if before == after:
+        return
+
+    def bucket(state):
+        nonlocal has_feedback
+        values = dict(zip(ARTICLE_STATE_FIELDS, state))
+        if values["validation_status"] == "REJECTED" and has_feedback is None:
+            has_feedback = ValidationFeedback.objects.filter(article_id=article_id).exists()
+        return article_stats_bucket(
+            values["excluded"],
+            values["validation_status"],
+            values["validation_reason"],
+            bool(has_feedback),
+        )
+
+    stats = defaultdict(Counter)
+    rollups = Counter()
+    for state, delta in ((before, -1), (after, 1)):
+        if state is None:
+            continue
+        client_bucket = bucket(state)
+        if client_bucket:
+            stats[state[0]][client_bucket] += delta
+        key = _rollup_key(state)
+        if key:
+            rollups[key] += delta
+    for client_id, deltas in stats.items():
+        apply_stats_deltas(client_id, deltas)
+    apply_rollup_deltas(rollups)
+
+
+def apply_rollup_deltas(deltas):
+    """Soma ``deltas`` aos agregados diários, criando e apagando linhas conforme preciso."""
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    with transaction.atomic():
+        existing = {
+            tuple(getattr(row, field) for field in ROLLUP_KEY_FIELDS): row
+            for row in ArticleDailyRollup.objects.select_for_update().filter(
+                client_id__in={key[0] for key in deltas},
+                day__in={key[1] for key in deltas},
+            )
+        }
+        changed, created, emptied = [], [], []
+        for key, delta in deltas.items():
+            row = existing.get(key)
+            if row is None:
+                if delta > 0:
+                    created.append(ArticleDailyRollup(**dict(zip(ROLLUP_KEY_FIELDS, key)), count=delta))
+                continue
+            row.count += delta
+            if row.count > 0:
+                changed.append(row)
+            else:
+                emptied.append(row.pk)
+        if changed:
+            ArticleDailyRollup.objects.bulk_update(changed, ["count"])
+        if emptied:
+            ArticleDailyRollup.objects.filter(pk__in=emptied).delete()
+        if created:
+            ArticleDailyRollup.objects.bulk_create(created, ignore_conflicts=True)
+
+
+def rollup_changes(before: Counter, after: Counter) -> dict:
+    return {key: after[key] - before[key] for key in before.keys() | after.keys()}
+
+
+@contextmanager
+def tracking_article_stats(article_ids, rollups: bool = True):
+    """Aplica aos contadores (e agregados diários) o que o bloco mudou nas notícias ``article_ids``.
+
+    Conta as notícias antes e depois do bloco (consultas agrupadas de cada
+    lado); deve rodar dentro da transação que faz a gravação. Gravações que
+    não mexem em status, fonte ou datas passam ``rollups=False``.
+    """
+    article_ids = list(article_ids)
+    articles = Article.objects.filter(pk__in=article_ids)
+    before = stats_by_client(article_ids)
+    before_rollups = rollup_counts(articles) if rollups and article_ids else Counter()
+    yield
+    apply_stats_changes(before, stats_by_client(article_ids))
+    if rollups and article_ids:
+        apply_rollup_deltas(rollup_changes(before_rollups, rollup_counts(articles)))
+
+
+def count_client_articles(client_id) -> dict:
+    """Contagem completa dos contadores do cliente, numa única consulta."""
+    return Article.objects.filter(client_id=client_id, excluded=False).aggregate(**_bucket_aggregates())
+
+
+def rebuild_client_article_stats(client_id) -> ClientArticleStats:
+    stats, _created = ClientArticleStats.objects.update_or_create(
+        client_id=client_id,
+        defaults=count_client_articles(client_id),
+    )
+    return stats
+
+
+def client_article_counts(client) -> dict:
+    """Contadores das abas do cliente: leitura pela chave primária."""
+    stats = ClientArticleStats.objects.filter(client_id=client.pk).first()
+    if stats is None:
+        stats = rebuild_client_article_stats(client.pk)
+    counts = {bucket: getattr(stats, bucket) for bucket in STATS_BUCKETS}
+    counts["pending"] = stats.pending
+    return counts
+
+
+def rebuild_article_rollups(client_id) -> tuple[Counter, Counter]:
+    """Recalcula os agregados diários do cliente; devolve as contagens antigas e novas."""
+    with transaction.atomic():
+        rows = ArticleDailyRollup.objects.filter(client_id=client_id)
+        previous = Counter(
+            {tuple(row[:-1]): row[-1] for row in rows.values_list(*ROLLUP_KEY_FIELDS, "count")}
+        )
+        current = rollup_counts(Article.objects.filter(client_id=client_id))
+        rows.delete()
+        ArticleDailyRollup.objects.bulk_create(
+            [ArticleDailyRollup(**dict(zip(ROLLUP_KEY_FIELDS, key)), count=total) for key, total in current.items()],
+            batch_size=1000,
+        )
+    return previous, current
+
+
+def rollup_chart_series(client, accepted: bool, source: str = "", top_sources: int = 5):
+    """Notícias por dia e fontes mais frequentes da aba do cliente, numa consulta agrupada."""
+    rows = ArticleDailyRollup.objects.filter(client=client)
+    rows = rows.filter(validation_status="ACCEPTED") if accepted else rows.exclude(validation_status="ACCEPTED")
+    if source:
+        rows = rows.filter(source__iexact=source)
+    daily = Counter()
+    sources = Counter()
+    for day, row_source, total in rows.values_list("day", "source").annotate(total=Sum("count")).order_by("day"):
+        daily[day] += total
+        if row_source:
+            sources[row_source] += total
+    return sorted(daily.items()), sources.most_common(top_sources)
+
+
+def rollup_coverage(client_ids, since_day) -> dict:
+    """Por cliente: validadas recentes, fontes e provedores das validadas, numa consulta agrupada."""
+    coverage = {client_id: {"recent": 0, "sources": set(), "providers": set()} for client_id in client_ids}
+    rows = (
+        ArticleDailyRollup.objects.filter(client_id__in=list(client_ids), validation_status="ACCEPTED")
+        .values_list("client_id", "source", "provider")
+        .annotate(recent=Sum("count", filter=Q(day__gte=since_day)))
+        .order_by()
+    )
+    for client_id, source, provider, recent in rows:
+        item = coverage[client_id]
+        item["recent"] += recent or 0
+        item["sources"].add(source)
+        item["providers"].add(provider)
+    return coverage
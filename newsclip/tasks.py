@@ -49,6 +49,47 @@ def fetch_news_task(client_id, job_id=None, quick=True):
         raise
 
 
+def revalidate_client_task(job_id):
+    """
+    Task do Django Q que revalida em blocos as noticias desatualizadas de um cliente.
+    """
+    from .models import RevalidationJob
+    from .revalidation import run_revalidation_job
+
+    job = RevalidationJob.objects.select_related("client").filter(pk=job_id).first()
+    if job is None:
+        return f"Revalidacao {job_id} nao encontrada."
+    try:
+        job = run_revalidation_job(job)
+    except Exception as e:
+        logger.exception(f"Error in revalidate_client_task for job_id={job_id}: {e}")
+        RevalidationJob.objects.filter(pk=job_id).update(
+            status="failed",
+            finished_at=timezone.now(),
+            error_message=str(e),
+            updated_at=timezone.now(),
+        )
+        raise
+    return f"Revalidacao concluida para o cliente {job.client_id}: {job.processed} processadas, {job.changed} alteradas."
+
+
+def rescore_learning_task(client_id, features):
+    """
+    Task do Django Q que repontua as noticias afetadas por novas decisoes manuais.
+    """
+    from .models import Client
+    from .revalidation import rescore_learning_changes
+
+    client = Client.objects.filter(pk=client_id).first()
+    if client is None:
+        return f"Cliente {client_id} nao encontrado."
+    stats = rescore_learning_changes(client, features)
+    return (
+        f"Aprendizado aplicado ao cliente {client_id}: "
+        f"{stats['processed']} repontuadas, {stats['changed']} alteradas."
+    )
+
+
 def extract_youtube_transcript_task(job_id):
     from .models import TranscriptExtraction
     from .transcripts import TranscriptError, extract_transcript
@@ -1,55 +1,137 @@
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.management import call_command
-from django.test import RequestFactory, TestCase, override_settings
+from django.db import connection
+from django.db.models import F
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
+from concurrent.futures import Future
+from contextlib import nullcontext
 from datetime import datetime, timedelta
+from io import StringIO
 from unittest.mock import Mock, patch
 
+import hashlib
+import requests
+import time
+
 from feedparser import FeedParserDict
 
+from newsclip import http_client, politeness, profiles
+from newsclip.async_engine import AsyncFetchEngine, Candidate
 from newsclip.management.commands.fetch_news import Command, ensure_essential_news_sources
 from newsclip.discovery import (
     build_discovery_queries,
+    collect_sitemap_feed,
     discover_client_sources,
-    fetch_sitemap_endpoint,
     maybe_promote_source,
-    parse_sitemap,
     profile_source,
+    robots_crawl_delay,
+    save_sitemap_items,
+)
+from newsclip.learning import (
+    _feature_label,
+    extract_learning_features,
+    get_client_learning_profile,
+    index_article_learning_features,
+    invalidate_client_learning_profile,
+    learned_score_adjustment,
+    learned_score_adjustments,
+    mark_learning_rescored,
+    record_manual_feedback,
 )
-from newsclip.learning import invalidate_client_learning_profile, learned_score_adjustment
+from newsclip.matching import client_matcher
 from newsclip.google_cse import build_google_cse_queries, fetch_google_cse
 from newsclip.models import (
     Article,
+    ArticleDailyRollup,
+    ArticleLearningFeature,
     Client,
+    ClientArticleStats,
     DiscoveryResult,
     DiscoveryRun,
     FetchLog,
     GeneratedReport,
+    LearningFeatureCount,
+    LearningRescoreState,
     NewsFetchJob,
+    RelevanceAuditLog,
+    RevalidationJob,
     Source,
     SourceEndpoint,
     ValidationFeedback,
 )
+from newsclip.pagination import keyset_order_by
 from newsclip.providers import fetch_gdelt, fetch_youtube
 from newsclip.signals import update_search_vector
-from newsclip.tasks import fetch_news_task
+from newsclip.simulation import forget_article_projection, simulate_client_terms
+from newsclip.stats import (
+    STATS_BUCKETS,
+    client_article_counts,
+    count_client_articles,
+    rollup_counts,
+    tracking_article_stats,
+)
+from newsclip.revalidation import (
+    enqueue_revalidation,
+    rescore_learning_changes,
+    run_revalidation_job,
+    split_id_range,
+)
+from newsclip.tasks import fetch_news_task, revalidate_client_task
 from newsclip.templatetags.source_extras import domain
 from newsclip.utils import (
+    TRIAGE_FIELDS,
+    TRIAGE_ORDERING,
+    TRIAGE_PRIORITY_SOURCES,
     build_essential_source_queries,
     canonicalize_source_name,
+    current_rules_version,
     deduplicate_articles_for_display,
+    display_articles_queryset,
+    is_duplicate_article,
     legacy_keyword_identity_terms,
     record_endpoint_failure,
+    remember_fetch_validators,
     revalidate_article,
+    revalidate_articles_batch,
+    revalidate_pending_articles_for_client,
     sanitize_sensitive_text,
     save_article,
+    save_articles,
+    triage_score_band,
     validate_article_candidate,
 )
 from newsclip.views import check_task_status
 
 
+def run_revalidation_inline(func, job_id, **kwargs):
+    """Substitui o ``async_task`` da revalidação executando o job na hora."""
+    revalidate_client_task(job_id)
+    return f"inline-{job_id}"
+
+
+class InlineProcessPool:
+    """Substitui o ``ProcessPoolExecutor`` executando cada tarefa no próprio processo."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, func, *args, **kwargs):
+        future = Future()
+        future.set_result(func(*args, **kwargs))
+        return future
+
+
 class DomainFilterTests(TestCase):
     def test_domain_filter_removes_www_prefix(self):
         """domain filter deve extrair o host sem o prefixo www."""
@@ -147,6 +229,102 @@ class NewsCollectionRecallTests(TestCase):
         self.assertEqual(Article.objects.filter(client=self.client_a).count(), 1)
         self.assertEqual(Article.objects.get(client=self.client_a).url, "https://jornal.example/materia")
 
+    def test_batch_save_dedups_within_batch_and_skips_existing(self):
+        existing = save_article(self.client_a, "São Paulo abre inscrições", "https://a.example/existente", None, "Fonte A")
+        candidates = [
+            {"title": "São Paulo abre inscrições", "url": "https://a.example/existente", "raw_date": None, "source": "Fonte A"},
+            {"title": "São Paulo inaugura escola", "url": "https://a.example/escola?utm_source=x", "raw_date": None, "source": "Fonte A"},
+            {"title": "São Paulo inaugura escola", "url": "https://a.example/escola", "raw_date": None, "source": "Fonte A"},
+            {"title": "Tempo firme no litoral", "url": "https://a.example/tempo", "raw_date": None, "source": "Fonte A"},
+        ]
+
+        saved = save_articles(self.client_a, candidates)
+
+        self.assertEqual(len(saved), 4)
+        self.assertIsNone(saved[0])
+        self.assertEqual(saved[1].url, "https://a.example/escola")
+        self.assertIsNone(saved[2])
+        self.assertIsNone(saved[3])
+        self.assertEqual(Article.objects.filter(client=self.client_a).count(), 2)
+        self.assertTrue(Article.objects.get(pk=saved[1].pk).search_vector)
+        self.assertEqual(Article.objects.get(pk=existing.pk).title, "São Paulo abre inscrições")
+        self.assertEqual(RelevanceAuditLog.objects.filter(client=self.client_a).count(), 5)
+
+    def test_batch_save_does_not_count_rows_inserted_by_a_concurrent_collector(self):
+        candidates = [
+            {"title": "São Paulo inaugura escola", "url": "https://a.example/escola", "raw_date": None, "source": "Fonte A"},
+            {"title": "São Paulo abre creche", "url": "https://a.example/creche", "raw_date": None, "source": "Fonte A"},
+        ]
+        client_article_counts(self.client_a)
+        concurrent = []
+
+        def summary_racing_other_collector(text):
+            # Outra coleta grava a mesma URL depois da busca por existentes.
+            if not concurrent:
+                concurrent.append(
+                    Article.objects.create(
+                        client=self.client_a,
+                        title="São Paulo inaugura escola",
+                        url="https://a.example/escola",
+                        source="Fonte A",
+                        dedup_key="coleta-concorrente",
+                    )
+                )
+            return text
+
+        with patch("newsclip.utils.generate_summary", side_effect=summary_racing_other_collector):
+            saved = save_articles(self.client_a, candidates)
+
+        self.assertIsNone(saved[0])
+        self.assertEqual(saved[1].url, "https://a.example/creche")
+        self.assertEqual(Article.objects.filter(client=self.client_a).count(), 2)
+        stats = ClientArticleStats.objects.get(client=self.client_a)
+        self.assertEqual(
+            {bucket: getattr(stats, bucket) for bucket in STATS_BUCKETS},
+            count_client_articles(self.client_a.pk),
+        )
+
+    def test_duplicate_check_uses_fingerprints_of_legacy_rows(self):
+        legacy = Article.objects.create(
+            client=self.client_a,
+            title="São Paulo amplia vacinação - Jornal Exemplo",
+            url="https://jornal.example/vacina?utm_source=newsletter",
+            source="Jornal Exemplo",
+        )
+        Article.objects.filter(pk=legacy.pk).update(title_fingerprint="", url_hash="")
+
+        self.assertFalse(is_duplicate_article(self.client_a, "Outro assunto", "Jornal Exemplo", "https://jornal.example/vacina"))
+        call_command("backfill_article_fingerprints", "--batch-size", "1", stdout=StringIO())
+
+        legacy.refresh_from_db()
+        self.assertTrue(legacy.url_hash and legacy.title_fingerprint)
+        self.assertTrue(is_duplicate_article(self.client_a, "Outro assunto", "Jornal Exemplo", "https://jornal.example/vacina"))
+        self.assertTrue(
+            is_duplicate_article(self.client_a, "São Paulo amplia vacinação", "Jornal Exemplo", "https://jornal.example/outra")
+        )
+        self.assertFalse(
+            is_duplicate_article(self.client_a, "São Paulo amplia vacinação", "Outro Jornal", "https://outro.example/x")
+        )
+
+    def test_republished_story_is_linked_to_canonical_and_collapsed_for_display(self):
+        content = "A prefeitura de São Paulo anunciou nesta segunda um novo programa de obras nos bairros da zona leste."
+        first = save_article(
+            self.client_a, "São Paulo lança programa de obras na zona leste", "https://a.example/obras", None, "Fonte A", content
+        )
+        copy = save_article(
+            self.client_a, "São Paulo lança programa de obras na zona leste", "https://b.example/obras", None, "Fonte B", content
+        )
+        other = save_article(
+            self.client_a, "São Paulo recebe festival de música no fim de semana", "https://c.example/festival", None, "Fonte C"
+        )
+
+        self.assertIsNone(first.canonical_article_id)
+        self.assertEqual(Article.objects.get(pk=copy.pk).canonical_article_id, first.pk)
+        self.assertIsNone(Article.objects.get(pk=other.pk).canonical_article_id)
+        visible = deduplicate_articles_for_display(Article.objects.filter(client=self.client_a).order_by("id"))
+        self.assertEqual([article.pk for article in visible], [first.pk, other.pk])
+        self.assertEqual(visible[0].republication_count, 1)
+
     def test_same_title_from_different_sources_preserves_each_publication(self):
         save_article(self.client_a, "Noticia importante de São Paulo", "https://a.example/1", None, "Fonte A")
         save_article(self.client_a, "Noticia importante de São Paulo", "https://b.example/2", None, "Fonte B")
@@ -194,7 +372,9 @@ class NewsCollectionRecallTests(TestCase):
         self.assertFalse(Article.objects.filter(client=self.client_a).exists())
 
     @patch("newsclip.management.commands.fetch_news.feedparser.parse")
-    def test_rss_matches_accent_insensitive_keyword_in_summary(self, parse_mock):
+    @patch("newsclip.http_client.get")
+    def test_rss_matches_accent_insensitive_keyword_in_summary(self, get_mock, parse_mock):
+        get_mock.return_value = Mock(content=b"<rss/>", status_code=200, headers={})
         source = Source.objects.create(
             name="Fonte RSS",
             url="https://example.com/feed.xml",
@@ -210,15 +390,74 @@ class NewsCollectionRecallTests(TestCase):
             ]
         )
 
-        saved = Command().fetch_single_rss(
-            self.client_a, source, ["São Paulo"], timezone.now() - timedelta(days=90)
-        )
+        command = Command()
+        [shared_feed] = command.collect_shared_feeds(timezone.now() - timedelta(days=90))
+        saved = command.save_shared_feed(self.client_a, shared_feed, ["São Paulo"])
 
+        self.assertEqual(shared_feed.source, source)
         self.assertEqual(saved, 1)
         self.assertTrue(Article.objects.filter(client=self.client_a, url="https://example.com/agenda").exists())
 
+    @override_settings(GDELT_ENABLED=False, GOOGLE_CSE_ENABLED=False, YOUTUBE_API_KEY="")
+    @patch("newsclip.management.commands.fetch_news.Command.fetch_google_rss", return_value=0)
+    @patch(
+        "newsclip.management.commands.fetch_news.save_articles",
+        side_effect=lambda client, articles: [None] * len(articles),
+    )
     @patch("newsclip.management.commands.fetch_news.feedparser.parse")
-    @patch("newsclip.management.commands.fetch_news.requests.get")
+    @patch("newsclip.http_client.get")
+    def test_full_run_downloads_each_shared_feed_once_for_all_clients(self, get_mock, parse_mock, save_mock, _google_mock):
+        source = Source.objects.create(name="Fonte RSS", url="https://example.com/feed.xml", source_type="RSS")
+        get_mock.return_value = Mock(content=b"<rss/>", status_code=200, headers={"ETag": '"v1"'})
+        parse_mock.return_value = FeedParserDict(
+            entries=[
+                FeedParserDict(
+                    title="Agenda econômica em Sao Paulo",
+                    link="https://example.com/agenda-compartilhada",
+                    summary="Evento importante.",
+                )
+            ]
+        )
+
+        call_command("fetch_news")
+
+        get_mock.assert_called_once()
+        parse_mock.assert_called_once_with(b"<rss/>")
+        saved_clients = {call.args[0] for call in save_mock.call_args_list if call.args[1]}
+        self.assertEqual(saved_clients, {self.client_a, self.client_b})
+        self.assertEqual(
+            {article["url"] for call in save_mock.call_args_list for article in call.args[1]},
+            {"https://example.com/agenda-compartilhada"},
+        )
+        source.refresh_from_db()
+        self.assertEqual(source.etag, '"v1"')
+        self.assertTrue(source.content_hash)
+
+    @override_settings(GDELT_ENABLED=False, GOOGLE_CSE_ENABLED=False, YOUTUBE_API_KEY="")
+    @patch("newsclip.management.commands.fetch_news.Command.fetch_google_rss", return_value=0)
+    @patch("newsclip.management.commands.fetch_news.save_articles")
+    @patch("newsclip.management.commands.fetch_news.feedparser.parse")
+    @patch("newsclip.http_client.get")
+    def test_full_run_skips_feed_not_modified_since_last_fetch(self, get_mock, parse_mock, save_mock, _google_mock):
+        Source.objects.create(
+            name="Fonte RSS",
+            url="https://example.com/feed.xml",
+            source_type="RSS",
+            etag='"v1"',
+            last_modified="Sat, 17 Oct 2026 10:00:00 GMT",
+        )
+        get_mock.return_value = Mock(content=b"", status_code=304, headers={})
+
+        call_command("fetch_news")
+
+        headers = get_mock.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(headers["If-Modified-Since"], "Sat, 17 Oct 2026 10:00:00 GMT")
+        parse_mock.assert_not_called()
+        save_mock.assert_not_called()
+
+    @patch("newsclip.management.commands.fetch_news.feedparser.parse")
+    @patch("newsclip.http_client.get")
     def test_google_rss_uses_one_query_per_keyword(self, get_mock, parse_mock):
         get_mock.return_value = Mock(content=b"", status_code=200)
         get_mock.return_value.raise_for_status.return_value = None
@@ -231,7 +470,7 @@ class NewsCollectionRecallTests(TestCase):
         self.assertEqual(get_mock.call_count, 2)
 
     @patch("newsclip.management.commands.fetch_news.feedparser.parse")
-    @patch("newsclip.management.commands.fetch_news.requests.get")
+    @patch("newsclip.http_client.get")
     def test_google_rss_respects_explicit_query_limit(self, get_mock, parse_mock):
         get_mock.return_value = Mock(content=b"", status_code=200)
         get_mock.return_value.raise_for_status.return_value = None
@@ -393,6 +632,112 @@ class AdvancedValidationTests(TestCase):
         self.assertIn("Prefeito de Rio Preto", client.name_variations)
         self.assertEqual(article.validation_status, "ACCEPTED")
 
+    def test_pending_revalidation_writes_one_update_per_chunk(self):
+        client = Client.objects.create(name="Fábio Candido", name_variations="Prefeito de Rio Preto")
+        for index in range(5):
+            Article.objects.create(
+                client=client,
+                title=f"Prefeito de Rio Preto sanciona lei {index}",
+                url=f"https://g1.globo.com/sp/rio-preto/noticia/lote-{index}",
+                source="G1",
+                published_at=timezone.now(),
+                validation_status="REVIEW",
+                relevance_score=55,
+                dedup_key=f"chunk-revalidate-review-{index}",
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            stats = revalidate_pending_articles_for_client(client, chunk_size=2)
+
+        article_updates = [
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "newsclip_article"')
+        ]
+        self.assertEqual(len(article_updates), 3)
+        self.assertEqual((stats["processed"], stats["promoted"], stats["accepted"]), (5, 5, 5))
+        self.assertFalse(Article.objects.filter(client=client).exclude(validation_status="ACCEPTED").exists())
+
+    @patch("newsclip.revalidation.ProcessPoolExecutor", InlineProcessPool)
+    def test_revalidate_pending_command_with_workers_splits_id_range(self):
+        client = Client.objects.create(name="Fábio Candido", name_variations="Prefeito de Rio Preto")
+        for index in range(6):
+            Article.objects.create(
+                client=client,
+                title=f"Prefeito de Rio Preto inaugura obra {index}",
+                url=f"https://g1.globo.com/sp/rio-preto/noticia/paralelo-{index}",
+                source="G1",
+                published_at=timezone.now(),
+                validation_status="REJECTED" if index % 2 else "REVIEW",
+                relevance_score=30,
+                dedup_key=f"parallel-revalidate-{index}",
+            )
+        output = StringIO()
+
+        call_command(
+            "revalidate_pending_articles",
+            "--client-id",
+            str(client.pk),
+            "--workers",
+            "2",
+            stdout=output,
+        )
+
+        self.assertIn("Processados: 6", output.getvalue())
+        self.assertIn("Promovidos para ACCEPTED: 6", output.getvalue())
+        self.assertEqual(
+            set(Article.objects.filter(client=client).values_list("validation_status", "rules_version")),
+            {("ACCEPTED", current_rules_version(client))},
+        )
+        self.assertEqual(split_id_range(1, 11, 3), [(1, 5), (5, 8), (8, 11)])
+        self.assertEqual(split_id_range(7, 9, 8), [(7, 8), (8, 9)])
+
+    def test_simulate_client_terms_reports_transitions_without_saving(self):
+        forget_article_projection()
+        self.addCleanup(forget_article_projection)
+        client = Client.objects.create(name="Fábio Candido")
+        review = Article.objects.create(
+            client=client,
+            title="Prefeito de Rio Preto sanciona lei importante",
+            url="https://g1.globo.com/sp/rio-preto/noticia/simulacao",
+            source="G1",
+            published_at=timezone.now(),
+            validation_status="REVIEW",
+            relevance_score=55,
+            dedup_key="simulation-review",
+        )
+        Article.objects.create(
+            client=client,
+            title="Prefeito de Rio Preto visita obra",
+            url="https://g1.globo.com/sp/rio-preto/noticia/manual",
+            source="G1",
+            published_at=timezone.now(),
+            validation_status="REVIEW",
+            relevance_score=55,
+            validation_reason="Marcada pelo usuario",
+            dedup_key="simulation-manual",
+        )
+
+        result = simulate_client_terms(client, name_variations="Prefeito de Rio Preto")
+
+        self.assertEqual(result["processed"], 1)
+        self.assertEqual(result["transitions"], [(("REVIEW", "ACCEPTED"), 1)])
+        self.assertEqual([sample["id"] for sample in result["promoted"]], [review.pk])
+        review.refresh_from_db()
+        client.refresh_from_db()
+        self.assertEqual(review.validation_status, "REVIEW")
+        self.assertEqual(client.name_variations, "")
+
+        output = StringIO()
+        call_command(
+            "simulate_client_terms",
+            "--client-id",
+            str(client.pk),
+            "--add-name-variation",
+            "Prefeito de Rio Preto",
+            stdout=output,
+        )
+        self.assertIn("REVIEW -> ACCEPTED: 1", output.getvalue())
+
     def test_prefeitura_context_without_mayor_entity_is_not_accepted(self):
         client = Client.objects.create(
             name="Fábio Candido",
@@ -410,6 +755,52 @@ class AdvancedValidationTests(TestCase):
 
         self.assertNotEqual(result["status"], "ACCEPTED")
 
+    def test_revalidation_skips_articles_scored_under_current_rules(self):
+        article = Article.objects.create(
+            client=self.client_record,
+            title="Rio Preto anuncia plano de mobilidade urbana",
+            url="https://jornal.example/plano-mobilidade",
+            source="Jornal Local",
+            published_at=timezone.now(),
+            validation_status="ACCEPTED",
+            relevance_score=90,
+        )
+
+        revalidate_pending_articles_for_client(self.client_record, ["ACCEPTED"])
+        article.refresh_from_db()
+        self.assertEqual(article.rules_version, current_rules_version(self.client_record))
+        self.assertEqual(
+            revalidate_pending_articles_for_client(self.client_record, ["ACCEPTED"])["processed"],
+            0,
+        )
+
+        self.client_record.excluded_keywords = "mobilidade urbana"
+        self.client_record.save()
+        revalidate_pending_articles_for_client(self.client_record, ["ACCEPTED"])
+        article.refresh_from_db()
+        self.assertEqual(article.validation_status, "REJECTED")
+        self.assertEqual(article.rules_version, current_rules_version(self.client_record))
+
+    def test_compiled_matcher_is_reused_until_client_terms_change(self):
+        matcher = client_matcher(self.client_record)
+
+        self.assertIs(client_matcher(Client.objects.get(pk=self.client_record.pk)), matcher)
+        self.assertEqual(matcher.matched("noticia de rio preto", matcher.identity_terms), ["Rio Preto"])
+        self.assertTrue(matcher.contains_excluded("evento em rio preto da eva"))
+
+        self.client_record.excluded_keywords = ""
+        self.client_record.save()
+        result = validate_article_candidate(
+            self.client_record,
+            "Evento em Rio Preto da Eva",
+            "Agenda do Amazonas",
+            "https://amazonas.example/evento",
+            "Fonte Amazonas",
+        )
+
+        self.assertIsNot(client_matcher(self.client_record), matcher)
+        self.assertNotEqual(result["reason"], "Contem termo proibido")
+
 
 
 @override_settings(
@@ -426,6 +817,8 @@ class ValidationLearningTests(TestCase):
             name="Cliente Regional",
             excluded_keywords="Cidade Homonima",
         )
+        profiles.reset_local_cache()
+        self.addCleanup(profiles.reset_local_cache)
 
     def add_feedback(self, decision, title, source):
         return ValidationFeedback.objects.create(
@@ -467,6 +860,207 @@ class ValidationLearningTests(TestCase):
         self.assertIn("aprendizado manual", accepted_reason)
         self.assertIn("aprendizado manual", rejected_reason)
 
+    def test_batch_learned_adjustments_match_single_feature_lookup(self):
+        self.add_feedback("ACCEPTED", "Cliente Regional anuncia obra de mobilidade", "G1")
+        self.add_feedback("ACCEPTED", "Cliente Regional entrega corredor de mobilidade", "G1")
+        self.add_feedback("ACCEPTED", "Cliente Regional amplia obra de saneamento", "Jornal Local")
+        self.add_feedback("REJECTED", "Congresso vota regra nacional sem relacao local", "Blog Generico")
+        self.add_feedback("REJECTED", "Congresso debate pauta nacional sem relacao local", "Blog Generico")
+        candidates = [
+            ("Cliente Regional apresenta obra", "", "G1", "GOOGLE_CSE"),
+            ("Congresso analisa pauta nacional", "Cobertura regional", "Blog Generico", "GOOGLE_CSE"),
+            ("Texto sem nenhuma feature conhecida", "", "", ""),
+            ("Cliente Regional no Congresso", "mobilidade nacional", "Jornal Local", "GDELT"),
+        ]
+        profile = get_client_learning_profile(self.client_record)
+
+        def reference(title, content, source, provider):
+            features = extract_learning_features(title, content, source, provider)
+            matched = [(feature, profile["weights"][feature]) for feature in features if feature in profile["weights"]]
+            if not matched:
+                return 0, ""
+            strongest = sorted(matched, key=lambda item: abs(item[1]), reverse=True)[:5]
+            adjustment = max(-12, min(12, int(round(sum(weight for _, weight in strongest) / len(strongest) * 6))))
+            if adjustment == 0:
+                return 0, ""
+            signals = ", ".join(_feature_label(feature) for feature, _ in strongest[:3])
+            return adjustment, f"aprendizado manual {adjustment:+d} ({signals}; 5 exemplos)"
+
+        batch = learned_score_adjustments(self.client_record, candidates)
+
+        self.assertEqual(batch, [reference(*candidate) for candidate in candidates])
+        self.assertGreater(batch[0][0], 0)
+        self.assertLess(batch[1][0], 0)
+        self.assertEqual(batch[2], (0, ""))
+
+    def test_profile_version_bumps_on_profile_change_and_feedback(self):
+        version = self.client_record.profile_version
+
+        self.client_record.save()
+        self.assertEqual(self.client_record.profile_version, version)
+        self.client_record.context_terms = "mobilidade"
+        self.client_record.save()
+        self.assertEqual(self.client_record.profile_version, version + 1)
+
+        self.add_feedback("ACCEPTED", "Cliente Regional anuncia obra de mobilidade", "G1")
+        self.client_record.refresh_from_db()
+        self.assertEqual(self.client_record.profile_version, version + 2)
+
+        learned_score_adjustment(self.client_record, title="Cliente Regional em pauta")
+        self.assertIsNotNone(profiles.profile_cache().get(f"learning:{self.client_record.pk}:{version + 2}"))
+
+    def test_manual_feedback_keeps_valid_articles_when_one_fails(self):
+        articles = [
+            Article.objects.create(
+                client=self.client_record,
+                title=f"Cliente Regional visita bairro {index}",
+                url=f"https://jornal.example/visita-{index}",
+                source="G1",
+                published_at=timezone.now(),
+                validation_status="REVIEW",
+                relevance_score=55,
+                dedup_key=f"feedback-isolado-{index}",
+            )
+            for index in range(2)
+        ]
+        articles[1].relevance_score = "sem nota"
+
+        with self.assertLogs("newsclip", level="ERROR") as logs:
+            self.assertEqual(record_manual_feedback(articles, "ACCEPTED"), 1)
+
+        self.assertTrue(ValidationFeedback.objects.filter(article=articles[0], decision="ACCEPTED").exists())
+        self.assertFalse(ValidationFeedback.objects.filter(article=articles[1]).exists())
+        self.assertEqual(len(logs.records), 2)
+
+    def test_client_saved_as_copy_or_after_delete_is_inserted(self):
+        copy = Client.objects.get(pk=self.client_record.pk)
+        copy.pk = None
+        copy.name = "Cliente Copiado"
+        copy.save()
+        self.assertNotEqual(copy.pk, self.client_record.pk)
+
+        removed = Client.objects.create(name="Cliente Removido")
+        removed.delete()
+        removed.save()
+        self.assertTrue(Client.objects.filter(pk=removed.pk, name="Cliente Removido").exists())
+
+        forced = Client.objects.get(pk=removed.pk)
+        forced.pk = removed.pk + 100
+        forced.save(force_insert=True)
+        self.assertEqual(Client.objects.filter(name="Cliente Removido").count(), 2)
+        self.assertEqual(forced.profile_fingerprint, forced.compute_profile_fingerprint())
+
+    def test_feature_counts_follow_manual_decisions_incrementally(self):
+        articles = [
+            Article.objects.create(
+                client=self.client_record,
+                title=f"Cliente Regional anuncia obra {index}",
+                url=f"https://jornal.example/obra-{index}",
+                source="G1",
+                provider="GOOGLE_CSE",
+                published_at=timezone.now(),
+                validation_status="REVIEW",
+                relevance_score=55,
+                dedup_key=f"learning-counts-{index}",
+            )
+            for index in range(3)
+        ]
+
+        def counts(feature):
+            return LearningFeatureCount.objects.filter(
+                client=self.client_record, feature=feature
+            ).values_list("accepted", "rejected").first()
+
+        with self.assertNumQueries(18):
+            self.assertEqual(record_manual_feedback(articles, "ACCEPTED"), 3)
+        self.assertEqual(counts("source:g1"), (3, 0))
+        self.assertEqual(counts("title:obra"), (3, 0))
+
+        record_manual_feedback(articles[:1], "REJECTED")
+        self.assertEqual(counts("source:g1"), (2, 1))
+        self.assertEqual(counts("title:0"), None)
+
+        ValidationFeedback.objects.get(article=articles[0]).delete()
+        self.assertEqual(counts("source:g1"), (2, 0))
+        self.add_feedback("REJECTED", "Congresso vota regra nacional", "G1")
+        self.assertEqual(counts("source:g1"), (2, 1))
+
+        incremental = set(
+            LearningFeatureCount.objects.filter(client=self.client_record).values_list("feature", "accepted", "rejected")
+        )
+        call_command("rebuild_learning_feature_counts", client_id=self.client_record.pk, stdout=StringIO())
+        self.assertEqual(
+            set(LearningFeatureCount.objects.filter(client=self.client_record).values_list("feature", "accepted", "rejected")),
+            incremental,
+        )
+        profile = get_client_learning_profile(self.client_record)
+        self.assertEqual((profile["accepted"], profile["rejected"]), (2, 1))
+
+    @override_settings(LEARNING_RESCORE_MIN_SCORE_CHANGE=3)
+    def test_feedback_rescores_only_articles_with_moved_features(self):
+        for index in range(4):
+            self.add_feedback("ACCEPTED", f"Cliente Regional entrega obra {index}", "G1")
+            self.add_feedback("REJECTED", f"Congresso vota regra nacional {index}", "Blog Generico")
+        # As notícias já foram repontuadas com as decisões acima.
+        mark_learning_rescored(self.client_record.pk, None, totals=(4, 4))
+
+        def article(title, **extra):
+            return Article.objects.create(
+                client=self.client_record,
+                title=title,
+                url=f"https://jornal.example/{title.lower().replace(' ', '-')}",
+                source="G1",
+                provider="GOOGLE_CSE",
+                published_at=timezone.now(),
+                validation_status="REVIEW",
+                relevance_score=55,
+                dedup_key=title.lower(),
+                **extra,
+            )
+
+        target = article("Cliente Regional amplia saneamento")
+        untouched = article("Cliente Regional recebe visita")
+        decided = [article("Prefeitura amplia saneamento basico"), article("Governo libera saneamento basico")]
+        index_article_learning_features([target, untouched] + decided)
+        self.assertTrue(
+            ArticleLearningFeature.objects.filter(article=target, feature="title:saneamento").exists()
+        )
+
+        with patch("newsclip.revalidation.async_task") as async_task_mock, self.captureOnCommitCallbacks(execute=True):
+            record_manual_feedback(decided, "ACCEPTED")
+        features = async_task_mock.call_args.args[2]
+        self.assertIn("title:saneamento", features)
+        self.assertNotIn("source:g1", features)
+
+        stats = rescore_learning_changes(self.client_record, features)
+        self.assertEqual(stats["processed"], 1)
+        target.refresh_from_db()
+        untouched.refresh_from_db()
+        self.assertIn("aprendizado manual", target.validation_reason)
+        self.assertEqual((untouched.relevance_score, untouched.validation_reason), (55, ""))
+
+    @override_settings(LEARNING_RESCORE_MIN_SCORE_CHANGE=1)
+    def test_small_learning_shifts_accumulate_until_full_rescore(self):
+        for index in range(4):
+            self.add_feedback("ACCEPTED", f"Cliente Regional entrega obra {index}", "G1")
+            self.add_feedback("REJECTED", f"Congresso vota regra nacional {index}", "Blog Generico")
+        state = LearningRescoreState.objects.get(client=self.client_record)
+        self.assertEqual((state.accepted_total, state.rejected_total), (4, 4))
+
+        # Cada decisão desloca os pesos abaixo do limite; a segunda soma com a primeira.
+        with patch("newsclip.signals.schedule_learning_rescore") as schedule_mock:
+            self.add_feedback("ACCEPTED", "Feira cultural abre inscricoes", "Portal Vizinho")
+            self.assertIsNotNone(schedule_mock.call_args.args[1])
+            self.add_feedback("ACCEPTED", "Mutirao limpa avenidas", "Portal Vizinho")
+            self.assertIsNone(schedule_mock.call_args.args[1])
+        state.refresh_from_db()
+        self.assertEqual((state.accepted_total, state.rejected_total), (6, 4))
+        self.assertFalse(
+            LearningFeatureCount.objects.filter(client=self.client_record)
+            .exclude(scored_accepted=F("accepted"))
+            .exists()
+        )
+
     @override_settings(
         VALIDATION_LEARNING_MIN_ACCEPTED=3,
         VALIDATION_LEARNING_MIN_REJECTED=3,
@@ -486,8 +1080,10 @@ class ValidationLearningTests(TestCase):
         self.assertEqual(reason, "")
 
     @patch(
-        "newsclip.learning.learned_score_adjustment",
-        return_value=(12, "aprendizado manual +12 (fonte confiavel; 8 exemplos)"),
+        "newsclip.learning.learned_score_adjustments",
+        side_effect=lambda client, candidates: [
+            (12, "aprendizado manual +12 (fonte confiavel; 8 exemplos)")
+        ] * len(candidates),
     )
     def test_learning_can_promote_borderline_candidate(self, learning_mock):
         self.client_record.name = "Fabio Candido"
@@ -509,7 +1105,7 @@ class ValidationLearningTests(TestCase):
         self.assertIn("aprendizado manual +12", result["reason"])
         learning_mock.assert_called_once()
 
-    @patch("newsclip.learning.learned_score_adjustment")
+    @patch("newsclip.learning.learned_score_adjustments")
     def test_excluded_keyword_remains_absolute(self, learning_mock):
         result = validate_article_candidate(
             self.client_record,
@@ -739,7 +1335,7 @@ class AdditionalProvidersTests(TestCase):
         GOOGLE_CSE_QUICK_MAX_QUERIES=1,
         GOOGLE_CSE_RESULTS_PER_QUERY=10,
     )
-    @patch("newsclip.google_cse.requests.get")
+    @patch("newsclip.http_client.get")
     def test_google_cse_saves_result_and_run_metrics(self, get_mock):
         response = Mock(status_code=200)
         response.raise_for_status.return_value = None
@@ -778,9 +1374,10 @@ class AdditionalProvidersTests(TestCase):
         GOOGLE_CSE_ENABLED=True,
         GOOGLE_CSE_QUICK_MAX_QUERIES=1,
     )
-    @patch("newsclip.google_cse.requests.get")
+    @patch("newsclip.http_client.get")
     def test_google_cse_quota_error_does_not_stop_other_sources(self, get_mock):
-        response = Mock(status_code=429)
+        self.addCleanup(politeness.scheduler.reset)
+        response = Mock(status_code=429, headers={})
         response.raise_for_status.side_effect = AssertionError("não deve chamar raise_for_status em 429")
         get_mock.return_value = response
         log_mock = Mock()
@@ -795,7 +1392,7 @@ class AdditionalProvidersTests(TestCase):
 
     @patch("newsclip.management.commands.fetch_news.NEWSDATA_KEY", "newsdata-test")
     @patch("newsclip.management.commands.fetch_news.MAX_NEWSDATA_QUERY_TERMS", 2)
-    @patch("newsclip.management.commands.fetch_news.requests.get")
+    @patch("newsclip.http_client.get")
     def test_newsdata_uses_individual_queries_instead_of_long_or_batch(self, get_mock):
         response = Mock()
         response.raise_for_status.return_value = None
@@ -816,7 +1413,7 @@ class AdditionalProvidersTests(TestCase):
         self.assertTrue(all(" OR " not in query for query in queries))
 
     @override_settings(YOUTUBE_API_KEY="youtube-test", YOUTUBE_MAX_QUERIES=1)
-    @patch("newsclip.providers.requests.get")
+    @patch("newsclip.http_client.get")
     def test_youtube_search_saves_video_with_provider(self, get_mock):
         response = Mock()
         response.raise_for_status.return_value = None
@@ -843,7 +1440,7 @@ class AdditionalProvidersTests(TestCase):
 
     @override_settings(YOUTUBE_API_KEY="youtube-test", YOUTUBE_MAX_QUERIES=1)
     @patch("newsclip.providers.feedparser.parse")
-    @patch("newsclip.providers.requests.get")
+    @patch("newsclip.http_client.get")
     def test_channel_feed_does_not_disable_broad_youtube_search(self, get_mock, parse_mock):
         self.client_record.youtube = "https://youtube.com/channel/UC1234567890123456789012"
         self.client_record.save(update_fields=["youtube"])
@@ -872,7 +1469,7 @@ class AdditionalProvidersTests(TestCase):
         self.assertIn("search", get_mock.call_args_list[1].args[0])
 
     @override_settings(GDELT_MAX_QUERIES=1, GDELT_MAX_RECORDS=10)
-    @patch("newsclip.providers.requests.get")
+    @patch("newsclip.http_client.get")
     def test_gdelt_saves_article_and_run_metrics(self, get_mock):
         response = Mock()
         response.raise_for_status.return_value = None
@@ -895,7 +1492,7 @@ class AdditionalProvidersTests(TestCase):
         self.assertEqual(run.articles_count, 1)
 
     @override_settings(GDELT_MAX_QUERIES=1, GDELT_RATE_LIMIT_SLEEP_SECONDS=0)
-    @patch("newsclip.providers.requests.get")
+    @patch("newsclip.http_client.get")
     def test_gdelt_rate_limit_is_handled_as_partial_without_raising(self, get_mock):
         response = Mock(status_code=429, headers={})
         response.raise_for_status.side_effect = AssertionError("raise_for_status should not run for repeated 429")
@@ -938,7 +1535,7 @@ class AutomaticDiscoveryTests(TestCase):
         DISCOVERY_PROFILE_NEW_SOURCES=5,
     )
     @patch("newsclip.discovery.profile_source", return_value=0)
-    @patch("newsclip.discovery.requests.get")
+    @patch("newsclip.http_client.get")
     def test_brave_registers_article_source_and_discovery_evidence(self, get_mock, _profile_mock):
         response = Mock()
         response.raise_for_status.return_value = None
@@ -986,7 +1583,7 @@ class AutomaticDiscoveryTests(TestCase):
         BRAVE_SEARCH_MAX_QUERIES=1,
         DISCOVERY_PROFILE_NEW_SOURCES=0,
     )
-    @patch("newsclip.discovery.requests.get")
+    @patch("newsclip.http_client.get")
     def test_brave_rejects_result_with_excluded_term(self, get_mock):
         self.client_record.excluded_keywords = "Rio Preto da Eva"
         self.client_record.save(update_fields=["excluded_keywords"])
@@ -1014,7 +1611,7 @@ class AutomaticDiscoveryTests(TestCase):
         self.assertFalse(result.is_relevant)
 
     @patch("newsclip.discovery.is_public_http_url", return_value=True)
-    @patch("newsclip.discovery.requests.get")
+    @patch("newsclip.http_client.get")
     def test_source_profiler_detects_rss_and_sitemap(self, get_mock, _public_mock):
         source = Source.objects.create(
             name="Jornal Automatico",
@@ -1064,6 +1661,39 @@ class AutomaticDiscoveryTests(TestCase):
         self.assertEqual(kwargs["results_per_query"], 10)
         self.assertEqual(kwargs["profile_limit"], 0)
 
+    @override_settings(GOOGLE_CSE_ENABLED=False, YOUTUBE_API_KEY="")
+    @patch("newsclip.management.commands.fetch_news.record_endpoint_success")
+    @patch(
+        "newsclip.management.commands.fetch_news.save_articles",
+        side_effect=lambda client, articles: [None] * len(articles),
+    )
+    @patch("newsclip.management.commands.fetch_news.feedparser.parse")
+    @patch("newsclip.http_client.get")
+    @patch("newsclip.management.commands.fetch_news.Command.fetch_google_rss", return_value=0)
+    @patch("newsclip.management.commands.fetch_news.discover_client_sources")
+    def test_quick_fetch_includes_discovered_rss_with_bounded_download(
+        self, discovery_mock, _rss_mock, get_mock, parse_mock, save_mock, _success_mock
+    ):
+        discovery_mock.return_value = {"queries": 0, "results": 0, "relevant": 0, "articles": 0, "new_sources": 0}
+        source = Source.objects.create(
+            name="Jornal Descoberto", url="https://jornal.example/", source_type="DISCOVERED"
+        )
+        SourceEndpoint.objects.create(source=source, endpoint_type="RSS", url="https://jornal.example/feed/")
+        SourceEndpoint.objects.create(source=source, endpoint_type="SITEMAP", url="https://jornal.example/sitemap.xml")
+        get_mock.return_value = Mock(content=b"<rss/>", status_code=200, headers={})
+        parse_mock.return_value = FeedParserDict(
+            entries=[FeedParserDict(title="Joao Silva visita obras", link="https://jornal.example/obras")]
+        )
+
+        call_command("fetch_news", "--client-id", str(self.client_record.pk), "--quick")
+
+        get_mock.assert_called_once()
+        self.assertEqual(get_mock.call_args.args[0], "https://jornal.example/feed/")
+        self.assertTrue(get_mock.call_args.kwargs["deadline"])
+        self.assertTrue(get_mock.call_args.kwargs["max_bytes"])
+        parse_mock.assert_called_once_with(b"<rss/>")
+        self.assertEqual([article["url"] for article in save_mock.call_args.args[1]], ["https://jornal.example/obras"])
+
     @override_settings(
         GOOGLE_API_KEY="google-test",
         GOOGLE_CSE_ID="cse-test",
@@ -1178,26 +1808,98 @@ class AutomaticDiscoveryTests(TestCase):
         self.assertFalse(source.is_active)
         self.assertEqual(source.status, "VERIFIED")
 
-    def test_news_sitemap_parser_extracts_title_and_date(self):
-        xml = """<?xml version="1.0" encoding="UTF-8"?>
+    def streamed(self, *chunks, status_code=200, headers=None):
+        body = http_client.StreamedBody(Mock(status_code=status_code, headers=headers or {}), iter(chunks))
+        return nullcontext(body)
+
+    @patch("newsclip.http_client.stream")
+    def test_news_sitemap_root_is_streamed_and_checked_by_hash(self, stream_mock):
+        published = (timezone.now() - timedelta(days=1)).replace(microsecond=0).isoformat()
+        endpoint = SourceEndpoint.objects.create(
+            source=Source.objects.create(name="Jornal", url="https://jornal.example/", source_type="NEWS_SITEMAP"),
+            endpoint_type="NEWS_SITEMAP",
+            url="https://jornal.example/news-sitemap.xml",
+        )
+        xml = f"""<?xml version="1.0" encoding="UTF-8"?>
         <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
                 xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
           <url><loc>https://jornal.example/materia</loc><news:news>
-            <news:publication_date>2026-06-22T10:00:00Z</news:publication_date>
+            <news:publication_date>{published}</news:publication_date>
             <news:title>Joao Silva participa de evento</news:title>
           </news:news></url>
-        </urlset>"""
+        </urlset>""".encode()
+        # Blocos cortados no meio das tags: o parser nunca recebe o documento inteiro.
+        chunks = [xml[start:start + 40] for start in range(0, len(xml), 40)]
+        stream_mock.side_effect = lambda *args, **kwargs: self.streamed(*chunks, headers={"ETag": '"v1"'})
+        since = timezone.now() - timedelta(days=90)
+
+        items, response, content_hash = collect_sitemap_feed(endpoint, since, conditional=True)
+
+        self.assertEqual(items[0]["title"], "Joao Silva participa de evento")
+        self.assertEqual(items[0]["raw_date"], published)
+        self.assertEqual(stream_mock.call_args.kwargs["max_bytes"], settings.SITEMAP_MAX_BYTES)
+        self.assertEqual(content_hash, hashlib.sha256(xml).hexdigest())
+        remember_fetch_validators(endpoint, response, content_hash)
+        self.assertIsNone(collect_sitemap_feed(endpoint, since, conditional=True))
+        self.assertEqual(stream_mock.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+
+        stream_mock.side_effect = lambda *args, **kwargs: self.streamed(status_code=304)
+        self.assertIsNone(collect_sitemap_feed(endpoint, since, conditional=True))
+
+    @override_settings(SITEMAP_MAX_CHILDREN=1, SITEMAP_MAX_ARTICLES=2, SITEMAP_STALE_STREAK=2)
+    @patch("newsclip.discovery.is_public_http_url", return_value=True)
+    @patch("newsclip.http_client.stream")
+    def test_sitemap_index_streams_newest_child_and_stops_after_window(self, stream_mock, _public_mock):
+        now = timezone.now()
+        endpoint = SourceEndpoint.objects.create(
+            source=Source.objects.create(name="Jornal", url="https://jornal.example/", source_type="SITEMAP"),
+            endpoint_type="SITEMAP",
+            url="https://jornal.example/sitemap.xml",
+        )
+        index = f"""<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+              <sitemap><loc>https://jornal.example/sitemap-2019-01.xml</loc></sitemap>
+              <sitemap><loc>https://jornal.example/sitemap-recente.xml</loc>
+                <lastmod>{now.isoformat()}</lastmod></sitemap>
+            </sitemapindex>""".encode()
+
+        def url_entry(days_ago):
+            return (
+                f"<url><loc>https://jornal.example/materia-{days_ago}</loc>"
+                f"<lastmod>{(now - timedelta(days=days_ago)).isoformat()}</lastmod></url>"
+            )
+
+        chunks = [
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+            url_entry(3) + url_entry(1) + url_entry(2),
+            url_entry(200) + url_entry(300),
+            AssertionError("leitura deveria parar antes deste bloco"),
+        ]
+
+        def chunk_iterator():
+            for chunk in chunks:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk.encode()
+
+        child = nullcontext(http_client.StreamedBody(Mock(status_code=200, headers={}), chunk_iterator()))
+        stream_mock.side_effect = [self.streamed(index), child]
 
-        children, articles = parse_sitemap(xml)
+        items, response, content_hash = collect_sitemap_feed(endpoint, now - timedelta(days=90))
 
-        self.assertEqual(children, [])
-        self.assertEqual(articles[0]["title"], "Joao Silva participa de evento")
-        self.assertEqual(articles[0]["publication_date"], "2026-06-22T10:00:00Z")
+        self.assertIsNone(response)
+        self.assertEqual(content_hash, "")
+        self.assertEqual(
+            [call.args[0] for call in stream_mock.call_args_list],
+            ["https://jornal.example/sitemap.xml", "https://jornal.example/sitemap-recente.xml"],
+        )
+        self.assertEqual(
+            [item["loc"] for item in items],
+            ["https://jornal.example/materia-1", "https://jornal.example/materia-2"],
+        )
 
     @override_settings(DISCOVERY_MIN_RELEVANCE_SCORE=35, SITEMAP_MAX_ARTICLES=10)
-    @patch("newsclip.discovery.is_public_http_url", return_value=True)
-    @patch("newsclip.discovery.requests.get")
-    def test_news_sitemap_saves_relevant_article(self, get_mock, _public_mock):
+    @patch("newsclip.http_client.stream")
+    def test_news_sitemap_saves_relevant_article(self, stream_mock):
         source = Source.objects.create(
             name="Jornal de Teste",
             domain="jornal.example",
@@ -1209,28 +1911,147 @@ class AutomaticDiscoveryTests(TestCase):
             endpoint_type="NEWS_SITEMAP",
             url="https://jornal.example/news-sitemap.xml",
         )
-        response = Mock()
-        response.raise_for_status.return_value = None
-        response.text = """<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        published = (timezone.now() - timedelta(days=1)).isoformat()
+        stream_mock.return_value = self.streamed(
+            f"""<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
           xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"><url>
           <loc>https://jornal.example/materia</loc><news:news>
-          <news:publication_date>2026-06-22T10:00:00Z</news:publication_date>
+          <news:publication_date>{published}</news:publication_date>
           <news:title>Joao Silva apresenta novo projeto</news:title>
-          </news:news></url></urlset>"""
-        get_mock.return_value = response
-
-        saved = fetch_sitemap_endpoint(
-            Command(),
-            self.client_record,
-            endpoint,
-            ["Joao Silva"],
-            timezone.now() - timedelta(days=90),
+          </news:news></url></urlset>""".encode()
         )
 
+        items, _response, _hash = collect_sitemap_feed(endpoint, timezone.now() - timedelta(days=90))
+        saved = save_sitemap_items(self.client_record, endpoint, items, ["Joao Silva"])
+
         self.assertEqual(saved, 1)
         self.assertTrue(Article.objects.filter(client=self.client_record, source="Jornal de Teste").exists())
 
 
+class AsyncFetchEngineTests(TransactionTestCase):
+    # O escritor grava em outra thread; sem a transação envolvente do TestCase
+    # o SQLite em memória deixa as threads enxergarem as mesmas tabelas.
+    def setUp(self):
+        self.client_a = Client.objects.create(name="Cliente A", name_variations="São Paulo")
+        self.client_b = Client.objects.create(name="Cliente B", name_variations="São Paulo")
+
+    @override_settings(GDELT_ENABLED=False, GOOGLE_CSE_ENABLED=False, YOUTUBE_API_KEY="", FETCH_ASYNC_CONCURRENCY=4)
+    @patch("newsclip.management.commands.fetch_news.discover_client_sources")
+    @patch("newsclip.management.commands.fetch_news.feedparser.parse")
+    @patch("newsclip.http_client.get")
+    def test_async_engine_writes_candidates_from_feeds_and_google_rss(self, get_mock, parse_mock, discovery_mock):
+        Source.objects.create(name="Fonte RSS", url="https://example.com/feed.xml", source_type="RSS")
+        discovery_mock.return_value = {"queries": 0, "results": 0, "relevant": 0, "new_sources": 0, "articles": 0}
+        get_mock.return_value = Mock(content=b"<rss/>", status_code=200, headers={})
+        parse_mock.return_value = FeedParserDict(
+            entries=[
+                FeedParserDict(
+                    title="Agenda econômica em São Paulo",
+                    link="https://example.com/agenda-async",
+                    summary="Evento importante.",
+                )
+            ]
+        )
+
+        call_command("fetch_news", "--engine", "async")
+
+        requested_urls = [call.args[0] for call in get_mock.call_args_list]
+        self.assertEqual(requested_urls.count("https://example.com/feed.xml"), 1)
+        self.assertTrue(any(url.startswith("https://news.google.com/rss/search") for url in requested_urls))
+        self.assertSetEqual(
+            set(Article.objects.filter(url="https://example.com/agenda-async").values_list("client__name", flat=True)),
+            {"Cliente A", "Cliente B"},
+        )
+
+    @override_settings(FETCH_ASYNC_QUEUE_SIZE=1)
+    def test_async_engine_stops_producers_when_the_writer_fails(self):
+        engine = AsyncFetchEngine(Mock(), [self.client_a], None, None)
+
+        async def produce():
+            for index in range(5):
+                await engine.queue.put(Candidate(self.client_a, "RSS", {"url": f"https://example.com/{index}"}))
+            return []
+
+        async def broken_writer():
+            await engine.queue.get()
+            raise RuntimeError("banco indisponivel")
+
+        with patch.object(engine, "_produce", produce), patch.object(engine, "_writer", broken_writer):
+            with self.assertRaisesRegex(RuntimeError, "banco indisponivel"):
+                engine.run()
+
+
+class PolitenessSchedulerTests(TestCase):
+    def setUp(self):
+        self.scheduler = politeness.PolitenessScheduler()
+
+    @override_settings(POLITENESS_HOST_REQUESTS_PER_MINUTE=60, POLITENESS_HOST_BURST=2)
+    def test_token_bucket_allows_burst_then_asks_to_wait(self):
+        self.assertEqual(self.scheduler.reserve("jornal.example"), 0)
+        self.assertEqual(self.scheduler.reserve("jornal.example"), 0)
+        self.assertGreater(self.scheduler.reserve("jornal.example"), 0)
+        self.assertEqual(self.scheduler.reserve("outro.example"), 0)
+
+    def test_retry_after_defers_host_and_deferring_mode_raises(self):
+        self.scheduler.note_response("news.google.com", Mock(status_code=429, headers={"Retry-After": "120"}))
+
+        with politeness.deferring(), self.assertRaises(politeness.HostDeferred) as raised:
+            self.scheduler.wait("news.google.com")
+        self.assertGreater(raised.exception.retry_after, 100)
+
+    def test_robots_crawl_delay_reads_generic_group_only(self):
+        robots = (
+            "User-agent: Googlebot\nCrawl-delay: 1\n\n"
+            "User-agent: *\nDisallow: /busca\nCrawl-delay: 10\n"
+        )
+
+        self.assertEqual(robots_crawl_delay(robots), 10)
+        self.assertEqual(robots_crawl_delay("User-agent: Bingbot\nCrawl-delay: 5\n"), 0)
+
+
+class HttpClientTests(TestCase):
+    def _streamed_response(self, *chunks, headers=None):
+        response = Mock(headers=headers or {})
+        response.iter_content.return_value = list(chunks)
+        return response
+
+    @patch("newsclip.http_client.get_session")
+    def test_get_reads_body_through_shared_session(self, session_mock):
+        response = self._streamed_response(b"<rss>", b"</rss>")
+        session_mock.return_value.get.return_value = response
+
+        result = http_client.get("https://example.com/feed.xml", timeout=5)
+
+        self.assertEqual(result._content, b"<rss></rss>")
+        self.assertTrue(session_mock.return_value.get.call_args.kwargs["stream"])
+        response.close.assert_called_once()
+
+    @patch("newsclip.http_client.get_session")
+    def test_get_aborts_slow_download_after_total_deadline(self, session_mock):
+        def slow_chunks(chunk_size):
+            yield b"<rss>"
+            time.sleep(0.05)
+            yield b"</rss>"
+
+        response = Mock(headers={})
+        response.iter_content.side_effect = slow_chunks
+        session_mock.return_value.get.return_value = response
+
+        with self.assertRaises(requests.Timeout):
+            http_client.get("https://lento.example/feed.xml", deadline=0.01)
+        response.close.assert_called_once()
+
+    @override_settings(HTTP_MAX_RESPONSE_BYTES=8)
+    @patch("newsclip.http_client.get_session")
+    def test_get_aborts_responses_over_size_limit(self, session_mock):
+        response = self._streamed_response(b"12345", b"67890")
+        session_mock.return_value.get.return_value = response
+
+        with self.assertRaises(http_client.ResponseTooLarge):
+            http_client.get("https://example.com/enorme.xml")
+        response.close.assert_called_once()
+
+
 @override_settings(SECURE_SSL_REDIRECT=False)
 class PublicRoutesTests(TestCase):
     def test_public_pages_are_available(self):
@@ -1242,6 +2063,9 @@ class PublicRoutesTests(TestCase):
 @override_settings(SECURE_SSL_REDIRECT=False)
 class ClientAccessTests(TestCase):
     def setUp(self):
+        # Ids de clientes se repetem entre testes no SQLite; a copia local do cache de perfis nao.
+        profiles.reset_local_cache()
+        self.addCleanup(profiles.reset_local_cache)
         user_model = get_user_model()
         self.user = user_model.objects.create_user(username="owner", password="safe-password-123")
         self.other_user = user_model.objects.create_user(username="other", password="safe-password-123")
@@ -1282,14 +2106,27 @@ class ClientAccessTests(TestCase):
         self.assertNotContains(response, "Provedores ativos")
         self.assertNotContains(response, "GDELT")
 
-    @patch("newsclip.views.revalidate_accepted_articles_for_client")
-    def test_dashboard_does_not_run_expensive_revalidation(self, revalidate_mock):
+    @patch("newsclip.utils.validate_article_candidate")
+    def test_dashboard_does_not_run_expensive_revalidation(self, validate_mock):
+        Article.objects.create(
+            client=self.client_record,
+            title="Cliente Teste em noticia antiga",
+            url="https://jornal.example/antiga",
+            source="Jornal Local",
+            published_at=timezone.now(),
+            validation_status="ACCEPTED",
+            relevance_score=90,
+            dedup_key="dashboard-stale",
+        )
         self.client.force_login(self.user)
 
-        response = self.client.get(reverse("dashboard"))
-
-        self.assertEqual(response.status_code, 200)
-        revalidate_mock.assert_not_called()
+        self.assertEqual(self.client.get(reverse("dashboard")).status_code, 200)
+        self.assertEqual(self.client.get(reverse("client_news", args=[self.client_record.pk])).status_code, 200)
+        self.assertEqual(
+            self.client.get(reverse("noticias_cliente_json", args=[self.client_record.pk])).status_code,
+            200,
+        )
+        validate_mock.assert_not_called()
 
     def test_client_news_hides_source_and_quality_columns(self):
         save_article(
@@ -1309,6 +2146,268 @@ class ClientAccessTests(TestCase):
         self.assertNotContains(response, "<th>Fonte</th>", html=True)
         self.assertNotContains(response, "<th>Qualidade</th>", html=True)
 
+    def test_client_news_dedups_in_database_and_pages_by_cursor(self):
+        now = timezone.now()
+
+        def article(index, **extra):
+            values = {
+                "client": self.client_record,
+                "title": f"Cliente Teste na pauta {index}",
+                "url": f"https://jornal.example/pauta-{index}",
+                "source": "Jornal Local",
+                "published_at": now - timedelta(hours=index),
+                "dedup_key": f"pauta-{index}",
+            }
+            values.update(extra)
+            return Article.objects.create(**values)
+
+        articles = [article(index) for index in range(5)]
+        article(5, canonical_article=articles[1])
+        same_url = article(6, url="https://jornal.example/pauta-2?utm_source=feed")
+        self.assertEqual(same_url.canonical_article_id, articles[2].pk)
+        self.client.force_login(self.user)
+
+        expected = [
+            item.pk
+            for item in deduplicate_articles_for_display(
+                Article.objects.filter(client=self.client_record).order_by("-published_at", "-id")
+            )
+        ]
+        self.assertEqual(expected, [item.pk for item in articles])
+
+        url = reverse("client_news", args=[self.client_record.pk])
+        seen = []
+        query = "?page_size=2"
+        while True:
+            response = self.client.get(url + query)
+            page = response.context["articles"]
+            seen.extend(item.pk for item in page)
+            if not page.has_next:
+                break
+            query = f"?page_size=2&after={page.next_cursor}"
+        self.assertEqual(seen, expected)
+        self.assertContains(self.client.get(url + "?page_size=2"), "+1 republicação")
+
+        response = self.client.get(url + f"?page_size=2&before={page.previous_cursor}")
+        self.assertEqual([item.pk for item in response.context["articles"]], expected[2:4])
+        self.assertTrue(response.context["articles"].has_previous)
+
+    def test_display_queryset_keeps_one_copy_when_canonical_is_filtered_out(self):
+        now = timezone.now()
+        canonical = Article.objects.create(
+            client=self.client_record,
+            title="Cliente Teste na pauta original",
+            url="https://jornal.example/original",
+            source="Jornal Local",
+            published_at=now,
+            dedup_key="original",
+            excluded=True,
+        )
+        copies = [
+            Article.objects.create(
+                client=self.client_record,
+                title=f"Cliente Teste na copia {index}",
+                url=f"https://outro.example/copia-{index}",
+                source="Outro Jornal",
+                published_at=now - timedelta(hours=index),
+                dedup_key=f"copia-{index}",
+                canonical_article=canonical,
+            )
+            for index in range(1, 4)
+        ]
+
+        listed = display_articles_queryset(Article.objects.filter(client=self.client_record, excluded=False))
+        self.assertEqual([item.pk for item in listed], [copies[0].pk])
+        everything = display_articles_queryset(Article.objects.filter(client=self.client_record))
+        self.assertEqual([item.pk for item in everything], [canonical.pk])
+
+    def test_client_article_stats_follow_writes_without_recounting(self):
+        def article(index, status, reason=""):
+            return Article.objects.create(
+                client=self.client_record,
+                title=f"Cliente Teste na contagem {index}",
+                url=f"https://jornal.example/contagem-{index}",
+                source="Jornal Local",
+                published_at=timezone.now(),
+                validation_status=status,
+                validation_reason=reason,
+                relevance_score=50,
+                dedup_key=f"contagem-{index}",
+            )
+
+        def assert_consistent():
+            stats = ClientArticleStats.objects.get(client=self.client_record)
+            self.assertEqual(
+                {bucket: getattr(stats, bucket) for bucket in STATS_BUCKETS},
+                count_client_articles(self.client_record.pk),
+            )
+
+        accepted = article(0, "ACCEPTED")
+        self.assertEqual(client_article_counts(self.client_record)["accepted"], 1)
+        review = article(1, "REVIEW")
+        discarded = article(2, "REJECTED", "Sem identidade do cliente")
+        article(3, "REJECTED", "Sem identidade do cliente")
+        assert_consistent()
+        self.assertEqual(
+            client_article_counts(self.client_record),
+            {"accepted": 1, "review": 1, "rejected": 0, "discarded": 2, "pending": 3},
+        )
+
+        self.client.force_login(self.user)
+        self.client.post(
+            reverse("bulk_update_news", args=[self.client_record.pk]),
+            {"action": "reject", "ids[]": [str(accepted.pk), str(review.pk)]},
+        )
+        assert_consistent()
+        record_manual_feedback([discarded], "REJECTED")
+        assert_consistent()
+        self.assertEqual(client_article_counts(self.client_record)["rejected"], 3)
+
+        self.client.post(
+            reverse("bulk_update_news", args=[self.client_record.pk]),
+            {"action": "exclude", "ids[]": [str(discarded.pk)]},
+        )
+        review.delete()
+        assert_consistent()
+        self.assertEqual(
+            client_article_counts(self.client_record),
+            {"accepted": 0, "review": 0, "rejected": 1, "discarded": 1, "pending": 2},
+        )
+
+        extra = [article(index, "REVIEW") for index in range(4, 7)]
+        Article.objects.filter(pk__in=[item.pk for item in extra[:2]]).delete()
+        assert_consistent()
+        self.assertEqual(client_article_counts(self.client_record)["review"], 1)
+
+        # Salvar sem mexer em status, fonte ou datas não toca nos contadores.
+        loaded = Article.objects.get(pk=extra[2].pk)
+        loaded.title = "Cliente Teste com titulo revisado"
+        with CaptureQueriesContext(connection) as queries:
+            loaded.save()
+        self.assertFalse(
+            [query for query in queries.captured_queries if "clientarticlestats" in query["sql"] or "rollup" in query["sql"]]
+        )
+        loaded.validation_status = "ACCEPTED"
+        loaded.save()
+        assert_consistent()
+
+        # O estado anterior é lido no save: uma gravação em lote entre a
+        # leitura e o save não deixa a instância com um estado antigo.
+        self.assertFalse(hasattr(Article.objects.get(pk=accepted.pk), "_stats_state"))
+        with tracking_article_stats([loaded.pk]):
+            Article.objects.filter(pk=loaded.pk).update(validation_status="REVIEW")
+        loaded.validation_status = "REJECTED"
+        loaded.save()
+        assert_consistent()
+
+        output = StringIO()
+        call_command("reconcile_client_article_stats", client_id=self.client_record.pk, stdout=output)
+        self.assertIn(": ok", output.getvalue())
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client_record.delete()
+        stats_queries = [query for query in queries.captured_queries if "clientarticlestats" in query["sql"]]
+        self.assertLessEqual(len(stats_queries), 1)
+
+    def test_daily_rollups_follow_writes_and_feed_charts(self):
+        def stored_rollups():
+            return {
+                (row.client_id, row.day, row.source, row.provider, row.validation_status): row.count
+                for row in ArticleDailyRollup.objects.filter(client=self.client_record)
+            }
+
+        def assert_consistent():
+            self.assertEqual(stored_rollups(), dict(rollup_counts(Article.objects.filter(client=self.client_record))))
+
+        articles = [
+            Article.objects.create(
+                client=self.client_record,
+                title=f"Cliente Teste no agregado {index}",
+                url=f"https://jornal.example/agregado-{index}",
+                source="Jornal Local" if index < 2 else "Radio Centro",
+                provider="GOOGLE_NEWS",
+                published_at=timezone.now() - timedelta(days=index),
+                validation_status="ACCEPTED" if index < 3 else "REVIEW",
+                relevance_score=60,
+                dedup_key=f"agregado-{index}",
+            )
+            for index in range(4)
+        ]
+        assert_consistent()
+        self.assertEqual(sum(stored_rollups().values()), 4)
+
+        self.client.force_login(self.user)
+        self.client.post(
+            reverse("bulk_update_news", args=[self.client_record.pk]),
+            {"action": "reject", "ids[]": [str(articles[0].pk), str(articles[3].pk)]},
+        )
+        assert_consistent()
+        articles[1].delete()
+        assert_consistent()
+        self.assertEqual(
+            sum(count for key, count in stored_rollups().items() if key[-1] == "ACCEPTED"),
+            1,
+        )
+
+        response = self.client.get(reverse("client_news", args=[self.client_record.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["source_labels_json"], '["Radio Centro"]')
+        self.assertEqual(response.context["daily_counts_json"], "[1]")
+        response = self.client.get(reverse("dashboard"))
+        self.assertEqual(response.status_code, 200)
+
+    def test_articles_api_pages_by_cursor_selects_fields_and_honors_etag(self):
+        now = timezone.now()
+        articles = [
+            Article.objects.create(
+                client=self.client_record,
+                title=f"Cliente Teste na API {index}",
+                url=f"https://jornal.example/api-{index}",
+                source="Jornal Local" if index % 2 else "Radio Centro",
+                published_at=now - timedelta(days=index),
+                validation_status="ACCEPTED",
+                relevance_score=80,
+                dedup_key=f"api-{index}",
+            )
+            for index in range(5)
+        ]
+        url = reverse("api_client_articles", args=[self.client_record.pk])
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.client.force_login(self.user)
+
+        response = self.client.get(url, {"fields": "id,title,published_at", "limit": 2})
+        payload = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(payload["fields"], ["id", "title", "published_at"])
+        self.assertEqual(set(payload["results"][0]), {"id", "title", "published_at"})
+        seen = [item["id"] for item in payload["results"]]
+        while payload["has_next"]:
+            payload = self.client.get(url, {"fields": "id", "limit": 2, "after": payload["next_cursor"]}).json()
+            seen.extend(item["id"] for item in payload["results"])
+        self.assertEqual(seen, [article.pk for article in articles])
+
+        filtered = self.client.get(
+            url,
+            {"source": "jornal local", "since": (now - timedelta(days=3)).date().isoformat(), "fields": "id"},
+        ).json()
+        self.assertEqual([item["id"] for item in filtered["results"]], [articles[1].pk, articles[3].pk])
+        self.assertEqual(self.client.get(url, {"fields": "id,senha"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"since": "ontem"}).status_code, 400)
+
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.client.post(
+            reverse("bulk_update_news", args=[self.client_record.pk]),
+            {"action": "reject", "ids[]": [str(articles[0].pk)]},
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(articles[0].pk, [item["id"] for item in response.json()["results"]])
+        etag = response["ETag"]
+        articles[4].delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
     def test_client_news_pending_queue_is_visible(self):
         Article.objects.create(
             client=self.client_record,
@@ -1431,6 +2530,58 @@ class ClientAccessTests(TestCase):
         self.assertEqual(response.context["sort"], "date-desc")
         self.assertLess(content.index(newest_low_score.title), content.index(same_score_unknown.title))
         self.assertLess(content.index(same_score_unknown.title), content.index(priority_article.title))
+
+    def test_review_priority_is_stored_and_paged_by_cursor(self):
+        now = timezone.now()
+        articles = [
+            Article.objects.create(
+                client=self.client_record,
+                title=f"Cliente Teste na fila de triagem {index}",
+                url=f"https://jornal.example/triagem-{index}",
+                source="G1" if index % 2 else "Jornal Local",
+                published_at=now - timedelta(hours=index),
+                validation_status="REVIEW",
+                relevance_score=score,
+                dedup_key=f"triagem-{index}",
+            )
+            for index, score in enumerate([45, 65, 72, 55, 61])
+        ]
+        articles[0].refresh_from_db()
+        self.assertEqual(
+            (articles[0].triage_band, articles[0].triage_source_rank, articles[0].triage_identity_visible),
+            (3, len(TRIAGE_PRIORITY_SOURCES) + 1, True),
+        )
+        self.assertEqual(articles[0].triage_story_group, "cliente teste fila triagem")
+
+        stored = Article.objects.get(pk=articles[1].pk)
+        stored.title = "Outra manchete sobre Cliente Teste"
+        with CaptureQueriesContext(connection) as queries:
+            stored.save(update_fields=["title", *TRIAGE_FIELDS])
+        self.assertFalse(any('"newsclip_client"' in query["sql"] for query in queries.captured_queries))
+        self.assertEqual(Article.objects.get(pk=stored.pk).triage_story_group, "outra manchete sobre cliente")
+
+        Article.objects.filter(pk=articles[0].pk).update(relevance_score=66, triage_band=3)
+        articles[0].relevance_score = 66
+        revalidate_article(articles[0])
+        self.assertEqual(Article.objects.get(pk=articles[0].pk).triage_band, triage_score_band(articles[0].relevance_score))
+
+        expected = list(
+            Article.objects.filter(client=self.client_record)
+            .exclude(validation_status="ACCEPTED")
+            .order_by(*keyset_order_by(TRIAGE_ORDERING))
+            .values_list("title", flat=True)
+        )
+        self.client.force_login(self.user)
+        url = reverse("client_news", args=[self.client_record.pk])
+        seen = []
+        response = self.client.get(url, {"status": "pending", "page_size": 2})
+        seen.extend(article.title for article in response.context["articles"])
+        while response.context["articles"].has_next:
+            cursor = response.context["articles"].next_cursor
+            response = self.client.get(url, {"status": "pending", "page_size": 2, "after": cursor})
+            seen.extend(article.title for article in response.context["articles"])
+        self.assertEqual(seen, expected)
+
     def test_owner_can_validate_and_invalidate_selected_news(self):
 
         review_article = Article.objects.create(
@@ -1583,7 +2734,8 @@ class ClientAccessTests(TestCase):
         response = self.client.get(reverse("client_news", args=[self.client_record.pk]) + "?status=pending")
         self.assertContains(response, "Cliente Teste em noticia rejeitada para manter")
 
-    def test_owner_can_save_client_and_reprocess_pending_articles(self):
+    @patch("newsclip.revalidation.async_task", side_effect=run_revalidation_inline)
+    def test_owner_can_save_client_and_reprocess_pending_articles(self, async_task_mock):
         client_record = Client.objects.create(name="Fábio Candido")
         client_record.users.add(self.user)
         Article.objects.create(
@@ -1671,7 +2823,8 @@ class ClientAccessTests(TestCase):
         self.assertNotContains(response, "newsdata-secret")
         self.assertContains(response, "apikey=[REDACTED]")
 
-    def test_superuser_can_add_variations_and_revalidate_pending_from_diagnostic(self):
+    @patch("newsclip.revalidation.async_task", side_effect=run_revalidation_inline)
+    def test_superuser_can_add_variations_and_revalidate_pending_from_diagnostic(self, async_task_mock):
         Article.objects.create(
             client=self.client_record,
             title="Prefeito de Rio Preto sanciona lei importante",
@@ -1701,6 +2854,37 @@ class ClientAccessTests(TestCase):
         self.assertIn("Prefeito de Rio Preto", self.client_record.name_variations)
         self.assertEqual(article.validation_status, "ACCEPTED")
 
+    def test_superuser_can_simulate_terms_from_diagnostic(self):
+        forget_article_projection()
+        self.addCleanup(forget_article_projection)
+        Article.objects.create(
+            client=self.client_record,
+            title="Prefeito de Rio Preto sanciona lei importante",
+            url="https://g1.globo.com/sp/rio-preto/noticia/simulada",
+            source="G1",
+            published_at=timezone.now(),
+            validation_status="REVIEW",
+            relevance_score=55,
+            dedup_key="diagnostic-simulate-review",
+        )
+        self.client.force_login(self.superuser)
+
+        response = self.client.get(
+            reverse("clipping_diagnostic"),
+            {
+                "client_id": str(self.client_record.pk),
+                "simulate": "1",
+                "simulate_name_variations": "Prefeito de Rio Preto",
+                "simulate_context_terms": "",
+                "simulate_excluded_keywords": "",
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["simulation"]["transitions"], [(("REVIEW", "ACCEPTED"), 1)])
+        self.assertContains(response, "Promovidas para ACCEPTED")
+        self.assertFalse(Article.objects.filter(client=self.client_record, validation_status="ACCEPTED").exists())
+
     def test_diagnostic_includes_report_visibility_counts(self):
         Article.objects.create(
             client=self.client_record,
@@ -2000,6 +3184,11 @@ class ClientAccessTests(TestCase):
             str(self.client_record.pk),
         )
 
+    def test_host_slot_shares_vacancies_between_www_and_bare_host(self):
+        with http_client.host_slot("https://www.Jornal.example/a"), http_client.host_slot("https://jornal.example/b"):
+            self.assertIn("jornal.example", http_client._host_slots)
+        self.assertNotIn("www.jornal.example", http_client._host_slots)
+
 
 class ReportGenerationTests(TestCase):
     def setUp(self):
@@ -2031,7 +3220,82 @@ class ReportGenerationTests(TestCase):
                 self.assertEqual(report.size, len(content))
                 self.assertEqual(report.created_by, self.user)
 
-    def test_report_revalidates_stale_accepted_articles(self):
+    def test_revalidation_job_processes_stale_articles_in_chunks(self):
+        client = Client.objects.create(
+            name="Rio Preto Country Bulls",
+            name_variations="Country Bulls, riopretocountrybulls",
+            context_terms="Rio Preto, rodeio, gado, pecuaria, ingressos",
+        )
+        for index in range(5):
+            Article.objects.create(
+                client=client,
+                title=f"Exportação de gado vivo bate recorde {index}",
+                url=f"https://canaldocriador.com.br/geral/gado-{index}",
+                source="Canal do Criador",
+                published_at=timezone.now(),
+                validation_status="ACCEPTED",
+                relevance_score=100,
+                dedup_key=f"country-bulls-chunk-{index}",
+            )
+        job = RevalidationJob.objects.create(client=client)
+
+        with override_settings(REVALIDATION_CHUNK_SIZE=2), patch(
+            "newsclip.revalidation.revalidate_articles_batch", wraps=revalidate_articles_batch
+        ) as batch_mock:
+            run_revalidation_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "completed")
+        self.assertEqual([len(call.args[1]) for call in batch_mock.call_args_list], [2, 2, 1])
+        self.assertEqual((job.total, job.processed, job.changed), (5, 5, 5))
+        self.assertEqual(job.progress_percent, 100)
+        self.assertEqual(job.rules_version, current_rules_version(client))
+        self.assertEqual(job.last_article_id, Article.objects.filter(client=client).latest("pk").pk)
+        self.assertFalse(Article.objects.filter(client=client, validation_status="ACCEPTED").exists())
+
+    @patch("newsclip.revalidation.async_task", return_value="task-1")
+    def test_enqueue_revalidation_reuses_queued_job(self, async_task_mock):
+        with patch.object(Client.objects, "select_for_update", wraps=Client.objects.select_for_update) as lock_mock:
+            first = enqueue_revalidation(self.client_record)
+            second = enqueue_revalidation(self.client_record)
+
+        self.assertEqual(lock_mock.call_count, 2)
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(RevalidationJob.objects.filter(client=self.client_record, status="queued").count(), 1)
+        self.assertEqual(first.task_id, "task-1")
+        async_task_mock.assert_called_once_with(
+            "newsclip.tasks.revalidate_client_task",
+            first.pk,
+            task_name=f"revalidate-client-{self.client_record.pk}",
+        )
+
+    @patch("newsclip.revalidation.async_task", return_value="task-2")
+    def test_enqueue_revalidation_resumes_stalled_running_job(self, async_task_mock):
+        older = RevalidationJob.objects.create(client=self.client_record, status="running")
+        stalled = RevalidationJob.objects.create(client=self.client_record, status="running", last_article_id=42)
+        RevalidationJob.objects.filter(pk=older.pk).update(created_at=timezone.now() - timedelta(hours=2))
+        RevalidationJob.objects.filter(pk__in=[older.pk, stalled.pk]).update(
+            updated_at=timezone.now() - timedelta(hours=1)
+        )
+
+        job = enqueue_revalidation(self.client_record)
+
+        stalled.refresh_from_db()
+        older.refresh_from_db()
+        self.assertEqual(job.pk, stalled.pk)
+        self.assertEqual((stalled.status, stalled.last_article_id, stalled.task_id), ("queued", 42, "task-2"))
+        self.assertEqual(older.status, "failed")
+        async_task_mock.assert_called_once_with(
+            "newsclip.tasks.revalidate_client_task",
+            stalled.pk,
+            task_name=f"revalidate-client-{self.client_record.pk}",
+        )
+
+        RevalidationJob.objects.filter(pk=stalled.pk).update(status="running")
+        self.assertNotEqual(enqueue_revalidation(self.client_record).pk, stalled.pk)
+
+    @patch("newsclip.revalidation.async_task", side_effect=run_revalidation_inline)
+    def test_report_revalidates_stale_accepted_articles(self, async_task_mock):
         client = Client.objects.create(
             name="Rio Preto Country Bulls",
             name_variations="Country Bulls, riopretocountrybulls",
@@ -2059,6 +3323,7 @@ class ReportGenerationTests(TestCase):
             dedup_key="country-bulls-stale-invalid",
         )
 
+        enqueue_revalidation(client)
         call_command("generate_report", client_id=client.pk, days="all", format="csv", created_by_id=self.user.pk)
 
         stale.refresh_from_db()
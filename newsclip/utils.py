@@ -5,7 +5,9 @@ import hashlib
 import unicodedata
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from pathlib import Path
-from collections import Counter
+from collections import Counter, namedtuple
+from types import SimpleNamespace
+from itertools import filterfalse, islice
 from django.db import IntegrityError, transaction
 from django.db.models import Q
 from django.utils import timezone as dj_timezone
@@ -17,6 +19,7 @@ from django.contrib.postgres.search import SearchVector
 from django.db import connection
 from django.db.models import Value # Para tratar campos potencialmente nulos no SearchVector
 
+from newsclip import http_client
 from newsclip.models import Article
 from newsclip.source_seeds import ESSENTIAL_NEWS_SOURCES
 
@@ -159,8 +162,10 @@ def canonicalize_source_name(source: str, url: str = "") -> str:
 
 def normalize_match_text(value: str) -> str:
     normalized = unicodedata.normalize("NFKD", value or "")
-    without_accents = "".join(char for char in normalized if not unicodedata.combining(char))
-    return re.sub(r"\s+", " ", without_accents.casefold()).strip()
+    if not normalized.isascii():
+        normalized = "".join(filterfalse(unicodedata.combining, normalized))
+    # split()/join colapsa os mesmos espacos que \s+, sem uma substituicao por espaco.
+    return " ".join(normalized.casefold().split())
 
 
 ESSENTIAL_SOURCE_NAMES = {
@@ -237,32 +242,160 @@ def article_dedup_key(title: str, source: str = "") -> str:
     return hashlib.sha256(payload).hexdigest()
 
 
-def is_duplicate_article(client, title: str, source: str = "", url: str = "") -> bool:
+def article_title_fingerprint(title: str, source: str = "") -> str:
     normalized_title = normalized_article_title(title, source)
+    if not normalized_title:
+        return ""
+    return hashlib.sha256(normalized_title.encode("utf-8")).hexdigest()
+
+
+def article_url_hash(url: str) -> str:
     canonical_url = canonicalize_article_url(url)
-    if not normalized_title and not canonical_url:
+    if not canonical_url:
+        return ""
+    return hashlib.sha256(canonical_url.encode("utf-8")).hexdigest()
+
+
+def _source_match_key(source: str, url: str = "") -> str:
+    return normalize_match_text(canonicalize_source_name(source, url) or source)
+
+
+def is_duplicate_article(client, title: str, source: str = "", url: str = "") -> bool:
+    title_fingerprint = article_title_fingerprint(title, source)
+    url_hash = article_url_hash(url)
+    if not title_fingerprint and not url_hash:
         return False
 
-    candidates = Article.objects.filter(client=client)
-    if canonical_url:
-        candidates = candidates.filter(Q(url=canonical_url) | Q(title__isnull=False))
-    for article in candidates.only("title", "source", "url"):
-        if canonical_url and canonicalize_article_url(article.url) == canonical_url:
+    lookup = Q()
+    if url_hash:
+        lookup |= Q(url_hash=url_hash)
+    if title_fingerprint:
+        lookup |= Q(title_fingerprint=title_fingerprint)
+    source_key = _source_match_key(source, url)
+    candidates = Article.objects.filter(client=client).filter(lookup)
+    for article in candidates.only("source", "url", "url_hash", "title_fingerprint"):
+        if url_hash and article.url_hash == url_hash:
             return True
         if (
-            normalized_title
-            and normalize_match_text(canonicalize_source_name(article.source, article.url) or article.source)
-            == normalize_match_text(canonicalize_source_name(source, url) or source)
-            and normalized_article_title(article.title, article.source) == normalized_title
+            title_fingerprint
+            and article.title_fingerprint == title_fingerprint
+            and _source_match_key(article.source, article.url) == source_key
         ):
             return True
     return False
 
 
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+SIMHASH_BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+SIMHASH_MIN_WORDS = 5
+SIMHASH_CONTENT_CHARS = 1000
+_SIMHASH_MASK = (1 << SIMHASH_BITS) - 1
+
+
+def _story_shingles(title: str, content: str = "", source: str = "") -> list[str]:
+    text = f"{normalized_article_title(title, source)} {normalize_match_text((content or '')[:SIMHASH_CONTENT_CHARS])}"
+    words = re.sub(r"[^a-z0-9]+", " ", text).split()
+    if len(words) < SIMHASH_MIN_WORDS:
+        return []
+    return [" ".join(words[index:index + 3]) for index in range(len(words) - 2)]
+
+
+def article_simhash(title: str, content: str = "", source: str = ""):
+    """SimHash de 64 bits (com sinal, para caber em BigIntegerField) das trincas de palavras."""
+    shingles = _story_shingles(title, content, source)
+    if not shingles:
+        return None
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    simhash = sum(1 << bit for bit in range(SIMHASH_BITS) if weights[bit] > 0)
+    return simhash - (1 << SIMHASH_BITS) if simhash >= 1 << (SIMHASH_BITS - 1) else simhash
+
+
+def simhash_distance(first: int, second: int) -> int:
+    return bin((first ^ second) & _SIMHASH_MASK).count("1")
+
+
+def simhash_buckets(simhash: int) -> list[int]:
+    """Bandas LSH: duas noticias a ate SIMHASH_BANDS - 1 bits coincidem em alguma banda."""
+    unsigned = simhash & _SIMHASH_MASK
+    band_mask = (1 << SIMHASH_BAND_BITS) - 1
+    return [
+        band << SIMHASH_BAND_BITS | (unsigned >> (band * SIMHASH_BAND_BITS)) & band_mask
+        for band in range(SIMHASH_BANDS)
+    ]
+
+
+def link_near_duplicates(client, articles):
+    """
+    Liga noticias recem-criadas a materia canonica de republicacoes do cliente.
+
+    Cada noticia com SimHash grava suas bandas em ArticleStoryBucket; uma
+    consulta pelas bandas do lote traz as candidatas, e a mais proxima dentro
+    de SIMHASH_MAX_DISTANCE bits vira a materia canonica (a canonica de uma
+    copia e a canonica da propria copia). Devolve as noticias ligadas.
+    """
+    from django.conf import settings
+    from newsclip.models import ArticleStoryBucket
+
+    max_distance = min(getattr(settings, "SIMHASH_MAX_DISTANCE", 3), SIMHASH_BANDS - 1)
+    hashed = sorted((article for article in articles if article.simhash is not None), key=lambda item: item.pk)
+    if not hashed:
+        return []
+    buckets_by_article = {article.pk: simhash_buckets(article.simhash) for article in hashed}
+    all_buckets = {bucket for buckets in buckets_by_article.values() for bucket in buckets}
+    known = {}
+    rows = (
+        ArticleStoryBucket.objects.filter(client=client, bucket__in=all_buckets)
+        .exclude(article_id__in=buckets_by_article)
+        .values_list("bucket", "article_id", "article__simhash", "article__canonical_article_id")
+    )
+    for bucket, article_id, simhash, canonical_id in rows:
+        known.setdefault(bucket, []).append((article_id, simhash, canonical_id))
+
+    new_buckets = []
+    linked = []
+    for article in hashed:
+        best = None
+        for bucket in buckets_by_article[article.pk]:
+            for candidate_id, candidate_hash, canonical_id in known.get(bucket, ()):
+                distance = simhash_distance(article.simhash, candidate_hash)
+                if distance <= max_distance and (best is None or distance < best[0]):
+                    best = (distance, canonical_id or candidate_id)
+        if best is not None:
+            article.canonical_article_id = best[1]
+            linked.append(article)
+        for bucket in buckets_by_article[article.pk]:
+            known.setdefault(bucket, []).append((article.pk, article.simhash, article.canonical_article_id))
+            new_buckets.append(ArticleStoryBucket(client=client, article=article, bucket=bucket))
+
+    ArticleStoryBucket.objects.bulk_create(new_buckets, ignore_conflicts=True)
+    if linked:
+        now = dj_timezone.now()
+        for article in linked:
+            article.updated_at = now
+        Article.objects.bulk_update(linked, ["canonical_article", "updated_at"])
+    return linked
+
+
 def deduplicate_articles_for_display(articles):
+    """
+    Remove duplicatas exatas e recolhe republicacoes da mesma materia.
+
+    A noticia mantida de cada materia recebe ``republication_count`` com o
+    numero de copias recolhidas.
+    """
     seen = set()
+    kept_by_story = {}
     unique = []
     for article in articles:
+        story = getattr(article, "canonical_article_id", None) or article.pk
+        if story is not None and story in kept_by_story:
+            kept_by_story[story].republication_count += 1
+            continue
         key = article_dedup_key(article.title, article.source)
         url_key = canonicalize_article_url(article.url)
         marker = key or url_key
@@ -271,10 +404,62 @@ def deduplicate_articles_for_display(articles):
         seen.add(marker)
         if url_key:
             seen.add(url_key)
+        article.republication_count = 0
+        if story is not None:
+            kept_by_story[story] = article
         unique.append(article)
     return unique
 
 
+def display_articles_queryset(queryset):
+    """
+    Versao no banco de ``deduplicate_articles_for_display`` para as noticias
+    de um cliente.
+
+    Republicacoes recebem ``canonical_article`` na coleta, entao a noticia
+    canonica ja e a lider da materia: fica cada noticia sem canonica e, das
+    materias cuja canonica esta fora de ``queryset``, a copia de menor id.
+    As outras chaves da deduplicacao sao garantidas na gravacao (``dedup_key``
+    unica por cliente; mesma URL canonica entra na materia existente).
+    E so um filtro por linha (EXISTS pelo indice de ``canonical_article``):
+    a paginacao por cursor le apenas ``page_size + 1`` linhas pelo indice da
+    ordenacao, sem numerar o historico do cliente.
+    """
+    from django.db.models import Exists, OuterRef
+
+    canonical_listed = queryset.filter(pk=OuterRef("canonical_article_id"))
+    earlier_copy_listed = queryset.filter(
+        canonical_article_id=OuterRef("canonical_article_id"),
+        pk__lt=OuterRef("pk"),
+    )
+    return queryset.filter(
+        Q(canonical_article__isnull=True) | (~Exists(canonical_listed) & ~Exists(earlier_copy_listed))
+    )
+
+
+def attach_republication_counts(articles, queryset):
+    """Preenche ``republication_count`` das noticias exibidas com uma consulta agrupada."""
+    from django.db.models import Count, F
+    from django.db.models.functions import Coalesce
+
+    articles = list(articles)
+    stories = {article.canonical_article_id or article.pk: article for article in articles}
+    for article in articles:
+        article.republication_count = 0
+    if not stories:
+        return articles
+    counts = (
+        queryset.order_by()
+        .annotate(story=Coalesce(F("canonical_article_id"), F("id")))
+        .filter(story__in=list(stories))
+        .values("story")
+        .annotate(total=Count("id"))
+    )
+    for row in counts:
+        stories[row["story"]].republication_count = row["total"] - 1
+    return articles
+
+
 def client_excluded_terms(client) -> list[str]:
     return [
         term.strip()
@@ -517,14 +702,16 @@ def trusted_source_references(client) -> list[tuple[str, str]]:
     return references
 
 
-def is_trusted_source(client, url: str, source: str = "") -> bool:
+def is_trusted_source(client, url: str, source: str = "", references: list[tuple[str, str]] | None = None) -> bool:
+    if references is None:
+        references = trusted_source_references(client)
     parsed = urlsplit(url if "://" in (url or "") else f"https://{url or ''}")
     url_host = (parsed.hostname or "").casefold()
     if url_host.startswith("www."):
         url_host = url_host[4:]
     url_path = "/" + (parsed.path or "").strip("/")
     source_norm = normalize_match_text(source)
-    for host, path in trusted_source_references(client):
+    for host, path in references:
         if host and (url_host == host or source_norm == normalize_match_text(host)):
             if not path or url_path.startswith(path):
                 return True
@@ -543,6 +730,121 @@ def is_priority_news_source(url: str, source: str = "") -> bool:
     return any(host == known or host.endswith(f".{known}") for known in PRIORITY_NEWS_SOURCE_HOSTS) or source_norm in PRIORITY_NEWS_SOURCE_NAMES
 
 
+TRIAGE_PRIORITY_SOURCES = (
+    "G1",
+    "Diário da Região",
+    "Gazeta de Rio Preto",
+    "Região Noroeste",
+    "Band Paulista",
+    "Record Rio Preto",
+    "Prefeitura de Rio Preto",
+)
+TRIAGE_SOURCE_RANKS = {
+    normalize_match_text(source): rank
+    for rank, source in enumerate(TRIAGE_PRIORITY_SOURCES)
+}
+TRIAGE_GROUP_STOP_WORDS = {
+    "a", "as", "com", "da", "das", "de", "do", "dos", "e", "em", "na", "nas",
+    "no", "nos", "o", "os", "para", "por", "que", "um", "uma",
+}
+TRIAGE_FIELDS = [
+    "triage_band",
+    "triage_trusted",
+    "triage_source_rank",
+    "triage_identity_visible",
+    "triage_story_group",
+]
+# Campos que alimentam os componentes da triagem.
+TRIAGE_INPUT_FIELDS = {"title", "url", "source", "relevance_score"}
+# Ordenacao "prioridade" da fila de revisao; coincide com article_triage_queue_idx.
+TRIAGE_ORDERING = (
+    "triage_band",
+    "-triage_trusted",
+    "triage_source_rank",
+    "-triage_identity_visible",
+    "-relevance_score",
+    "triage_story_group",
+    "-published_at",
+    "-id",
+)
+
+
+def triage_score_band(score) -> int:
+    """Faixa de score na triagem: 60-69 primeiro (decisao mais util), depois 70+, 50-59 e o resto."""
+    score = int(score or 0)
+    if 60 <= score <= 69:
+        return 0
+    if score >= 70:
+        return 1
+    if 50 <= score <= 59:
+        return 2
+    return 3
+
+
+TriageProfile = namedtuple("TriageProfile", ["identity_terms", "trusted_references"])
+
+
+def triage_identity_terms(client) -> list[str]:
+    return [
+        normalized
+        for normalized in (normalize_match_text(term) for term in strong_client_identity_terms(client))
+        if normalized
+    ]
+
+
+def triage_profile(client_id: int, client=None) -> TriageProfile:
+    """Termos de identidade e fontes confiaveis da triagem, em cache por versao do perfil.
+
+    Sem ``client`` carregado (gravacao uma a uma pelo sinal de pre_save), o
+    cadastro so e lido do banco quando a versao atual ainda nao esta no cache.
+    """
+    from newsclip.models import Client
+    from newsclip.profiles import cached_profile_value, current_profile_version
+
+    def build():
+        loaded = client or Client.objects.only(*Client.PROFILE_FIELDS).get(pk=client_id)
+        return TriageProfile(triage_identity_terms(loaded), trusted_source_references(loaded))
+
+    version = current_profile_version(client or SimpleNamespace(pk=client_id))
+    return cached_profile_value(f"triage:{client_id}:{version}", build)
+
+
+def article_triage_fields(client, article, profile: TriageProfile | None = None) -> dict:
+    """Componentes da prioridade de triagem da noticia (ver TRIAGE_ORDERING)."""
+    if profile is None:
+        profile = triage_profile(client.pk, client)
+    visible_text = normalize_match_text(f"{article.title} {article.url} {article.source}")
+    title_words = [
+        word
+        for word in normalize_match_text(article.title).split()
+        if word not in TRIAGE_GROUP_STOP_WORDS
+    ]
+    return {
+        "triage_band": triage_score_band(article.relevance_score),
+        "triage_trusted": is_trusted_source(client, article.url, article.source, profile.trusted_references),
+        "triage_source_rank": TRIAGE_SOURCE_RANKS.get(
+            normalize_match_text(article.source),
+            len(TRIAGE_SOURCE_RANKS) + 1,
+        ),
+        "triage_identity_visible": any(term in visible_text for term in profile.identity_terms),
+        "triage_story_group": " ".join(title_words[:4])[:255],
+    }
+
+
+def apply_triage_fields(client, articles, profile: TriageProfile | None = None) -> list:
+    """Atualiza em memoria os campos de triagem; devolve as noticias que mudaram."""
+    if profile is None:
+        profile = triage_profile(client.pk, client)
+    changed = []
+    for article in articles:
+        fields = article_triage_fields(client, article, profile)
+        if any(getattr(article, name) != value for name, value in fields.items()):
+            for name, value in fields.items():
+                setattr(article, name, value)
+            changed.append(article)
+    return changed
+
+
 def is_official_social_source(client, url: str, source: str = "") -> bool:
     searchable = normalize_match_text(f"{url} {source}")
     return any(normalize_match_text(handle) in searchable for handle in social_handle_terms(client))
@@ -607,6 +909,70 @@ def audit_relevance_decision(
         pass
 
 
+def url_host_and_path(url: str) -> tuple[str, str]:
+    """Host (sem ``www.``) e caminho ``/a/b`` da URL, aceitando URL sem esquema."""
+    parsed = urlsplit(url if "://" in (url or "") else f"https://{url or ''}")
+    host = (parsed.hostname or "").casefold().removeprefix("www.")
+    return host, "/" + (parsed.path or "").strip("/")
+
+
+# Tudo o que a validacao deriva do candidato sem depender dos termos do
+# cliente; calculado uma vez e reaproveitado quando o mesmo candidato e
+# pontuado com perfis diferentes (ver newsclip.simulation).
+ArticleCandidate = namedtuple(
+    "ArticleCandidate",
+    [
+        "title",
+        "content",
+        "url",
+        "source",
+        "provider",
+        "searchable_norm",
+        "visible_norm",
+        "url_source_norm",
+        "url_host",
+        "url_path",
+        "source_norm",
+        "priority_source",
+        "social_or_video_source",
+        "secure_url",
+    ],
+)
+
+
+def prepare_article_candidate(title: str, content: str, url: str, source: str, provider: str = "") -> ArticleCandidate:
+    url_host, url_path = url_host_and_path(url)
+    return ArticleCandidate(
+        title=title,
+        content=content,
+        url=url,
+        source=source,
+        provider=provider,
+        searchable_norm=normalize_match_text(" ".join([title or "", content or "", url or "", source or ""])),
+        visible_norm=normalize_match_text(" ".join([title or "", url or "", source or ""])),
+        url_source_norm=normalize_match_text(f"{url} {source}"),
+        url_host=url_host,
+        url_path=url_path,
+        source_norm=normalize_match_text(source),
+        priority_source=is_priority_news_source(url, source),
+        social_or_video_source=is_social_or_video_source(url, source, provider),
+        secure_url=canonicalize_article_url(url).startswith("https://"),
+    )
+
+
+def learned_adjustments_for(client, candidates) -> list[tuple[int, str]]:
+    """Ajustes do aprendizado de varios candidatos preparados, calculados em lote."""
+    try:
+        from newsclip.learning import learned_score_adjustments
+
+        return learned_score_adjustments(
+            client,
+            [(candidate.title, candidate.content, candidate.source, candidate.provider) for candidate in candidates],
+        )
+    except Exception:
+        return [(0, "")] * len(candidates)
+
+
 def validate_article_candidate(
     client,
     title: str,
@@ -615,26 +981,35 @@ def validate_article_candidate(
     source: str,
     provider: str = "",
 ) -> dict:
-    if contains_excluded_term(client, title, content, url, source):
+    return score_article_candidate(client, prepare_article_candidate(title, content, url, source, provider))
+
+
+def score_article_candidate(client, candidate: ArticleCandidate, learned: tuple[int, str] | None = None) -> dict:
+    """Pontua um candidato ja preparado.
+
+    ``learned`` e o ajuste do aprendizado ja calculado em lote (ver
+    ``learned_adjustments_for``); sem ele, o ajuste e calculado aqui.
+    """
+    from newsclip.matching import client_matcher
+
+    matcher = client_matcher(client)
+    searchable_norm = candidate.searchable_norm
+    if matcher.contains_excluded(searchable_norm):
         return {"status": "REJECTED", "score": 0, "reason": "Contem termo proibido"}
 
-    identity_terms = client_identity_terms(client)
-    strong_identity_terms = strong_client_identity_terms(client)
-    context_terms = client_context_terms(client)
-    searchable = " ".join([title or "", content or "", url or "", source or ""])
-    visible_searchable = " ".join([title or "", url or "", source or ""])
-    identity_matches = matched_terms(searchable, identity_terms)
-    strong_identity_matches = matched_terms(searchable, strong_identity_terms)
-    visible_identity_matches = matched_terms(visible_searchable, identity_terms)
-    visible_strong_identity_matches = matched_terms(visible_searchable, strong_identity_terms)
-    context_matches = matched_terms(searchable, context_terms)
-    official_source = is_official_social_source(client, url, source)
-    trusted_source = is_trusted_source(client, url, source) or is_priority_news_source(url, source)
-    social_or_video_source = is_social_or_video_source(url, source, provider)
-
-    full_name_norm = normalize_match_text(getattr(client, "name", ""))
-    searchable_norm = normalize_match_text(searchable)
-    visible_searchable_norm = normalize_match_text(visible_searchable)
+    visible_searchable_norm = candidate.visible_norm
+    identity_matches = matcher.matched(searchable_norm, matcher.identity_terms)
+    strong_identity_matches = matcher.matched(searchable_norm, matcher.strong_identity_terms)
+    visible_identity_matches = matcher.matched(visible_searchable_norm, matcher.identity_terms)
+    visible_strong_identity_matches = matcher.matched(visible_searchable_norm, matcher.strong_identity_terms)
+    context_matches = matcher.matched(searchable_norm, matcher.context_terms)
+    official_source = matcher.has_official_handle(candidate.url_source_norm)
+    trusted_source = candidate.priority_source or matcher.is_trusted_reference(
+        candidate.url_host, candidate.url_path, candidate.source_norm
+    )
+    social_or_video_source = candidate.social_or_video_source
+
+    full_name_norm = matcher.name_norm
     full_name_match = bool(full_name_norm and full_name_norm in searchable_norm)
     visible_full_name_match = bool(full_name_norm and full_name_norm in visible_searchable_norm)
     score = 0
@@ -718,18 +1093,14 @@ def validate_article_candidate(
         score = min(100, score + 10)
         reason = f"{reason}; fonte confiavel"
 
-    if canonicalize_article_url(url).startswith("https://") and score >= 70:
+    if candidate.secure_url and score >= 70:
         score = min(100, score + 3)
 
     if not official_source:
-        try:
-            from newsclip.learning import learned_score_adjustment
-
-            learned_adjustment, learned_reason = learned_score_adjustment(
-                client, title, content, source, provider
-            )
-        except Exception:
-            learned_adjustment, learned_reason = 0, ""
+        if learned is not None:
+            learned_adjustment, learned_reason = learned
+        else:
+            learned_adjustment, learned_reason = learned_adjustments_for(client, [candidate])[0]
         if learned_adjustment:
             score = max(0, min(100, score + learned_adjustment))
             reason = f"{reason}; {learned_reason}"
@@ -748,7 +1119,23 @@ def validate_article_candidate(
     }
 
 
-def revalidate_article(article, persist: bool = True, client=None) -> dict:
+# Incremente ao mudar as regras de validate_article_candidate: todas as
+# noticias passam a ser revalidadas uma vez.
+VALIDATION_RULES_VERSION = 1
+
+
+def current_rules_version(client) -> str:
+    """
+    Versao das regras + termos do cliente com que uma noticia e pontuada.
+
+    Mudancas de pesos do aprendizado nao entram aqui: elas repontuam apenas as
+    noticias com as features afetadas (ver revalidation.rescore_learning_changes).
+    """
+    fingerprint = client.compute_profile_fingerprint() if hasattr(client, "compute_profile_fingerprint") else ""
+    return f"{VALIDATION_RULES_VERSION}.{fingerprint[:16] or 0}"
+
+
+def revalidate_article(article, persist: bool = True, client=None, rules_version: str | None = None) -> dict:
     if persist and is_manual_validation(article):
         return {
             "status": article.validation_status,
@@ -765,22 +1152,118 @@ def revalidate_article(article, persist: bool = True, client=None) -> dict:
         article.source,
         provider=article.provider,
     )
+    rules_version = rules_version or current_rules_version(article_client)
     if persist and (
         article.validation_status != validation["status"]
         or article.relevance_score != validation["score"]
         or article.validation_reason != validation["reason"][:255]
+        or article.rules_version != rules_version
     ):
-        Article.objects.filter(pk=article.pk).update(
-            validation_status=validation["status"],
-            relevance_score=validation["score"],
-            validation_reason=validation["reason"][:255],
-        )
+        from newsclip.stats import tracking_article_stats
+
         article.validation_status = validation["status"]
         article.relevance_score = validation["score"]
         article.validation_reason = validation["reason"][:255]
+        article.rules_version = rules_version
+        triage = article_triage_fields(article_client, article)
+        with transaction.atomic(), tracking_article_stats([article.pk]):
+            Article.objects.filter(pk=article.pk).update(
+                validation_status=article.validation_status,
+                relevance_score=article.relevance_score,
+                validation_reason=article.validation_reason,
+                rules_version=rules_version,
+                updated_at=dj_timezone.now(),
+                **triage,
+            )
+        for name, value in triage.items():
+            setattr(article, name, value)
     return validation
 
 
+REVALIDATION_FIELDS = ["validation_status", "relevance_score", "validation_reason", "rules_version", *TRIAGE_FIELDS]
+
+
+def empty_revalidation_stats() -> dict:
+    return {
+        "processed": 0,
+        "changed": 0,
+        "promoted": 0,
+        "accepted": 0,
+        "review": 0,
+        "rejected": 0,
+    }
+
+
+def score_articles_batch(client, articles, rules_version: str) -> tuple[dict, list]:
+    """
+    Repontua um bloco de noticias em memoria, sem gravar nada.
+
+    Devolve as estatisticas do bloco e as noticias cuja pontuacao, triagem ou
+    ``rules_version`` mudou, ja com os valores novos nos atributos.
+    """
+    stats = empty_revalidation_stats()
+    changed = []
+    articles = list(articles)
+    candidates = [
+        prepare_article_candidate(
+            article.title,
+            article.content or article.summary or "",
+            article.url,
+            article.source,
+            article.provider,
+        )
+        for article in articles
+    ]
+    learned = learned_adjustments_for(client, candidates)
+    client_triage = triage_profile(client.pk, client)
+    for article, candidate, learned_adjustment in zip(articles, candidates, learned):
+        previous = article.validation_status
+        validation = score_article_candidate(client, candidate, learned_adjustment)
+        status = validation["status"]
+        stats["processed"] += 1
+        stats[status.lower()] += 1
+        if status != previous:
+            stats["changed"] += 1
+        if previous != "ACCEPTED" and status == "ACCEPTED":
+            stats["promoted"] += 1
+        stored = [getattr(article, name) for name in REVALIDATION_FIELDS]
+        article.validation_status = status
+        article.relevance_score = validation["score"]
+        article.validation_reason = validation["reason"][:255]
+        article.rules_version = rules_version
+        for name, value in article_triage_fields(client, article, client_triage).items():
+            setattr(article, name, value)
+        if stored != [getattr(article, name) for name in REVALIDATION_FIELDS]:
+            changed.append(article)
+    return stats, changed
+
+
+def merge_revalidation_stats(stats: dict, other: dict) -> dict:
+    for key, value in other.items():
+        stats[key] += value
+    return stats
+
+
+def revalidate_articles_batch(client, articles, rules_version: str | None = None, persist: bool = True) -> dict:
+    """
+    Repontua um bloco de noticias em memoria e grava tudo com um bulk_update.
+
+    As noticias ja devem vir sem validacao manual. Devolve as mesmas
+    estatisticas de ``revalidate_pending_articles_for_client``.
+    """
+    from newsclip.stats import tracking_article_stats
+
+    rules_version = rules_version or current_rules_version(client)
+    stats, changed = score_articles_batch(client, articles, rules_version)
+    if persist and changed:
+        now = dj_timezone.now()
+        for article in changed:
+            article.updated_at = now
+        with transaction.atomic(), tracking_article_stats(article.pk for article in changed):
+            Article.objects.bulk_update(changed, [*REVALIDATION_FIELDS, "updated_at"])
+    return stats
+
+
 def is_manual_validation(article) -> bool:
     reason = (getattr(article, "validation_reason", "") or "").casefold()
     if "usuario" in reason:
@@ -788,22 +1271,45 @@ def is_manual_validation(article) -> bool:
     return getattr(article, "manual_feedback", None) is not None
 
 
-def revalidate_accepted_articles_for_client(client, limit: int = 250) -> int:
-    articles = Article.objects.select_related("client").filter(
+REVALIDATION_LOAD_FIELDS = (
+    "id",
+    "title",
+    "content",
+    "summary",
+    "url",
+    "source",
+    "provider",
+    "validation_status",
+    "relevance_score",
+    "validation_reason",
+    "rules_version",
+    *TRIAGE_FIELDS,
+)
+
+
+def iter_article_chunks(queryset, chunk_size: int | None = None):
+    """Percorre o queryset em blocos de ``chunk_size`` sem carregar tudo na memoria."""
+    from django.conf import settings
+
+    chunk_size = max(1, chunk_size or getattr(settings, "REVALIDATION_CHUNK_SIZE", 500))
+    iterator = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def pending_revalidation_queryset(client, statuses, rules_version: str, only_stale: bool = True):
+    """Noticias automaticas do cliente nos ``statuses`` que a revalidacao deve repontuar."""
+    articles = Article.objects.filter(
         client=client,
         excluded=False,
-        validation_status="ACCEPTED",
+        validation_status__in=statuses,
     ).exclude(
         Q(validation_reason__icontains="usuario")
         | Q(manual_feedback__isnull=False)
-    ).order_by("-published_at", "-id")[:limit]
-    changed = 0
-    for article in articles:
-        previous = article.validation_status
-        validation = revalidate_article(article, persist=True, client=client)
-        if validation["status"] != previous:
-            changed += 1
-    return changed
+    ).only(*REVALIDATION_LOAD_FIELDS)
+    if only_stale:
+        articles = articles.exclude(rules_version=rules_version)
+    return articles
 
 
 def revalidate_pending_articles_for_client(
@@ -812,44 +1318,52 @@ def revalidate_pending_articles_for_client(
     *,
     limit: int | None = None,
     persist: bool = True,
+    only_stale: bool = True,
+    chunk_size: int | None = None,
+    workers: int = 1,
 ) -> dict:
+    """Revalida pendentes/rejeitadas do cliente.
+
+    Com ``only_stale`` (padrao) so entram noticias pontuadas com regras ou
+    perfil antigos. Simulacoes com o cliente alterado apenas em memoria
+    (``persist=False``) devem passar ``only_stale=False``.
+
+    As noticias sao lidas em streaming e cada bloco de ``chunk_size``
+    (padrao REVALIDATION_CHUNK_SIZE) e pontuado em memoria e gravado com um
+    unico bulk_update. Toda noticia gravada recebe a ``rules_version`` atual,
+    entao uma linha alterada durante a leitura nunca volta a casar com o
+    filtro de desatualizadas.
+
+    Com ``workers`` > 1 (e sem ``limit``) a faixa de ids e dividida entre
+    processos que so pontuam; as gravacoes continuam neste processo.
+    """
     statuses = statuses or ["REVIEW", "REJECTED"]
     allowed_statuses = {"ACCEPTED", "REVIEW", "REJECTED"}
     selected_statuses = [status for status in statuses if status in allowed_statuses]
-    articles = Article.objects.select_related("client").filter(
-        client=client,
-        excluded=False,
-        validation_status__in=selected_statuses,
-    ).exclude(
-        Q(validation_reason__icontains="usuario")
-        | Q(manual_feedback__isnull=False)
+    rules_version = current_rules_version(client)
+    if workers > 1 and not limit:
+        from newsclip.revalidation import revalidate_in_parallel
+
+        return revalidate_in_parallel(
+            client,
+            selected_statuses,
+            rules_version,
+            workers=workers,
+            persist=persist,
+            only_stale=only_stale,
+            chunk_size=chunk_size,
+        )
+
+    articles = pending_revalidation_queryset(
+        client, selected_statuses, rules_version, only_stale
     ).order_by("-published_at", "-id")
     if limit:
         articles = articles[:limit]
 
-    stats = {
-        "processed": 0,
-        "changed": 0,
-        "promoted": 0,
-        "accepted": 0,
-        "review": 0,
-        "rejected": 0,
-    }
-    for article in articles:
-        previous = article.validation_status
-        validation = revalidate_article(article, persist=persist, client=client)
-        status = validation["status"]
-        stats["processed"] += 1
-        if status == "ACCEPTED":
-            stats["accepted"] += 1
-        elif status == "REVIEW":
-            stats["review"] += 1
-        elif status == "REJECTED":
-            stats["rejected"] += 1
-        if status != previous:
-            stats["changed"] += 1
-        if previous != "ACCEPTED" and status == "ACCEPTED":
-            stats["promoted"] += 1
+    stats = empty_revalidation_stats()
+    for chunk in iter_article_chunks(articles, chunk_size):
+        chunk_stats = revalidate_articles_batch(client, chunk, rules_version, persist=persist)
+        merge_revalidation_stats(stats, chunk_stats)
     return stats
 
 
@@ -903,6 +1417,55 @@ def record_endpoint_failure(endpoint, exc, *, client=None, log=None) -> None:
             pass
 
 
+def conditional_get(target, url, *, headers=None, timeout=20, conditional=True, **get_options):
+    """Baixa ``url`` reaproveitando ETag/Last-Modified salvos em ``target``.
+
+    ``target`` e uma ``Source`` ou ``SourceEndpoint``. Retorna ``None`` quando o
+    servidor responde 304 ou devolve o mesmo corpo da ultima coleta: nesses
+    casos nao ha nada novo para interpretar, casar com clientes ou salvar.
+    Demais opcoes (``max_bytes``, ``deadline``) seguem para ``http_client.get``.
+    """
+    request_headers = conditional_headers(target, headers, conditional)
+    response = http_client.get(url, headers=request_headers, timeout=timeout, **get_options)
+    if conditional and response.status_code == 304:
+        return None
+    response.raise_for_status()
+    if conditional and target.content_hash and target.content_hash == content_sha256(response.content):
+        return None
+    return response
+
+
+def conditional_headers(target, headers=None, conditional=True) -> dict:
+    """``headers`` com If-None-Match/If-Modified-Since dos validadores salvos em ``target``."""
+    request_headers = dict(headers or {})
+    if conditional:
+        if target.etag:
+            request_headers["If-None-Match"] = target.etag
+        if target.last_modified:
+            request_headers["If-Modified-Since"] = target.last_modified
+    return request_headers
+
+
+def content_sha256(content: bytes) -> str:
+    return hashlib.sha256(content or b"").hexdigest()
+
+
+def remember_fetch_validators(target, response, content_hash: str | None = None) -> None:
+    """Guarda os validadores HTTP depois que o conteudo foi processado com sucesso.
+
+    Respostas lidas em blocos (``http_client.stream``) nao guardam o corpo e
+    passam o ``content_hash`` ja calculado durante a leitura.
+    """
+    updates = {
+        "etag": (response.headers.get("ETag") or "")[:255],
+        "last_modified": (response.headers.get("Last-Modified") or "")[:64],
+        "content_hash": content_hash or content_sha256(response.content),
+    }
+    type(target).objects.filter(pk=target.pk).update(**updates)
+    for field, value in updates.items():
+        setattr(target, field, value)
+
+
 # —————————————————————————————————————————
 # 4) Salvamento de artigos no banco
 # —————————————————————————————————————————
@@ -910,115 +1473,290 @@ def record_endpoint_failure(endpoint, exc, *, client=None, log=None) -> None:
 def save_article(client, title, url, raw_date, source, content_text=None, provider="OTHER", query=""):
     """
     Salva um artigo no banco de dados e calcula seu search_vector.
+
+    Atalho de ``save_articles`` para um único candidato; devolve o artigo
+    criado ou promovido, ou ``None``.
     """
-    dt = None
-    if raw_date:
-        try:
-            parsed = date_parser.parse(str(raw_date))
-            dt = parsed if parsed.tzinfo else dj_timezone.make_aware(
-                parsed, dj_timezone.get_current_timezone()
-            )
-        except Exception as e:
-            print(f"Erro ao parsear data '{raw_date}' para o título '{title[:50]}...': {e}. Usando None.")
-            dt = None
+    candidate = {
+        "title": title,
+        "url": url,
+        "raw_date": raw_date,
+        "source": source,
+        "content_text": content_text,
+        "provider": provider,
+        "query": query,
+    }
+    try:
+        return save_articles(client, [candidate])[0]
+    except IntegrityError:
+        return None
+    except Exception as e:
+        print(f"ERRO GERAL ao salvar artigo '{(title or '')[:255]}' ({url}): {e}")
+        return None
 
-    processed_title = (title or "")[:Article._meta.get_field('title').max_length]
-    processed_url = canonicalize_article_url(url)
-    processed_source = canonicalize_source_name(source, processed_url)[:Article._meta.get_field('source').max_length]
 
-    validation = validate_article_candidate(
-        client, processed_title, content_text or "", processed_url, processed_source, provider=provider
-    )
-    decision = (
-        "APPROVED"
-        if validation["status"] == "ACCEPTED"
-        else ("REVIEW" if validation["status"] == "REVIEW" else "REJECTED")
-    )
-    audit_relevance_decision(
-        client,
-        provider=provider,
-        query=query,
-        title=processed_title,
-        url=processed_url,
-        source=processed_source,
-        score=validation["score"],
-        reason=validation["reason"],
-        decision=decision,
-    )
-    should_persist_rejected_candidate = validation["status"] == "REJECTED" and validation["score"] > 0
-    if validation["status"] == "REJECTED" and not should_persist_rejected_candidate:
+def _parse_article_date(raw_date, title):
+    if not raw_date:
+        return None
+    try:
+        parsed = date_parser.parse(str(raw_date))
+        return parsed if parsed.tzinfo else dj_timezone.make_aware(
+            parsed, dj_timezone.get_current_timezone()
+        )
+    except Exception as e:
+        print(f"Erro ao parsear data '{raw_date}' para o título '{(title or '')[:50]}...': {e}. Usando None.")
         return None
 
-    dedup_key = article_dedup_key(processed_title, processed_source)
-    
-    summary_text = generate_summary(content_text if content_text else processed_title)
-    topic_classification = _topic_clf.classify(processed_title) # _topic_clf deve estar definido neste arquivo
 
-    article_instance = None
-    try:
-        existing_article = Article.objects.filter(client=client).filter(Q(url=processed_url) | Q(dedup_key=dedup_key)).first()
-        if existing_article:
-            if (
-                not is_manual_validation(existing_article)
-                and validation["status"] != existing_article.validation_status
-                and validation["score"] > int(existing_article.relevance_score or 0)
-            ):
-                Article.objects.filter(pk=existing_article.pk).update(
-                    validation_status=validation["status"],
-                    relevance_score=validation["score"],
-                    validation_reason=validation["reason"][:255],
-                    excluded=False,
-                    provider=(provider or "OTHER")[:32].upper(),
-                    content=content_text if content_text else existing_article.content,
-                )
-                existing_article.refresh_from_db()
-                return existing_article
-            return None
+def _article_search_vector():
+    return (
+        SearchVector("title", weight="A", config="portuguese")
+        + SearchVector("summary", weight="B", config="portuguese")
+        + SearchVector("content", weight="C", config="portuguese")
+        + SearchVector("source", weight="D", config="portuguese")
+    )
 
-        if is_duplicate_article(client, processed_title, processed_source, processed_url):
-            return None
 
+def _insert_new_articles(client, articles):
+    """
+    Grava ``articles`` e devolve o queryset apenas das linhas criadas aqui.
+
+    O caminho normal e um bulk_create comum (PostgreSQL devolve os pks). Se
+    outra coleta gravou a mesma noticia no meio tempo, o lote e refeito sem as
+    URLs que ja existem e com ``ignore_conflicts``; as linhas da outra coleta
+    nao contam como criadas (contadores, quase-duplicatas e aprendizado).
+    """
+    urls = [article.url for article in articles]
+    try:
         with transaction.atomic():
-            article_instance = Article.objects.create(
+            Article.objects.bulk_create(articles)
+    except IntegrityError:
+        existing = set(Article.objects.filter(client=client, url__in=urls).values_list("url", flat=True))
+        pending = [article for article in articles if article.url not in existing]
+        for article in pending:
+            article.pk = None
+        Article.objects.bulk_create(pending, ignore_conflicts=True)
+        urls = [article.url for article in pending]
+    else:
+        ids = [article.pk for article in articles]
+        if all(ids):
+            return Article.objects.filter(pk__in=ids)
+    return Article.objects.filter(client=client, url__in=urls)
+
+
+def save_articles(client, candidates):
+    """
+    Salva um lote de candidatos do mesmo cliente com poucas consultas.
+
+    ``candidates`` são dicionários com os argumentos de ``save_article``. A
+    validação roda em memória, duplicatas dentro do lote ficam só com o
+    candidato de maior score, e o banco recebe uma busca indexada de
+    existentes (URL, hash da URL, dedup_key, fingerprint do titulo), um
+    ``bulk_create`` das novas, um ``bulk_update`` das promovidas, a
+    auditoria em lote e um único UPDATE de search_vector. As novas são
+    ligadas à matéria canônica quando são republicações (SimHash).
+    Devolve uma lista alinhada com ``candidates``: o artigo criado ou
+    promovido, ou ``None``.
+    """
+    from newsclip.learning import index_article_learning_features
+    from newsclip.models import RelevanceAuditLog
+    from newsclip.stats import add_article_stats, tracking_article_stats
+
+    title_max_length = Article._meta.get_field('title').max_length
+    source_max_length = Article._meta.get_field('source').max_length
+    rules_version = current_rules_version(client)
+    results = [None] * len(candidates)
+    audit_rows = []
+    prepared = []
+    scored = []
+    for candidate in candidates:
+        content_text = candidate.get("content_text")
+        provider = candidate.get("provider") or "OTHER"
+        processed_title = (candidate.get("title") or "")[:title_max_length]
+        processed_url = canonicalize_article_url(candidate.get("url"))
+        processed_source = canonicalize_source_name(candidate.get("source"), processed_url)[:source_max_length]
+        scored.append(
+            prepare_article_candidate(processed_title, content_text or "", processed_url, processed_source, provider)
+        )
+    learned = learned_adjustments_for(client, scored)
+
+    for index, candidate in enumerate(candidates):
+        article_candidate = scored[index]
+        content_text = candidate.get("content_text")
+        provider = article_candidate.provider
+        processed_title = article_candidate.title
+        processed_url = article_candidate.url
+        processed_source = article_candidate.source
+
+        validation = score_article_candidate(client, article_candidate, learned[index])
+        decision = (
+            "APPROVED"
+            if validation["status"] == "ACCEPTED"
+            else ("REVIEW" if validation["status"] == "REVIEW" else "REJECTED")
+        )
+        audit_rows.append(
+            RelevanceAuditLog(
                 client=client,
-                url=processed_url,
-                title=processed_title,
-                published_at=dt,
-                source=processed_source,
-                summary=summary_text,
-                topic=topic_classification,
-                content=content_text if content_text else "",
-                dedup_key=dedup_key,
-                provider=(provider or "OTHER")[:32].upper(),
-                relevance_score=validation["score"],
-                validation_status=validation["status"],
-                validation_reason=validation["reason"][:255],
-            )
-        # print(f"Artigo CRIADO: {article_instance.title_truncado}") # title_truncado é uma property no modelo Article
-
-        if connection.vendor == "postgresql":
-            # Grave um tsvector real; atribuir texto puro a SearchVectorField deixa
-            # o índice inválido ou vazio no PostgreSQL.
-            vector = (
-                SearchVector("title", weight="A", config="portuguese")
-                + SearchVector("summary", weight="B", config="portuguese")
-                + SearchVector("content", weight="C", config="portuguese")
-                + SearchVector("source", weight="D", config="portuguese")
-            )
-            Article.objects.filter(pk=article_instance.pk).update(search_vector=vector)
-        else:
-            article_instance.search_vector = " ".join(
-                filter(None, [article_instance.title, article_instance.summary, article_instance.content, article_instance.source])
+                provider=provider[:50],
+                query=candidate.get("query") or "",
+                title=processed_title[:500],
+                url=processed_url or "",
+                source=(processed_source or "")[:255],
+                relevance_score=max(0, min(int(validation["score"] or 0), 100)),
+                relevance_reason=(validation["reason"] or "")[:255],
+                decision=decision,
             )
-            article_instance.save(update_fields=["search_vector"])
-        # print(f"Search vector atualizado para: {article_instance.title_truncado}")
+        )
+        if validation["status"] == "REJECTED" and validation["score"] <= 0:
+            continue
+        prepared.append(
+            {
+                "index": index,
+                "title": processed_title,
+                "url": processed_url,
+                "source": processed_source,
+                "raw_date": candidate.get("raw_date"),
+                "content": content_text or "",
+                "provider": provider[:32].upper(),
+                "dedup_key": article_dedup_key(processed_title, processed_source),
+                "url_hash": article_url_hash(processed_url),
+                "title_fingerprint": article_title_fingerprint(processed_title, processed_source),
+                "source_key": _source_match_key(processed_source, processed_url),
+                "validation": validation,
+            }
+        )
 
-    except IntegrityError:
-        # print(f"Artigo JÁ EXISTE (URL): {url}")
+    try:
+        RelevanceAuditLog.objects.bulk_create(audit_rows)
+    except Exception:
+        # Auditoria nunca pode derrubar a coleta.
         pass
-    except Exception as e:
-        print(f"ERRO GERAL ao salvar artigo '{processed_title}' ({url}): {e}")
-
-    return article_instance
 
+    # Duplicatas dentro do lote (mesma URL ou mesma publicação) ficam com o
+    # candidato de maior score, como aconteceria com a promoção sequencial.
+    best_by_key = {}
+    for item in prepared:
+        keys = [("url", item["url"]), ("dedup", item["dedup_key"])]
+        rivals = {id(best_by_key[key]): best_by_key[key] for key in keys if key in best_by_key}
+        if any(rival["validation"]["score"] >= item["validation"]["score"] for rival in rivals.values()):
+            continue
+        for rival in rivals.values():
+            best_by_key.pop(("url", rival["url"]), None)
+            best_by_key.pop(("dedup", rival["dedup_key"]), None)
+        for key in keys:
+            best_by_key[key] = item
+    unique = list({id(item): item for item in best_by_key.values()}.values())
+    if not unique:
+        return results
+
+    existing_by_url = {}
+    existing_by_dedup = {}
+    existing_by_title = {}
+    existing_articles = (
+        Article.objects.filter(client=client)
+        .filter(
+            Q(url__in={item["url"] for item in unique})
+            | Q(url_hash__in={item["url_hash"] for item in unique if item["url_hash"]})
+            | Q(dedup_key__in={item["dedup_key"] for item in unique})
+            | Q(title_fingerprint__in={item["title_fingerprint"] for item in unique if item["title_fingerprint"]})
+        )
+        .select_related("manual_feedback")
+    )
+    for article in existing_articles:
+        existing_by_url.setdefault(article.url, article)
+        if article.url_hash:
+            existing_by_url.setdefault(article.url_hash, article)
+        if article.dedup_key:
+            existing_by_dedup.setdefault(article.dedup_key, article)
+        if article.title_fingerprint:
+            title_key = (article.title_fingerprint, _source_match_key(article.source, article.url))
+            existing_by_title.setdefault(title_key, article)
+
+    to_create = []
+    to_promote = {}
+    for item in sorted(unique, key=lambda value: value["index"]):
+        validation = item["validation"]
+        existing = (
+            existing_by_url.get(item["url"])
+            or existing_by_url.get(item["url_hash"])
+            or existing_by_dedup.get(item["dedup_key"])
+            or existing_by_title.get((item["title_fingerprint"], item["source_key"]))
+        )
+        if existing is not None:
+            if (
+                existing.pk not in to_promote
+                and not is_manual_validation(existing)
+                and validation["status"] != existing.validation_status
+                and validation["score"] > int(existing.relevance_score or 0)
+            ):
+                existing.validation_status = validation["status"]
+                existing.relevance_score = validation["score"]
+                existing.validation_reason = validation["reason"][:255]
+                existing.excluded = False
+                existing.provider = item["provider"]
+                existing.content = item["content"] or existing.content
+                existing.rules_version = rules_version
+                existing.updated_at = dj_timezone.now()
+                to_promote[existing.pk] = existing
+                results[item["index"]] = existing
+            continue
 
+        summary_text = generate_summary(item["content"] or item["title"])
+        article = Article(
+            client=client,
+            url=item["url"],
+            title=item["title"],
+            published_at=_parse_article_date(item["raw_date"], item["title"]),
+            source=item["source"],
+            summary=summary_text,
+            topic=_topic_clf.classify(item["title"]),
+            content=item["content"],
+            dedup_key=item["dedup_key"],
+            title_fingerprint=item["title_fingerprint"],
+            url_hash=item["url_hash"],
+            simhash=article_simhash(item["title"], item["content"], item["source"]),
+            provider=item["provider"],
+            relevance_score=validation["score"],
+            validation_status=validation["status"],
+            validation_reason=validation["reason"][:255],
+            rules_version=rules_version,
+        )
+        if connection.vendor != "postgresql":
+            # SQLite e outros bancos locais não têm tsvector; guarda o texto.
+            article.search_vector = " ".join(
+                filter(None, [article.title, article.summary, article.content, article.source])
+            )
+        to_create.append((item["index"], article))
+
+    apply_triage_fields(client, [*to_promote.values(), *(article for _index, article in to_create)])
+    with transaction.atomic():
+        if to_promote:
+            with tracking_article_stats(to_promote):
+                Article.objects.bulk_update(
+                    list(to_promote.values()),
+                    [
+                        "validation_status",
+                        "relevance_score",
+                        "validation_reason",
+                        "excluded",
+                        "provider",
+                        "content",
+                        "rules_version",
+                        "updated_at",
+                        *TRIAGE_FIELDS,
+                    ],
+                )
+            index_article_learning_features(to_promote.values())
+        if to_create:
+            created = _insert_new_articles(client, [article for _index, article in to_create])
+            if connection.vendor == "postgresql":
+                # Grave um tsvector real; atribuir texto puro a SearchVectorField
+                # deixa o índice inválido ou vazio no PostgreSQL.
+                created.update(search_vector=_article_search_vector())
+            created_by_url = {article.url: article for article in created}
+            link_near_duplicates(client, created_by_url.values())
+            add_article_stats(article.pk for article in created_by_url.values())
+            index_article_learning_features(created_by_url.values())
+            for index, article in to_create:
+                results[index] = created_by_url.get(article.url)
+    return results
@@ -1,5 +1,5 @@
 import json
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta
 
 from django.contrib import messages
 from django.contrib.auth import login
@@ -8,32 +8,51 @@ from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.core.management import call_command
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.db import connection
-from django.db.models import Count, Q
+from django.db import connection, transaction
+from django.db.models import Count, Max, OuterRef, Q, Subquery
 from django.db.models.functions import TruncDate
 from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.views.decorators.http import require_POST
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 from django_q.tasks import async_task
 
 from .diagnostics import build_clipping_diagnostic
 from .learning import record_manual_feedback
+from .revalidation import enqueue_revalidation
+from .simulation import SIMULATED_FIELDS, simulate_client_terms
+from .stats import (
+    STATS_BUCKETS,
+    client_article_counts,
+    rebuild_client_article_stats,
+    rollup_chart_series,
+    rollup_coverage,
+    tracking_article_stats,
+)
 from .forms import ClientForm, ReportForm
-from .models import Article, Client, DiscoveryRun, GeneratedReport, NewsFetchJob, Source, TranscriptExtraction
+from .models import (
+    Article,
+    Client,
+    ClientArticleStats,
+    DiscoveryRun,
+    GeneratedReport,
+    NewsFetchJob,
+    Source,
+    TranscriptExtraction,
+)
+from .pagination import keyset_order_by, paginate_keyset
 from .transcripts import export_files, extract_video_id, zip_files
 from .utils import (
+    TRIAGE_ORDERING,
     append_unique_terms,
+    attach_republication_counts,
     deduplicate_articles_for_display,
-    is_trusted_source,
+    display_articles_queryset,
     normalize_match_text,
-    revalidate_accepted_articles_for_client,
-    revalidate_pending_articles_for_client,
     split_terms,
-    strong_client_identity_terms,
 )
 
 
@@ -112,71 +131,6 @@ def youtube_transcript_download(request, job_id, file_type):
     response["Content-Disposition"] = f'attachment; filename="{expected}"'
     return response
 
-TRIAGE_PRIORITY_SOURCES = (
-    "G1",
-    "Diário da Região",
-    "Gazeta de Rio Preto",
-    "Região Noroeste",
-    "Band Paulista",
-    "Record Rio Preto",
-    "Prefeitura de Rio Preto",
-)
-TRIAGE_GROUP_STOP_WORDS = {
-    "a", "as", "com", "da", "das", "de", "do", "dos", "e", "em", "na", "nas",
-    "no", "nos", "o", "os", "para", "por", "que", "um", "uma",
-}
-
-
-def _review_score_band(score):
-    score = int(score or 0)
-    if 60 <= score <= 69:
-        return 0
-    if score >= 70:
-        return 1
-    if 50 <= score <= 59:
-        return 2
-    return 3
-
-
-def sort_review_articles_by_priority(articles, client):
-    identity_terms = [
-        normalize_match_text(term)
-        for term in strong_client_identity_terms(client)
-        if normalize_match_text(term)
-    ]
-    source_ranks = {
-        normalize_match_text(source): rank
-        for rank, source in enumerate(TRIAGE_PRIORITY_SOURCES)
-    }
-
-    def priority_key(article):
-        score = int(article.relevance_score or 0)
-        visible_text = normalize_match_text(f"{article.title} {article.url} {article.source}")
-        identity_visible = any(term in visible_text for term in identity_terms)
-        trusted = is_trusted_source(client, article.url, article.source)
-        source_rank = source_ranks.get(normalize_match_text(article.source), len(source_ranks) + 1)
-        title_words = [
-            word
-            for word in normalize_match_text(article.title).split()
-            if word not in TRIAGE_GROUP_STOP_WORDS
-        ]
-        story_group = " ".join(title_words[:4])
-        published = article.published_at or article.created_at
-        published_timestamp = published.timestamp() if published else 0
-        return (
-            _review_score_band(score),
-            0 if trusted else 1,
-            source_rank,
-            0 if identity_visible else 1,
-            -score,
-            story_group,
-            -published_timestamp,
-            -article.pk,
-        )
-
-    return sorted(articles, key=priority_key)
-
-
 def suggested_role_variations_for_client(client):
     if not client:
         return ""
@@ -220,30 +174,8 @@ def apply_article_search(queryset, search_text):
     )
 
 
-def automatic_rejection_filter():
-    return Q(validation_status="REJECTED") & ~(
-        Q(validation_reason__icontains="usuario")
-        | Q(manual_feedback__isnull=False)
-    )
-
-
-def manual_rejection_filter():
-    return Q(validation_status="REJECTED") & (
-        Q(validation_reason__icontains="usuario")
-        | Q(manual_feedback__isnull=False)
-    )
-
-
 def article_status_counts(client):
-    base = Article.objects.filter(client=client, excluded=False)
-    counts = {
-        "accepted": base.filter(validation_status="ACCEPTED").count(),
-        "review": base.filter(validation_status="REVIEW").count(),
-        "rejected": base.filter(manual_rejection_filter()).count(),
-        "discarded": base.filter(automatic_rejection_filter()).count(),
-    }
-    counts["pending"] = base.exclude(validation_status="ACCEPTED").count()
-    return counts
+    return client_article_counts(client)
 
 
 class SignUpView(CreateView):
@@ -289,12 +221,10 @@ class ClientUpdateView(LoginRequiredMixin, UpdateView):
         if hasattr(self.object, "users") and callable(getattr(self.object.users, "add", None)):
             self.object.users.add(self.request.user)
         if self.request.POST.get("save_and_reprocess") == "1":
-            stats = revalidate_pending_articles_for_client(self.object, statuses=["REVIEW", "REJECTED"])
+            enqueue_revalidation(self.object)
             messages.success(
                 self.request,
-                "Cliente salvo e pendentes reprocessadas: "
-                f"{stats['processed']} processadas, {stats['promoted']} promovidas para validadas, "
-                f"{stats['changed']} alteradas.",
+                "Cliente salvo. As noticias serao revalidadas em segundo plano.",
             )
         else:
             messages.success(self.request, "Cliente salvo com sucesso.")
@@ -342,7 +272,6 @@ def noticias_cliente_json(request, pk):
     if not request.user.is_authenticated or not user_can_access_client(request.user, client):
         return HttpResponseForbidden()
 
-    revalidate_accepted_articles_for_client(client, limit=100)
     artigos = deduplicate_articles_for_display(
         Article.objects.filter(client=client, excluded=False, validation_status="ACCEPTED").order_by("-published_at", "-id")
     )
@@ -360,26 +289,157 @@ def noticias_cliente_json(request, pk):
     return JsonResponse({"noticias": dados})
 
 
+API_ARTICLE_FIELDS = (
+    "id",
+    "title",
+    "url",
+    "source",
+    "provider",
+    "published_at",
+    "created_at",
+    "updated_at",
+    "validation_status",
+    "relevance_score",
+    "validation_reason",
+    "summary",
+    "topic",
+)
+API_DEFAULT_FIELDS = ("id", "title", "url", "source", "published_at", "validation_status")
+API_STATUS_FILTERS = {
+    "accepted": ("ACCEPTED",),
+    "review": ("REVIEW",),
+    "rejected": ("REJECTED",),
+    "pending": ("REVIEW", "REJECTED"),
+    "all": ("ACCEPTED", "REVIEW", "REJECTED"),
+}
+API_ORDERING = ("-published_at", "-id")
+API_DEFAULT_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 200
+
+
+def api_error(message, status=400):
+    return JsonResponse({"error": message}, status=status)
+
+
+def client_articles_etag(client):
+    """
+    ETag fraca das notícias do cliente: maior ``updated_at`` (índice
+    article_client_updated_idx) mais os contadores de ClientArticleStats,
+    que mudam quando uma notícia é apagada.
+    """
+    latest = Article.objects.filter(client=client).aggregate(latest=Max("updated_at"))["latest"]
+    counts = client_article_counts(client)
+    stamp = f"{latest.timestamp():.6f}" if latest else "0"
+    totals = ".".join(str(counts[bucket]) for bucket in STATS_BUCKETS)
+    return f'W/"v1-{client.pk}-{stamp}-{totals}"'
+
+
+def _api_day_start(value):
+    return timezone.make_aware(datetime.combine(date.fromisoformat(value), time.min))
+
+
+def _api_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def client_articles_api(request, client_id):
+    """
+    API v1 das notícias do cliente, paginada por cursor (``after``/``before``).
+
+    Parâmetros: ``fields`` (lista separada por vírgulas), ``status``
+    (accepted, review, rejected, pending ou all), ``source``, ``since`` e
+    ``until`` (datas AAAA-MM-DD da publicação) e ``limit``. Responde 304 quando
+    o ``If-None-Match`` coincide com a ETag atual do cliente.
+    """
+    client = get_object_or_404(Client, pk=client_id)
+    if not request.user.is_authenticated or not user_can_access_client(request.user, client):
+        return api_error("Sem permissao para as noticias deste cliente.", status=403)
+
+    requested_fields = [field.strip() for field in request.GET.get("fields", "").split(",") if field.strip()]
+    fields = list(dict.fromkeys(requested_fields)) or list(API_DEFAULT_FIELDS)
+    unknown = [field for field in fields if field not in API_ARTICLE_FIELDS]
+    if unknown:
+        return api_error(f"Campos desconhecidos: {', '.join(unknown)}.")
+    status_filter = request.GET.get("status", "accepted")
+    if status_filter not in API_STATUS_FILTERS:
+        return api_error(f"Status invalido: {status_filter}.")
+    try:
+        page_size = int(request.GET.get("limit", API_DEFAULT_PAGE_SIZE))
+        since = _api_day_start(request.GET["since"]) if request.GET.get("since") else None
+        until = _api_day_start(request.GET["until"]) + timedelta(days=1) if request.GET.get("until") else None
+    except ValueError:
+        return api_error("Parametros limit, since ou until invalidos.")
+    page_size = max(1, min(page_size, API_MAX_PAGE_SIZE))
+
+    etag = client_articles_etag(client)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified["ETag"] = etag
+        return not_modified
+
+    articles_qs = Article.objects.filter(
+        client=client,
+        excluded=False,
+        validation_status__in=API_STATUS_FILTERS[status_filter],
+    )
+    if request.GET.get("source"):
+        articles_qs = articles_qs.filter(source__iexact=request.GET["source"])
+    if since:
+        articles_qs = articles_qs.filter(published_at__gte=since)
+    if until:
+        articles_qs = articles_qs.filter(published_at__lt=until)
+
+    display_qs = display_articles_queryset(articles_qs).only(
+        *{*fields, "published_at"}
+    )
+    page = paginate_keyset(
+        display_qs,
+        API_ORDERING,
+        page_size,
+        after=request.GET.get("after", ""),
+        before=request.GET.get("before", ""),
+    )
+    response = JsonResponse(
+        {
+            "client": client.pk,
+            "fields": fields,
+            "results": [{field: _api_value(getattr(article, field)) for field in fields} for article in page],
+            "has_next": page.has_next,
+            "has_previous": page.has_previous,
+            "next_cursor": page.next_cursor,
+            "previous_cursor": page.previous_cursor,
+        }
+    )
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 @login_required
 def dashboard(request):
-    clients = list(clients_for_user(request.user).order_by("name"))
+    latest_runs = DiscoveryRun.objects.filter(client=OuterRef("pk")).order_by("-started_at").values("pk")[:1]
+    clients = list(clients_for_user(request.user).annotate(latest_run_id=Subquery(latest_runs)).order_by("name"))
     since = timezone.now() - timedelta(days=30)
     total_articles = 0
     total_sources = set()
     active_providers = set()
 
+    article_stats = {stats.client_id: stats for stats in ClientArticleStats.objects.filter(client__in=clients)}
+    coverage_by_client = rollup_coverage([client.pk for client in clients], timezone.localtime(since).date())
+    runs = DiscoveryRun.objects.in_bulk([client.latest_run_id for client in clients if client.latest_run_id])
+
     for client in clients:
-        articles = Article.objects.filter(client=client, excluded=False, validation_status="ACCEPTED")
-        metrics = articles.aggregate(
-            total=Count("id"),
-            recent=Count("id", filter=Q(published_at__gte=since) | Q(created_at__gte=since)),
-            sources=Count("source", distinct=True),
-            providers=Count("provider", distinct=True),
-            accepted=Count("id", filter=Q(validation_status="ACCEPTED")),
-            review=Count("id", filter=Q(validation_status="REVIEW")),
-        )
-        providers = sorted(set(articles.exclude(provider="").values_list("provider", flat=True)))
-        latest_run = DiscoveryRun.objects.filter(client=client).order_by("-started_at").first()
+        stats = article_stats.get(client.pk) or rebuild_client_article_stats(client.pk)
+        coverage = coverage_by_client[client.pk]
+        metrics = {
+            "recent": coverage["recent"],
+            "sources": len(coverage["sources"]),
+            "providers": len(coverage["providers"]),
+            "total": stats.accepted,
+            "accepted": stats.accepted,
+            "review": stats.review,
+        }
+        providers = sorted(provider for provider in coverage["providers"] if provider)
         accepted_rate = round((metrics["accepted"] / metrics["total"] * 100), 0) if metrics["total"] else 0
         coverage_score = min(
             100,
@@ -393,10 +453,10 @@ def dashboard(request):
             "accepted_rate": int(accepted_rate),
             "score": int(coverage_score),
             "providers_list": providers,
-            "latest_run": latest_run,
+            "latest_run": runs.get(client.latest_run_id),
         }
         total_articles += metrics["total"]
-        total_sources.update(articles.exclude(source="").values_list("source", flat=True))
+        total_sources.update(source for source in coverage["sources"] if source)
         active_providers.update(providers)
 
     return render(
@@ -538,12 +598,10 @@ def clipping_diagnostic(request):
                 if added_terms:
                     client_obj.name_variations = updated_value
                     client_obj.save(update_fields=["name_variations"])
-                stats = revalidate_pending_articles_for_client(client_obj, statuses=["REVIEW", "REJECTED"])
+                enqueue_revalidation(client_obj)
                 messages.success(
                     request,
-                    "Revalidacao concluida: "
-                    f"{stats['processed']} processadas, {stats['promoted']} promovidas para validadas, "
-                    f"{stats['changed']} alteradas. "
+                    "Revalidacao enviada para segundo plano. "
                     f"Variacoes adicionadas: {', '.join(added_terms) if added_terms else 'nenhuma'}.",
                 )
             redirect_url = reverse("clipping_diagnostic")
@@ -568,6 +626,16 @@ def clipping_diagnostic(request):
     else:
         client_obj, output = build_clipping_diagnostic(client_query, start, end, client_id=client_id)
 
+    simulation = None
+    simulation_terms = {
+        field: getattr(client_obj, field, "") or "" for field in SIMULATED_FIELDS
+    }
+    if client_obj is not None and request.GET.get("simulate"):
+        simulation_terms = {
+            field: request.GET.get(f"simulate_{field}", "") for field in SIMULATED_FIELDS
+        }
+        simulation = simulate_client_terms(client_obj, **simulation_terms)
+
     return render(
         request,
         "newsclip/diagnostic.html",
@@ -579,6 +647,12 @@ def clipping_diagnostic(request):
             "end": end.isoformat(),
             "output": output,
             "suggested_public_role_variations": suggested_role_variations_for_client(client_obj),
+            "simulation": simulation,
+            "simulation_samples": [
+                ("Promovidas para ACCEPTED", simulation["promoted"]),
+                ("Rebaixadas de ACCEPTED", simulation["demoted"]),
+            ] if simulation else [],
+            "simulation_terms": simulation_terms,
             "return_query": request.GET.urlencode(),
         },
     )
@@ -591,7 +665,6 @@ def client_news(request, client_id):
         return HttpResponseForbidden("Voce nao tem permissao para ver as noticias deste cliente.")
 
     page_size = int(request.GET.get("page_size", 20))
-    page_number = request.GET.get("page")
     requested_sort = request.GET.get("sort")
     source_filter = request.GET.get("source", "")
     current_search_query = request.GET.get("q", "")
@@ -604,7 +677,6 @@ def client_news(request, client_id):
     default_sort_order = "priority" if status_filter == "pending" else "date-desc"
     sort_order = requested_sort if requested_sort in allowed_sort_orders else default_sort_order
 
-    revalidate_accepted_articles_for_client(client, limit=150)
     base_articles_qs = Article.objects.filter(client=client, excluded=False)
     status_counts = article_status_counts(client)
     if status_filter == "pending":
@@ -617,14 +689,16 @@ def client_news(request, client_id):
     if current_search_query:
         articles_qs = apply_article_search(articles_qs, current_search_query)
 
-    if sort_order == "date-asc":
-        articles_qs = articles_qs.order_by("published_at")
+    if sort_order == "priority":
+        ordering = TRIAGE_ORDERING
+    elif sort_order == "date-asc":
+        ordering = ("published_at", "id")
     elif sort_order == "source":
-        articles_qs = articles_qs.order_by("source", "-published_at")
+        ordering = ("source", "-published_at", "-id")
     elif current_search_query and connection.vendor == "postgresql":
-        articles_qs = articles_qs.order_by("-search_rank", "-published_at")
+        ordering = ("-search_rank", "-published_at", "-id")
     else:
-        articles_qs = articles_qs.order_by("-published_at")
+        ordering = ("-published_at", "-id")
 
     if request.method == "POST":
         acao = request.POST.get("acao")
@@ -636,18 +710,21 @@ def client_news(request, client_id):
             selected_articles = list(
                 Article.objects.filter(client=client, id__in=ids_selecionados).select_related("client")
             )
-            updated_count = Article.objects.filter(client=client, id__in=ids_selecionados).update(excluded=True)
+            with transaction.atomic(), tracking_article_stats(article.pk for article in selected_articles):
+                updated_count = Article.objects.filter(client=client, id__in=ids_selecionados).update(excluded=True, updated_at=timezone.now())
             record_manual_feedback(selected_articles, "REJECTED", request.user)
             messages.success(request, f"{updated_count} noticia(s) marcada(s) como excluida(s).")
         elif acao == "manter":
             selected_articles = list(
                 Article.objects.filter(client=client, id__in=ids_selecionados).select_related("client")
             )
-            updated_count = Article.objects.filter(client=client, id__in=ids_selecionados).update(
-                excluded=False,
-                validation_status="ACCEPTED",
-                validation_reason="Aprovada manualmente pelo usuario",
-            )
+            with transaction.atomic(), tracking_article_stats(article.pk for article in selected_articles):
+                updated_count = Article.objects.filter(client=client, id__in=ids_selecionados).update(
+                    excluded=False,
+                    validation_status="ACCEPTED",
+                    validation_reason="Aprovada manualmente pelo usuario",
+                    updated_at=timezone.now(),
+                )
             record_manual_feedback(selected_articles, "ACCEPTED", request.user)
             messages.success(request, f"{updated_count} noticia(s) marcada(s) como mantida(s).")
         else:
@@ -657,37 +734,41 @@ def client_news(request, client_id):
         query_params = request.GET.urlencode()
         return redirect(f"{redirect_url}?{query_params}" if query_params else redirect_url)
 
-    display_articles = deduplicate_articles_for_display(articles_qs)
-    if status_filter == "pending" and sort_order == "priority":
-        display_articles = sort_review_articles_by_priority(display_articles, client)
-    paginator = Paginator(display_articles, page_size)
-    try:
-        page_obj = paginator.page(page_number)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
-
-    display_article_ids = [article.pk for article in display_articles]
-    qs_for_charts = Article.objects.filter(pk__in=display_article_ids).exclude(published_at__isnull=True)
-    daily_qs = (
-        qs_for_charts.annotate(day=TruncDate("published_at"))
-        .values("day")
-        .annotate(count=Count("id"))
-        .order_by("day")
-    )
-    top_sources_qs = qs_for_charts.values("source").annotate(count=Count("id")).order_by("-count")[:5]
+    display_qs = display_articles_queryset(articles_qs)
+    after_cursor = request.GET.get("after", "")
+    before_cursor = request.GET.get("before", "")
+    page_obj = paginate_keyset(display_qs, ordering, page_size, after=after_cursor, before=before_cursor)
+    attach_republication_counts(page_obj, articles_qs)
+
+    if current_search_query:
+        qs_for_charts = Article.objects.filter(pk__in=display_qs.values("pk")).exclude(published_at__isnull=True)
+        daily_series = [
+            (row["day"], row["count"])
+            for row in qs_for_charts.annotate(day=TruncDate("published_at"))
+            .values("day")
+            .annotate(count=Count("id"))
+            .order_by("day")
+            if row["day"]
+        ]
+        top_sources = [
+            (row["source"], row["count"])
+            for row in qs_for_charts.values("source").annotate(count=Count("id")).order_by("-count")[:5]
+            if row["source"]
+        ]
+    else:
+        daily_series, top_sources = rollup_chart_series(client, status_filter == "accepted", source_filter)
     distinct_sources = articles_qs.order_by("source").values_list("source", flat=True).distinct()
 
     context = {
         "client": client,
+        "revalidation_job": client.revalidation_jobs.filter(status__in=["queued", "running"]).first(),
         "articles": page_obj,
         "status_filter": status_filter,
         "status_counts": status_counts,
-        "daily_labels_json": json.dumps([d["day"].strftime("%d/%m") for d in daily_qs if d["day"]]),
-        "daily_counts_json": json.dumps([d["count"] for d in daily_qs if d["day"]]),
-        "source_labels_json": json.dumps([s["source"] for s in top_sources_qs if s["source"]]),
-        "source_counts_json": json.dumps([s["count"] for s in top_sources_qs if s["source"]]),
+        "daily_labels_json": json.dumps([day.strftime("%d/%m") for day, _count in daily_series]),
+        "daily_counts_json": json.dumps([count for _day, count in daily_series]),
+        "source_labels_json": json.dumps([source for source, _count in top_sources]),
+        "source_counts_json": json.dumps([count for _source, count in top_sources]),
         "page_size": page_size,
         "sort": sort_order,
         "sort_order": sort_order,
@@ -721,47 +802,52 @@ def bulk_update_news(request, client_id):
     articles_qs = Article.objects.filter(client=client, id__in=ids)
     feedback_articles = list(articles_qs.select_related("client"))
     updated_ids = list(articles_qs.values_list("id", flat=True))
-    if action == "exclude":
-        updated_count = articles_qs.update(excluded=True)
-        verb = "excluida(s)"
-        destination = "excluidas"
-        target_status = None
-    elif action == "validate":
-        updated_count = articles_qs.update(
-            excluded=False,
-            validation_status="ACCEPTED",
-            validation_reason="Validada manualmente pelo usuario",
-        )
-        verb = "validada(s)"
-        destination = "Validadas"
-        target_status = "accepted"
-    elif action == "reject":
-        updated_count = articles_qs.update(
-            excluded=False,
-            validation_status="REJECTED",
-            validation_reason="Invalidada manualmente pelo usuario",
-        )
-        verb = "movida(s) para validacao"
-        destination = "Para validacao"
-        target_status = "rejected"
-    elif action == "review":
-        updated_count = articles_qs.update(
-            excluded=False,
-            validation_status="REVIEW",
-            validation_reason="Movida manualmente para revisao pelo usuario",
-        )
-        verb = "movida(s) para validacao"
-        destination = "Para validacao"
-        target_status = "review"
-    else:
-        updated_count = articles_qs.update(
-            excluded=False,
-            validation_status="ACCEPTED",
-            validation_reason="Marcada como mantida pelo usuario",
-        )
-        verb = "mantida(s) em Validadas"
-        destination = "Validadas"
-        target_status = "accepted"
+    with transaction.atomic(), tracking_article_stats(updated_ids):
+        if action == "exclude":
+            updated_count = articles_qs.update(excluded=True, updated_at=timezone.now())
+            verb = "excluida(s)"
+            destination = "excluidas"
+            target_status = None
+        elif action == "validate":
+            updated_count = articles_qs.update(
+                excluded=False,
+                validation_status="ACCEPTED",
+                validation_reason="Validada manualmente pelo usuario",
+                updated_at=timezone.now(),
+            )
+            verb = "validada(s)"
+            destination = "Validadas"
+            target_status = "accepted"
+        elif action == "reject":
+            updated_count = articles_qs.update(
+                excluded=False,
+                validation_status="REJECTED",
+                validation_reason="Invalidada manualmente pelo usuario",
+                updated_at=timezone.now(),
+            )
+            verb = "movida(s) para validacao"
+            destination = "Para validacao"
+            target_status = "rejected"
+        elif action == "review":
+            updated_count = articles_qs.update(
+                excluded=False,
+                validation_status="REVIEW",
+                validation_reason="Movida manualmente para revisao pelo usuario",
+                updated_at=timezone.now(),
+            )
+            verb = "movida(s) para validacao"
+            destination = "Para validacao"
+            target_status = "review"
+        else:
+            updated_count = articles_qs.update(
+                excluded=False,
+                validation_status="ACCEPTED",
+                validation_reason="Marcada como mantida pelo usuario",
+                updated_at=timezone.now(),
+            )
+            verb = "mantida(s) em Validadas"
+            destination = "Validadas"
+            target_status = "accepted"
 
     feedback_decision = {
         "exclude": "REJECTED",
@@ -2,6 +2,7 @@
 set -e
 
 python manage.py migrate --noinput
+python manage.py createcachetable
 python manage.py sync_municipal_catalog
 
 python manage.py qcluster &